@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""CC2Translate 일괄 번역 - Qt 없이 표준 입력/파일/디렉터리를 줄 단위로 번역
+
+    python3 batch.py --target Korean < messages.txt
+    python3 batch.py --target Japanese --model deepl-free strings.jsonl --field text -o strings.ja.jsonl
+    python3 batch.py --target Korean --output-dir out/ catalogs/ --resume
+
+텍스트 파일은 한 줄이 번역 단위이며(빈 줄은 그대로 출력), JSONL은 각 줄 객체의 --field 값을 번역해
+--target-field(기본: 같은 필드)에 넣는다. 입력은 읽는 대로 최대 --jobs개씩 동시에 번역하고 입력 순서대로
+출력한다. 출력 파일은 줄마다 바로 기록하므로 중단된 작업은 --resume으로 이어서 할 수 있고,
+번역 결과는 앱과 같은 캐시를 사용한다.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import fnmatch
+import json
+import os
+import sys
+import time
+
+import translator
+from constants import (
+    LANGUAGE_NAMES, ALL_MODELS, GEMINI_API_MODELS, DEEPL_API_MODELS, RACE_MODELS, CHUNK_WORKERS,
+    BATCH_PATTERNS, BATCH_LOOKAHEAD,
+)
+
+
+
+class BatchError(Exception):
+    pass
+
+
+class Stats:
+    def __init__(self):
+        self.lines = 0
+        self.translated = 0
+        self.cached = 0
+        self.failed = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        return (f"{self.lines}줄 처리 (번역 {self.translated}, 캐시 {self.cached}, 실패 {self.failed}, "
+                f"이어하기로 건너뜀 {self.skipped}) - {elapsed:.1f}초")
+
+
+# ── 입력 ──
+
+def iter_inputs(paths, patterns):
+    """입력 경로를 (표시 이름, 절대 경로, 상대 경로) 목록으로. "-"는 표준 입력, 디렉터리는 재귀 탐색."""
+    for path in paths:
+        if path == "-":
+            yield "<stdin>", None, None
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                        full = os.path.join(root, name)
+                        yield full, full, os.path.relpath(full, path)
+        elif os.path.isfile(path):
+            yield path, path, os.path.basename(path)
+        else:
+            raise BatchError(f"입력을 찾을 수 없습니다: {path}")
+
+
+def detect_format(path, requested):
+    if requested:
+        return requested
+    return "jsonl" if path and path.endswith(".jsonl") else "text"
+
+
+def parse_record(line, fmt, field):
+    """입력 한 줄 → (번역할 텍스트 또는 None, JSON 객체). 번역할 것이 없으면 텍스트 None."""
+    if fmt == "text":
+        return (line if line.strip() else None), None
+    if not line.strip():
+        return None, None
+    obj = json.loads(line)
+    if isinstance(obj, str):
+        return (obj if obj.strip() else None), obj
+    value = obj.get(field) if isinstance(obj, dict) else None
+    return (value if isinstance(value, str) and value.strip() else None), obj
+
+
+def render_record(line, obj, translation, fmt, field, target_field):
+    """출력 한 줄 (줄바꿈 제외). 텍스트 형식은 입력과 줄 수를 맞추기 위해 번역 안의 줄바꿈을 공백으로."""
+    if translation is None:
+        return line
+    if fmt == "text":
+        return " ".join(translation.splitlines())
+    if isinstance(obj, str):
+        return json.dumps(translation, ensure_ascii=False)
+    return json.dumps({**obj, target_field: translation}, ensure_ascii=False)
+
+
+# ── 번역 파이프라인 ──
+
+def ordered_map(func, items, jobs, lookahead):
+    """items를 최대 jobs개씩 동시에 처리하면서 입력 순서대로 결과를 내보내는 제너레이터.
+
+    앞선 항목이 늦게 끝나도 메모리에 쌓이는 결과는 jobs * lookahead개를 넘지 않는다.
+    중간에 멈추면 시작하지 않은 항목은 버리고 진행 중인 항목은 기다리지 않는다 (호출자가 취소).
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=jobs)
+    pending = collections.deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= jobs * lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def translate_stream(lines, fmt, args, cancel, stats):
+    """입력 줄 → 출력 줄 제너레이터"""
+    field, target_field = args.field, args.target_field or args.field
+
+    def _translate(line):
+        try:
+            text, obj = parse_record(line, fmt, field)
+            if text is None:
+                return line, None, None, False
+            translation, cached = translator.translate_cached(
+                text, args.source, args.target, args.model, cancel=cancel
+            )
+        except translator.TranslationCancelled:
+            raise
+        except (translator.TranslationError, ValueError) as e:
+            if not args.keep_going:
+                raise BatchError(f"번역 실패: {e}") from None
+            return line, None, None, str(e)
+        return line, obj, translation, cached
+
+    progress_at = time.monotonic()
+    for line, obj, translation, status in ordered_map(_translate, lines, args.jobs, BATCH_LOOKAHEAD):
+        stats.lines += 1
+        if isinstance(status, str):
+            stats.failed += 1
+            print(f"번역 실패 ({stats.lines}번째 줄): {status}", file=sys.stderr)
+        elif translation is not None:
+            if status:
+                stats.cached += 1
+            else:
+                stats.translated += 1
+        if sys.stderr.isatty() and time.monotonic() - progress_at >= 1:
+            progress_at = time.monotonic()
+            print(f"\r{stats.lines}줄 처리 중...", end="", file=sys.stderr)
+        yield render_record(line, obj, translation, fmt, field, target_field)
+
+
+def read_lines(stream):
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def resume_point(path):
+    """이미 기록된 완전한 줄 수. 중간에 끊긴 마지막 줄은 잘라낸다."""
+    if not os.path.exists(path):
+        return 0
+    count = complete = offset = 0
+    with open(path, "rb+") as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            count += block.count(b"\n")
+            end = block.rfind(b"\n")
+            if end >= 0:
+                complete = offset + end + 1
+            offset += len(block)
+        if complete < offset:
+            f.truncate(complete)
+    return count
+
+
+def run_one(name, src_path, out_path, args, cancel, stats):
+    """입력 하나를 번역해 out_path(None이면 표준 출력)에 기록"""
+    skip = resume_point(out_path) if out_path and args.resume else 0
+    if out_path:
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+        out = open(out_path, "a" if skip else "w", encoding="utf-8")
+    else:
+        out = sys.stdout
+    source = open(src_path, encoding="utf-8") if src_path else sys.stdin
+    try:
+        lines = read_lines(source)
+        for _ in range(skip):
+            if next(lines, None) is None:
+                break
+            stats.skipped += 1
+        if skip:
+            print(f"{name}: {skip}줄 이후부터 이어서 번역", file=sys.stderr)
+        fmt = detect_format(src_path, args.format)
+        for output in translate_stream(lines, fmt, args, cancel, stats):
+            out.write(output + "\n")
+            out.flush()
+    finally:
+        if src_path:
+            source.close()
+        if out_path:
+            out.close()
+
+
+def default_model():
+    """설정된 첫 번째 모델 - 일괄 번역에는 API 모델을 CLI 모델보다 먼저 고른다"""
+    candidates = [*GEMINI_API_MODELS.values(), *DEEPL_API_MODELS.values(), *ALL_MODELS.values()]
+    for model in candidates:
+        if model not in RACE_MODELS.values() and translator.is_configured(model):
+            return model
+    raise BatchError("사용할 수 있는 모델이 없습니다. API 키를 설정하거나 CLI를 설치하세요.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="*", default=["-"], help="파일/디렉터리 (기본: 표준 입력)")
+    parser.add_argument("-t", "--target", required=True, help="대상 언어 (Korean, 한국어 등)")
+    parser.add_argument("-s", "--source", default="auto", help="원본 언어 (기본: 자동 감지)")
+    parser.add_argument("-m", "--model", help="모델 (haiku, gemini-2.5-flash, deepl-free 등)")
+    parser.add_argument("-o", "--output", help="출력 파일 (입력이 하나일 때)")
+    parser.add_argument("--output-dir", help="출력 디렉터리 (입력 구조를 유지)")
+    parser.add_argument("--format", choices=["text", "jsonl"], help="입력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--field", default="text", help="JSONL에서 번역할 필드")
+    parser.add_argument("--target-field", help="JSONL에서 번역을 넣을 필드 (기본: --field)")
+    parser.add_argument("--pattern", action="append", help=f"디렉터리에서 읽을 파일 패턴 (기본: {BATCH_PATTERNS})")
+    parser.add_argument("-j", "--jobs", type=int, default=CHUNK_WORKERS, help="동시 번역 요청 수")
+    parser.add_argument("--resume", action="store_true", help="출력 파일에 이미 기록된 줄은 건너뛰고 이어서 번역")
+    parser.add_argument("--keep-going", action="store_true", help="번역에 실패한 줄은 원문을 그대로 출력하고 계속")
+    args = parser.parse_args(argv)
+
+    try:
+        for option in ("source", "target"):
+            value = getattr(args, option)
+            if value not in LANGUAGE_NAMES or (option == "target" and value in ("auto", "자동 감지")):
+                raise BatchError(f"지원하지 않는 언어입니다: {value}")
+            setattr(args, option, LANGUAGE_NAMES[value])
+        args.model = ALL_MODELS.get(args.model, args.model) or default_model()
+        if args.model not in ALL_MODELS.values():
+            raise BatchError(f"알 수 없는 모델입니다: {args.model}")
+        if args.jobs < 1:
+            raise BatchError("--jobs는 1 이상이어야 합니다")
+
+        inputs = list(iter_inputs(args.inputs, args.pattern or BATCH_PATTERNS))
+        if args.output and len(inputs) != 1:
+            raise BatchError("--output은 입력이 하나일 때만 사용할 수 있습니다 (--output-dir 사용)")
+        if args.output_dir is None and args.output is None and len(inputs) > 1:
+            raise BatchError("입력이 여러 개면 --output-dir이 필요합니다")
+        if args.resume and not (args.output or args.output_dir):
+            raise BatchError("--resume은 출력 파일이 있어야 합니다")
+    except BatchError as e:
+        parser.error(str(e))
+
+    stats = Stats()
+    cancel = translator.CancelToken()
+    exit_code = 0
+    try:
+        for name, src_path, relpath in inputs:
+            if args.output_dir:
+                out_path = os.path.join(args.output_dir, relpath or "stdin.txt")
+            else:
+                out_path = args.output
+            run_one(name, src_path, out_path, args, cancel, stats)
+    except KeyboardInterrupt:
+        cancel.cancel()
+        print("\n중단됨 - 같은 명령에 --resume을 붙이면 이어서 번역합니다", file=sys.stderr)
+        exit_code = 130
+    except (translator.TranslationError, BatchError, OSError) as e:
+        cancel.cancel()
+        print(f"오류: {e}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        translator.shutdown_cli_workers()
+    print("\r" + stats.summary(), file=sys.stderr)
+    if exit_code == 0 and stats.failed:
+        exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""언어 감지 마이크로 벤치마크 - 기존 any() 휴리스틱과 detector.detect 비교
+
+    python3 bench/bench_detect.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import detector  # noqa: E402
+
+SAMPLES = {
+    "english": "The quick brown fox jumps over the lazy dog. ",
+    "korean": "안녕하세요, 오늘 날씨가 정말 좋네요. ",
+    "japanese": "今日はとても良い天気ですね。散歩に行きましょう。",
+    "chinese": "我们今天去公园散步，天气很好。",
+    "russian": "Сегодня очень хорошая погода. ",
+}
+SIZES = (1_000, 100_000, 1_000_000, 10_000_000)
+
+
+def legacy_detect(text):
+    """window.py의 이전 구현 (최대 3번 전체 스캔, 한/일/중 외에는 모두 영어)"""
+    if any('\uac00' <= c <= '\ud7a3' for c in text):
+        return "Korean"
+    elif any('\u3040' <= c <= '\u30ff' for c in text):
+        return "Japanese"
+    elif any('\u4e00' <= c <= '\u9fff' for c in text):
+        return "Simplified Chinese"
+    return "English"
+
+
+def measure(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'입력':10} {'크기':>10} {'legacy (ms)':>12} {'detect (ms)':>12}  결과")
+    for name, unit in SAMPLES.items():
+        for size in SIZES:
+            text = (unit * (size // len(unit) + 1))[:size]
+            legacy_time, legacy_result = measure(legacy_detect, text, args.repeat)
+            new_time, new_result = measure(detector.detect, text, args.repeat)
+            print(f"{name:10} {size:>10,} {legacy_time * 1000:>12.3f} {new_time * 1000:>12.3f}  "
+                  f"{legacy_result} → {new_result.language} ({new_result.confidence:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""번역 경로 종단 간 지연 시간 벤치마크 - 로컬 모의 백엔드 사용 (실제 API/CLI를 호출하지 않음)
+
+    python3 bench/bench_e2e.py [--paths translate stream window] [--models gemini-2.5-flash-lite ...]
+                               [--sizes 100 1000 5000] [--concurrency 1 4 16] [--requests 20]
+                               [--latency 0.3 --error-rate 0.05 ...] [--output run.json] [--compare base.json]
+
+bench/mock_backends.py 서버를 별도 프로세스로 띄우고, 가짜 claude/gemini CLI를 설치한 임시 HOME에서
+다음 경로를 텍스트 크기 × 동시 요청 수별로 구동한다.
+
+    translate  translator.translate() (캐시 미스, 응답 전체를 기다림)
+    stream     translate_cached(on_partial=...) - 스트리밍 지원 모델만, 첫 조각까지의 시간도 측정
+    window     TranslatorWindow.do_translate()부터 결과가 화면에 그려질 때까지 (offscreen Qt, 순차 실행)
+
+결과(p50/p95/p99 지연 시간, 처리량)는 JSON으로 출력하며 --compare로 이전 커밋의 결과와 비교할 수 있다.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from mock_backends import DEFAULTS, install_fake_clis  # noqa: E402
+
+# Gemini API / DeepL API / Claude CLI(예비 프로세스) / Gemini CLI(예비 프로세스)
+# gemini-2.0-flash는 API 모델 이름과 겹쳐 API로 호출되므로 Gemini CLI는 gemini-1.5-pro로 잰다
+DEFAULT_MODELS = ["gemini-2.5-flash-lite", "deepl-free", "haiku", "gemini-1.5-pro"]
+CLI_DEFAULTS = {"cli_startup": 0.3, "cli_latency": 0.5, "cli_jitter": 0.1}
+
+_SENTENCE = "The quick brown fox jumps over the lazy dog while the server streams another chunk. "
+
+
+def make_text(size, tag):
+    """size자 안팎의 영어 문단. 캐시에 걸리지 않도록 요청마다 tag를 붙인다."""
+    text = f"[{tag}] " + _SENTENCE * (size // len(_SENTENCE) + 1)
+    return text[:size].strip()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    k = (len(ordered) - 1) * pct / 100
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+def summarize(latencies, first_partials, errors, mismatches, wall, chars):
+    ms = lambda value: None if value is None else round(value * 1000, 1)
+    summary = {
+        "ok": len(latencies),
+        "errors": errors,
+        "mismatches": mismatches,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+        "max_ms": ms(max(latencies, default=None)),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else None,
+        "chars_per_s": round(chars / wall) if wall else None,
+    }
+    if first_partials:
+        summary["first_partial_p50_ms"] = ms(percentile(first_partials, 50))
+        summary["first_partial_p95_ms"] = ms(percentile(first_partials, 95))
+    return summary
+
+
+# ── 환경 격리 ──
+
+def start_environment(args):
+    """임시 HOME, 가짜 CLI, 모의 서버 준비. (home, server 프로세스) 반환.
+
+    translator/constants를 import하기 전에 호출해야 한다 (경로와 API 주소를 import 시점에 읽음).
+    """
+    home = tempfile.mkdtemp(prefix="cc2translate-bench-")
+    os.environ["HOME"] = home
+    # translator._get_env()가 ~/.local/bin을 PATH 맨 앞에 두므로 실제 CLI 대신 가짜 CLI가 실행된다
+    install_fake_clis(os.path.join(home, ".local", "bin"))
+    os.environ.update({
+        "GEMINI_API_KEY": "bench",
+        "DEEPL_API_KEY": "bench",
+        "MOCK_CLI_STARTUP": str(args.cli_startup),
+        "MOCK_CLI_LATENCY": str(args.cli_latency),
+        "MOCK_CLI_JITTER": str(args.cli_jitter),
+    })
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    cmd = [sys.executable, os.path.join(BENCH_DIR, "mock_backends.py")]
+    for name in DEFAULTS:
+        cmd += ["--" + name.replace("_", "-"), str(getattr(args, name))]
+    if args.seed is not None:
+        cmd += ["--seed", str(args.seed)]
+    server = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    url = server.stdout.readline().strip()
+    os.environ["CC2TRANSLATE_GEMINI_API_BASE"] = url
+    os.environ["CC2TRANSLATE_DEEPL_API_BASE"] = url
+
+    # 클라이언트 측 한도(무료 등급 기본값)가 측정을 막지 않도록 모두 0(무제한)으로
+    import updater
+    from constants import GEMINI_API_MODELS, DEEPL_API_MODELS
+    unlimited = {model: 0 for model in [*GEMINI_API_MODELS.values(), *DEEPL_API_MODELS.values()]}
+    for key in ("rate_limits", "daily_request_limits", "monthly_char_limits"):
+        updater.set_setting(key, unlimited)
+    return home, server
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR,
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+# ── 경로별 구동 ──
+
+def run_translate(model, size, concurrency, count, timeout, stream=False):
+    import translator
+
+    def _one(i):
+        text = make_text(size, f"{uuid.uuid4().hex[:8]}-{i}")
+        first = []
+        start = time.perf_counter()
+        if stream:
+            on_partial = lambda chunk: first or first.append(time.perf_counter() - start)
+            result, _cached = translator.translate_cached(text, "English", "Korean", model, on_partial)
+        else:
+            result = translator.translate(text, "English", "Korean", model)
+        return time.perf_counter() - start, (first[0] if first else None), result == text, len(text)
+
+    latencies, first_partials = [], []
+    errors = mismatches = chars = 0
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(_one, i) for i in range(count)]
+        for future in futures:
+            try:
+                elapsed, first, matched, length = future.result(timeout=timeout)
+            except Exception as e:  # 오류도 결과의 일부로 기록
+                errors += 1
+                print(f"  {model}: {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            latencies.append(elapsed)
+            chars += length
+            if first is not None:
+                first_partials.append(first)
+            if not matched:
+                mismatches += 1
+    return summarize(latencies, first_partials, errors, mismatches, time.perf_counter() - start, chars)
+
+
+class WindowDriver:
+    """TranslatorWindow를 띄워 두고 번역 요청 → 완료 시그널 처리까지의 시간을 잰다"""
+
+    def __init__(self):
+        from PyQt5.QtWidgets import QApplication
+        import updater
+        import window
+
+        # 전역 키보드 후킹과 GitHub 업데이트 확인은 측정 대상이 아니므로 끈다
+        window.TranslatorWindow._start_hotkey = lambda self: None
+        updater.check_for_update = lambda: (False, None, None)
+
+        self.app = QApplication.instance() or QApplication([])
+        self.window = window.TranslatorWindow()
+        self.names = {model: name for name, model in window.ALL_MODELS.items()}
+        self._outcome = None
+        self._loop = None
+        emitter = self.window.signal_emitter
+        # 창의 슬롯보다 나중에 연결되므로 결과가 화면에 반영된 뒤 호출된다
+        emitter.translation_done.connect(lambda _id, translation, _cached: self._finish(result=translation))
+        emitter.translation_error.connect(lambda _id, error: self._finish(error=error))
+        emitter.translation_partial.connect(self._on_partial)
+
+    def _on_partial(self, _id, _chunk):
+        if self._outcome is not None and "first" not in self._outcome:
+            self._outcome["first"] = time.perf_counter() - self._outcome["start"]
+
+    def _finish(self, **outcome):
+        if self._outcome is None or "elapsed" in self._outcome:
+            return
+        self._outcome.update(outcome, elapsed=time.perf_counter() - self._outcome["start"])
+        self._loop.quit()
+
+    def translate(self, text, timeout):
+        from PyQt5.QtCore import QEventLoop, QTimer
+        win = self.window
+        win._suppress_auto_translate = True
+        win.src_text.setPlainText(text)
+        win._suppress_auto_translate = False
+        self._loop = QEventLoop()
+        self._outcome = {"start": time.perf_counter()}
+        win.do_translate()
+        if "elapsed" not in self._outcome:
+            QTimer.singleShot(int(timeout * 1000), self._loop.quit)
+            self._loop.exec_()
+        outcome, self._outcome = self._outcome, None
+        return outcome
+
+    def run(self, model, size, count, timeout):
+        self.window.model_combo.setCurrentText(self.names[model])
+        latencies, first_partials = [], []
+        errors = mismatches = chars = 0
+        start = time.perf_counter()
+        for i in range(count):
+            text = make_text(size, f"{uuid.uuid4().hex[:8]}-{i}")
+            outcome = self.translate(text, timeout)
+            if "elapsed" not in outcome or "error" in outcome:
+                errors += 1
+                print(f"  {model}: {outcome.get('error', '시간 초과')}", file=sys.stderr)
+                continue
+            latencies.append(outcome["elapsed"])
+            chars += len(text)
+            if "first" in outcome:
+                first_partials.append(outcome["first"])
+            if outcome["result"] != text:
+                mismatches += 1
+        return summarize(latencies, first_partials, errors, mismatches, time.perf_counter() - start, chars)
+
+    def close(self):
+        self.window.hide()
+
+
+# ── 비교 ──
+
+def _key(result):
+    return (result["path"], result["model"], result["size"], result["concurrency"])
+
+
+def compare(baseline, current):
+    """같은 (경로, 모델, 크기, 동시 요청 수) 항목끼리 p50/p95 변화율 출력"""
+    base = {_key(r): r for r in baseline["results"]}
+    print(f"\n비교 기준: {baseline['meta'].get('commit')} → {current['meta'].get('commit')}", file=sys.stderr)
+    print(f"{'경로':10} {'모델':24} {'크기':>6} {'동시':>4} {'p50 (ms)':>20} {'p95 (ms)':>20}", file=sys.stderr)
+    for result in current["results"]:
+        old = base.get(_key(result))
+        if old is None:
+            continue
+        cells = []
+        for field in ("p50_ms", "p95_ms"):
+            before, after = old.get(field), result.get(field)
+            if before and after:
+                cells.append(f"{before:.0f}→{after:.0f} ({(after - before) / before * 100:+.0f}%)")
+            else:
+                cells.append("-")
+        print(f"{result['path']:10} {result['model']:24} {result['size']:>6} {result['concurrency']:>4} "
+              f"{cells[0]:>20} {cells[1]:>20}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", nargs="+", default=["translate", "stream", "window"],
+                        choices=["translate", "stream", "window"])
+    parser.add_argument("--models", nargs="+", default=DEFAULT_MODELS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 5000])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=20, help="항목당 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=1, help="모델별 측정 전 예열 요청 수")
+    parser.add_argument("--timeout", type=float, default=120, help="요청당 최대 대기 (초)")
+    parser.add_argument("--seed", type=int, default=None, help="모의 서버 지연/오류 난수 시드")
+    for name, value in {**DEFAULTS, **CLI_DEFAULTS}.items():
+        parser.add_argument("--" + name.replace("_", "-"), type=type(value), default=value)
+    parser.add_argument("--output", help="결과 JSON 파일 (없으면 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--keep-home", action="store_true", help="임시 HOME(캐시/기록 DB)을 지우지 않음")
+    args = parser.parse_args()
+
+    home, server = start_environment(args)
+    import translator
+
+    commit, dirty = git_revision()
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {name: getattr(args, name) for name in {**DEFAULTS, **CLI_DEFAULTS}},
+            "requests": args.requests,
+        },
+        "results": [],
+    }
+    window_driver = None
+    try:
+        print(f"{'경로':10} {'모델':24} {'크기':>6} {'동시':>4} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>7} {'오류':>4}",
+              file=sys.stderr)
+        for model in args.models:
+            for path in args.paths:
+                if path == "stream" and not translator.supports_streaming(model):
+                    continue
+                if path == "window" and window_driver is None:
+                    window_driver = WindowDriver()
+                # 연결 수립/CLI 프로세스 시작 비용은 측정에서 뺀다
+                for size in args.sizes[:1] if args.warmup else []:
+                    if path == "window":
+                        window_driver.run(model, size, args.warmup, args.timeout)
+                    else:
+                        run_translate(model, size, 1, args.warmup, args.timeout, stream=path == "stream")
+                for size in args.sizes:
+                    for concurrency in ([1] if path == "window" else args.concurrency):
+                        # 이전 항목의 실패로 열린 서킷 브레이커가 다음 항목에 영향을 주지 않도록 초기화
+                        translator._breakers.clear()
+                        if path == "window":
+                            summary = window_driver.run(model, size, args.requests, args.timeout)
+                        else:
+                            summary = run_translate(model, size, concurrency, args.requests, args.timeout,
+                                                    stream=path == "stream")
+                        result = {"path": path, "model": model, "size": size, "concurrency": concurrency,
+                                  **summary}
+                        report["results"].append(result)
+                        fmt = lambda value: "-" if value is None else f"{value:.0f}"
+                        print(f"{path:10} {model:24} {size:>6} {concurrency:>4} {fmt(result['p50_ms']):>8} "
+                              f"{fmt(result['p95_ms']):>8} {fmt(result['p99_ms']):>8} "
+                              f"{result['throughput_rps'] or 0:>7.1f} {result['errors'] + result['mismatches']:>4}",
+                              file=sys.stderr)
+    finally:
+        if window_driver is not None:
+            window_driver.close()
+        translator.shutdown_cli_workers()
+        server.terminate()
+        server.wait()
+        if not args.keep_home:
+            import history
+            history.close()
+            shutil.rmtree(home, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Gemini API 생성 프로필(fast/quality) 비교 - 실제 API 호출 (GEMINI_API_KEY 필요)
+
+    python3 bench/bench_gemini_profiles.py [--models gemini-2.5-flash ...] [--runs N]
+
+캐시를 거치지 않고 모델/모드마다 같은 문장들을 번역한 뒤 프로필별 응답 시간과 토큰 사용량을 출력한다.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import translator  # noqa: E402
+from constants import GEMINI_API_MODELS, GEMINI_API_MODES  # noqa: E402
+
+TEXTS = [
+    ("English", "Korean", "The meeting has been moved to Thursday afternoon."),
+    ("Korean", "English", "오늘 회의는 목요일 오후로 변경되었습니다. 참석 여부를 알려 주세요."),
+    ("English", "Japanese", "Please restart the application after updating the configuration file."),
+    ("auto", "Korean", "def add(a, b):\n    # Returns the sum of two numbers\n    return a + b"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", nargs="+", default=list(GEMINI_API_MODELS.values()))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--stream", action="store_true", help="streamGenerateContent 사용")
+    args = parser.parse_args()
+
+    for model in args.models:
+        for mode in GEMINI_API_MODES.values():
+            for _ in range(args.runs):
+                for src_lang, tgt_lang, text in TEXTS:
+                    try:
+                        if args.stream:
+                            translator._translate_gemini_api_stream(
+                                text, src_lang, tgt_lang, model, lambda delta: None, mode=mode
+                            )
+                        else:
+                            translator._translate_gemini_api(text, src_lang, tgt_lang, model, mode=mode)
+                    except translator.TranslationError as e:
+                        print(f"{model}/{mode}: {e}", file=sys.stderr)
+
+    print(f"{'프로필':32} {'요청':>5} {'p50 (s)':>8} {'p90 (s)':>8} {'입력':>7} {'출력':>7} {'thinking':>9}")
+    for (model, mode), stats in sorted(translator.gemini_profile_stats().items()):
+        print(f"{model + '/' + mode:32} {stats['requests']:>5} {stats['p50']:>8.2f} {stats['p90']:>8.2f} "
+              f"{stats['avg_prompt_tokens']:>7.0f} {stats['avg_output_tokens']:>7.0f} "
+              f"{stats['avg_thought_tokens']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
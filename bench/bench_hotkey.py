@@ -0,0 +1,263 @@
+"""전역 키 이벤트 처리 비용 벤치마크 - 합성 키 입력을 이전 핸들러와 HotkeyListener에 재생
+
+    python3 bench/bench_hotkey.py [--events 200000] [--repeat 5] [--seed 1]
+                                  [--save-trace keys.json | --trace keys.json] [--output run.json]
+
+미국 자판으로 글을 치는 키 입력(대문자는 Shift, 가끔 Ctrl+C 한 번/두 번)을 만들어 pynput X11 리스너의
+_handle_message부터 재생한다. X 서버가 넘겨주는 이벤트 파싱 이후, 키 이벤트 하나마다 앱이 쓰는 비용만 잰다.
+
+    legacy   pynput 기본 Listener (KeySym 조회, KeyCode 변환) + 이전 hotkey.py 콜백
+    current  hotkey.HotkeyListener의 X11 리스너 (원시 키코드 비교)
+
+X 서버가 없어도 돌 수 있도록 고정된 자판 배치를 돌려주는 디스플레이를 쓴다. 같은 --seed나 --trace로
+같은 입력을 재생할 수 있고, 두 경로가 감지한 단축키 횟수가 다르면 오류로 끝낸다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Xlib import X, XK  # noqa: E402
+
+# 미국 자판 X11 키코드 (evdev 기준)
+_ROWS = {10: "1234567890", 24: "qwertyuiop", 38: "asdfghjkl", 52: "zxcvbnm"}
+_SPECIAL = {
+    9: XK.XK_Escape, 22: XK.XK_BackSpace, 23: XK.XK_Tab, 36: XK.XK_Return, 37: XK.XK_Control_L,
+    50: XK.XK_Shift_L, 59: XK.XK_comma, 60: XK.XK_period, 62: XK.XK_Shift_R, 65: XK.XK_space,
+    105: XK.XK_Control_R,
+}
+_WORDS = ("the quick brown fox jumps over lazy dog translate window history cache "
+          "request model text copy paste select line code review").split()
+
+
+class KeymapDisplay:
+    """X 서버 대신 고정된 자판 배치로 키코드 ↔ keysym을 돌려주는 디스플레이"""
+
+    def __init__(self):
+        self.syms = {}
+        for first, chars in _ROWS.items():
+            for offset, char in enumerate(chars):
+                self.syms[first + offset, 0] = XK.string_to_keysym(char)
+                if char.isalpha():
+                    self.syms[first + offset, 1] = XK.string_to_keysym(char.upper())
+        for code, keysym in _SPECIAL.items():
+            self.syms[code, 0] = keysym
+        self.codes = {(keysym, index): code for (code, index), keysym in self.syms.items()}
+        # pynput이 처음 조회할 때 X 서버에 묻고 저장해 두는 값
+        setattr(self, "__altgr_mask", 0)
+        setattr(self, "__numlock_mask", X.Mod2Mask)
+        self.display = self
+        self.info = self
+        self.min_keycode, self.max_keycode = 8, 255
+
+    def keycode_to_keysym(self, keycode, index):
+        return self.syms.get((keycode, index), 0)
+
+    def keysym_to_keycodes(self, keysym):
+        return [(code, index) for (sym, index), code in self.codes.items() if sym == keysym]
+
+    def get_keyboard_mapping(self, first, count):
+        return []
+
+    def close(self):
+        pass
+
+
+class KeyEvent:
+    __slots__ = ("type", "detail", "state", "send_event")
+
+    def __init__(self, pressed, keycode, state):
+        self.type = X.KeyPress if pressed else X.KeyRelease
+        self.detail = keycode
+        self.state = state
+        self.send_event = False
+
+
+def make_trace(count, seed, display):
+    """[키코드, 누름 여부, 수식키 상태] 목록"""
+    rng = random.Random(seed)
+    code = {char: display.codes[XK.string_to_keysym(char), 0] for chars in _ROWS.values() for char in chars}
+    code.update({" ": 65, ".": 60, "\n": 36})
+    trace = []
+
+    def tap(keycode, state=0):
+        trace.extend(([keycode, True, state], [keycode, False, state]))
+
+    while len(trace) < count:
+        roll = rng.random()
+        if roll < 0.02:
+            # Ctrl+C 한 번 또는 두 번
+            trace.append([37, True, 0])
+            for _ in range(rng.choice((1, 2))):
+                tap(code["c"], X.ControlMask)
+            trace.append([37, False, X.ControlMask])
+        elif roll < 0.05:
+            tap(22)
+        else:
+            word = rng.choice(_WORDS)
+            if rng.random() < 0.1:
+                trace.append([50, True, 0])
+                tap(code[word[0]], X.ShiftMask)
+                trace.append([50, False, X.ShiftMask])
+                word = word[1:]
+            for char in word + rng.choice("  .\n"):
+                tap(code[char])
+    return trace[:count]
+
+
+def import_pynput_xorg(display):
+    """pynput X11 백엔드를 불러온다. import할 때 X 서버 접속을 확인하므로 없으면 고정 디스플레이로 대신한다."""
+    import Xlib.display
+    real = Xlib.display.Display
+    if not os.environ.get("DISPLAY"):
+        Xlib.display.Display = lambda *args: display
+    try:
+        from pynput.keyboard import _xorg
+    finally:
+        Xlib.display.Display = real
+    return _xorg
+
+
+class LegacyHandler:
+    """hotkey.py의 이전 Linux 콜백 (이벤트마다 pynput import, hasattr, time.time)"""
+
+    def __init__(self, on_double_copy, on_first_copy):
+        self.on_double_copy = on_double_copy
+        self.on_first_copy = on_first_copy
+        self.last_copy_time = 0
+        self._ctrl_pressed = False
+
+    def on_press(self, key):
+        from pynput import keyboard
+        try:
+            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
+                self._ctrl_pressed = True
+                return
+            if hasattr(key, 'char') and key.char == 'c' and self._ctrl_pressed:
+                now = time.time()
+                if now - self.last_copy_time < 0.5:
+                    self.last_copy_time = 0
+                    self.on_double_copy()
+                else:
+                    self.last_copy_time = now
+                    self.on_first_copy()
+        except Exception:
+            pass
+
+    def on_release(self, key):
+        from pynput import keyboard
+        try:
+            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
+                self._ctrl_pressed = False
+        except Exception:
+            pass
+
+
+class Counter:
+    def __init__(self):
+        self.first = 0
+        self.double = 0
+
+    def on_first(self):
+        self.first += 1
+
+    def on_double(self):
+        self.double += 1
+
+
+def make_legacy(xorg, display):
+    counter = Counter()
+    handler = LegacyHandler(counter.on_double, counter.on_first)
+    listener = xorg.Listener(on_press=handler.on_press, on_release=handler.on_release)
+    return listener, counter, None
+
+
+def make_current(xorg, display):
+    import hotkey
+    counter = Counter()
+    owner = hotkey.HotkeyListener(counter.on_double, counter.on_first)
+    listener = hotkey._x11_listener_class(xorg.Listener)(owner)
+    listener._initialize(display)
+    return listener, counter, owner
+
+
+def replay(factory, xorg, display, events, repeat):
+    """가장 빠른 재생의 이벤트당 시간, 전체 CPU 시간, 감지한 단축키 횟수"""
+    best = float("inf")
+    cpu = 0.0
+    for _ in range(repeat):
+        listener, counter, owner = factory(xorg, display)
+        handle = listener._handle_message
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        for event in events:
+            handle(display, event, False)
+        best = min(best, time.perf_counter() - start)
+        cpu += time.process_time() - cpu_start
+    return {
+        "per_event_ns": round(best / len(events) * 1e9, 1),
+        "cpu_ns_per_event": round(cpu / repeat / len(events) * 1e9, 1),
+        "first_copy": counter.first,
+        "double_copy": counter.double,
+        "listener_stats": owner.stats() if owner else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000, help="합성 키 이벤트 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--trace", help="재생할 키 입력 파일 (--save-trace로 저장한 것)")
+    parser.add_argument("--save-trace", help="만든 키 입력을 파일로 저장")
+    parser.add_argument("--output", help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    display = KeymapDisplay()
+    xorg = import_pynput_xorg(display)
+    if args.trace:
+        with open(args.trace) as f:
+            trace = json.load(f)
+    else:
+        trace = make_trace(args.events, args.seed, display)
+    if args.save_trace:
+        with open(args.save_trace, "w") as f:
+            json.dump(trace, f)
+    events = [KeyEvent(pressed, keycode, state) for keycode, pressed, state in trace]
+
+    results = {}
+    for name, factory in (("legacy", make_legacy), ("current", make_current)):
+        results[name] = replay(factory, xorg, display, events, args.repeat)
+        result = results[name]
+        print(f"{name:8} {result['per_event_ns']:>8.0f}ns/이벤트  CPU {result['cpu_ns_per_event']:>8.0f}ns/이벤트  "
+              f"단축키 첫 입력 {result['first_copy']} / 두 번 {result['double_copy']}", file=sys.stderr)
+    legacy, current = results["legacy"], results["current"]
+    print(f"이벤트당 {legacy['per_event_ns'] / current['per_event_ns']:.1f}배 빠름 "
+          f"(초당 10타 기준 CPU {legacy['cpu_ns_per_event'] * 10 / 1000:.1f}µs/s → "
+          f"{current['cpu_ns_per_event'] * 10 / 1000:.1f}µs/s)", file=sys.stderr)
+
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "events": len(events),
+                "seed": None if args.trace else args.seed,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            f.write(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    if (legacy["first_copy"], legacy["double_copy"]) != (current["first_copy"], current["double_copy"]):
+        sys.exit("두 경로가 감지한 단축키 횟수가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
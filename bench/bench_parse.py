@@ -0,0 +1,132 @@
+"""parse_translation / TranslationStreamParser 정확성 검사 + 벤치마크
+
+    python3 bench/bench_parse.py [--repeat N]
+
+CORPUS의 각 응답에 대해 parse_translation과 (여러 조각 크기로 나눠 넣은) 스트리밍 파서의
+결과를 기대값과 비교하고, 병적인 입력에서 이전 구현과 처리 시간을 비교한다.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translator import parse_translation, TranslationStreamParser  # noqa: E402
+
+# (이름, 응답, 기대값, 스트리밍 파서 기대값 - None이면 스트리밍 검사 생략)
+CORPUS = [
+    ("plain", '{"translation": "안녕하세요"}', "안녕하세요", "안녕하세요"),
+    ("no space", '{"translation":"hi"}', "hi", "hi"),
+    ("braces in value", '{"translation": "use {x} and }{"}', "use {x} and }{", "use {x} and }{"),
+    ("escaped quotes", r'{"translation": "he said \"hi\" {ok}"}', 'he said "hi" {ok}', 'he said "hi" {ok}'),
+    ("escapes", r'{"translation": "a\nb\t\\c\/d"}', "a\nb\t\\c/d", "a\nb\t\\c/d"),
+    ("unicode escape", r'{"translation": "\uc548\ub155 \ud83d\ude00"}', "안녕 😀", "안녕 😀"),
+    ("raw newline", '{"translation": "line1\nline2"}', "line1\nline2", "line1\nline2"),
+    ("cli noise", 'Loading...\nWarning: x {\n{"translation": "ok"}\nDone', "ok", "ok"),
+    ("code fence", '```json\n{\n  "translation": "fenced"\n}\n```', "fenced", "fenced"),
+    ("second key", '{"source": "x", "translation": "second"}', "second", "second"),
+    ("nested", '{"result": {"translation": "nested"}}', "nested", "nested"),
+    ("multiple objects", '{"status": "ok"}\n{"translation": "first"}\n{"translation": "other"}',
+     "first", "first"),
+    ("key inside value", '{"note": "\\"translation\\": \\"fake\\"", "translation": "real"}',
+     "real", "real"),
+    ("invalid escape then valid", r'{"translation": "\q"} {"translation": "valid"}', "valid", None),
+    ("fenced plain text", "```\nplain answer\n```", "plain answer", None),
+    ("plain text", "  just text  ", "just text", None),
+    ("truncated", '{"translation": "cut', '{"translation": "cut', None),
+    ("empty value", '{"translation": ""}', "", ""),
+]
+
+
+def legacy_parse(raw_output):
+    """이전 구현 (중괄호 개수만 세고 문자열 안의 중괄호는 고려하지 않음)"""
+    match = re.search(r'\{[^{}]*"translation"\s*:\s*"', raw_output)
+    if match:
+        json_start = match.start()
+        depth = 0
+        for i in range(json_start, len(raw_output)):
+            if raw_output[i] == '{':
+                depth += 1
+            elif raw_output[i] == '}':
+                depth -= 1
+                if depth == 0:
+                    try:
+                        data = json.loads(raw_output[json_start:i + 1])
+                        return data["translation"]
+                    except (json.JSONDecodeError, KeyError):
+                        break
+    return raw_output.strip()
+
+
+def stream_parse(raw, size):
+    parser = TranslationStreamParser()
+    pieces = []
+    for i in range(0, len(raw), size):
+        pieces.append(parser.feed(raw[i:i + size]))
+    assert "".join(pieces) == parser.text
+    return parser.text if parser.done else None
+
+
+def check():
+    failures = 0
+    for name, raw, expected, stream_expected in CORPUS:
+        results = [("parse_translation", parse_translation(raw), expected)]
+        if stream_expected is not None:
+            for size in (1, 2, 3, 7, len(raw)):
+                results.append((f"stream/{size}", stream_parse(raw, size), stream_expected))
+        for label, got, want in results:
+            if got != want:
+                failures += 1
+                print(f"FAIL {name} [{label}]: {got!r} != {want!r}")
+        legacy_ok = legacy_parse(raw) == expected
+        print(f"{'ok':4} {name:28} legacy={'ok' if legacy_ok else 'wrong'}")
+    return failures
+
+
+PATHOLOGICAL = {
+    "open braces": lambda n: "{" * n,
+    "unclosed value": lambda n: '{"translation": "' + "x" * n,
+    "braces in value": lambda n: '{"translation": "' + "{" * n + '"}',
+    "repeated keys": lambda n: '{"translation": "\\q", ' * (n // 20),
+    "escaped quotes": lambda n: '{"translation": "' + '\\"' * (n // 2) + '"}',
+}
+
+
+def measure(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(repeat):
+    print(f"\n{'입력':16} {'크기':>10} {'legacy (ms)':>12} {'parse (ms)':>12} {'stream (ms)':>12}")
+    for name, make in PATHOLOGICAL.items():
+        for size in (10_000, 100_000, 1_000_000):
+            text = make(size)
+            legacy = measure(legacy_parse, text, repeat)
+            new = measure(parse_translation, text, repeat)
+            stream = measure(lambda t: stream_parse(t, 4096), text, repeat)
+            print(f"{name:16} {len(text):>10,} {legacy * 1000:>12.2f} {new * 1000:>12.2f} "
+                  f"{stream * 1000:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    failures = check()
+    bench(args.repeat)
+    if failures:
+        print(f"\n{failures}개 실패")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""시작 시간 벤치마크 - 프로세스 실행부터 창이 그려질 때까지 (time-to-window)
+
+    python3 bench/bench_startup.py [--runs 20] [--repo PATH] [--output run.json] [--compare base.json]
+
+    # 이전 커밋과 비교
+    git worktree add /tmp/cc2-base HEAD~1
+    python3 bench/bench_startup.py --repo /tmp/cc2-base --output base.json
+    python3 bench/bench_startup.py --compare base.json
+
+--repo의 main.py를 임시 HOME/TMPDIR(빈 설정, 별도 소켓)에서 실행하고 다음을 잰다.
+
+    first   첫 실행: 프로세스 시작 → 창 표시 후 첫 이벤트 처리 (QMainWindow.show를 감싸 측정하므로
+            --startup-profile이 없는 이전 버전에도 같은 방식으로 잴 수 있다)
+    second  이미 실행 중일 때 두 번째 실행이 기존 창을 깨우고 종료할 때까지
+
+main.py가 --startup-profile을 지원하면 단계별 시간(중앙값)도 함께 기록한다.
+디스플레이 서버가 없으면 Qt는 offscreen으로, 전역 핫키(pynput)는 끄고 잰다 (--hotkey로 켜기).
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from bench_e2e import percentile  # noqa: E402
+
+# main.main()을 그대로 실행하되 창이 표시된 뒤 첫 이벤트에서 시각을 출력한다 (hold면 종료하지 않음)
+_DRIVER = r'''
+import json, sys, time
+sys.path.insert(0, ".")
+hold, hotkey_on = sys.argv[1] == "hold", sys.argv[2] == "1"
+sys.argv = ["main.py"]
+import updater
+updater.check_for_update = lambda: (False, None, None)
+if not hotkey_on:
+    import hotkey
+    hotkey.HotkeyListener.start = lambda self: None
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QMainWindow
+_show = QMainWindow.show
+
+def _shown():
+    print(json.dumps({"shown_at": time.time()}), flush=True)
+    if not hold:
+        QApplication.quit()
+
+def show(self):
+    _show(self)
+    QTimer.singleShot(0, _shown)
+
+QMainWindow.show = show
+import main
+main.main()
+'''
+
+
+def git_revision(repo):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=repo,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo,
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def make_env(home):
+    env = dict(os.environ, HOME=home, TMPDIR=home, PYTHONDONTWRITEBYTECODE="1")
+    # API 키가 있으면 시작 직후 연결 예열로 네트워크를 쓰므로 뺀다
+    for name in ("GEMINI_API_KEY", "DEEPL_API_KEY"):
+        env.pop(name, None)
+    if platform.system() == "Linux" and not (env.get("DISPLAY") or env.get("WAYLAND_DISPLAY")):
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    return env
+
+
+def launch_driver(repo, env, hold, hotkey):
+    started = time.time()
+    proc = subprocess.Popen([sys.executable, "-c", _DRIVER, "hold" if hold else "run", "1" if hotkey else "0"],
+                            cwd=repo, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    for line in proc.stdout:
+        if line.startswith("{"):
+            return proc, json.loads(line)["shown_at"] - started
+    proc.wait()
+    raise RuntimeError(f"창이 표시되지 않았습니다 (종료 코드 {proc.returncode})")
+
+
+def measure_first(repo, env, hotkey):
+    proc, elapsed = launch_driver(repo, env, hold=False, hotkey=hotkey)
+    proc.wait()
+    return elapsed
+
+
+def measure_second(repo, env, runs):
+    """첫 인스턴스를 띄워 둔 채 main.py를 runs번 실행해 종료까지의 시간을 잰다"""
+    first, _ = launch_driver(repo, env, hold=True, hotkey=False)
+    try:
+        times = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "main.py"], cwd=repo, env=env, capture_output=True, check=True)
+            times.append(time.perf_counter() - started)
+        return times
+    finally:
+        first.terminate()
+        first.wait()
+
+
+def measure_phases(repo, env, runs):
+    """--startup-profile 단계별 시간의 중앙값 (지원하지 않는 버전이면 None)"""
+    with open(os.path.join(repo, "main.py"), encoding="utf-8") as f:
+        if "--startup-profile" not in f.read():
+            return None
+    samples = {}
+    order = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "main.py", "--startup-profile"], cwd=repo, env=env,
+                             capture_output=True, text=True, timeout=60).stdout
+        report = json.loads(out.strip().splitlines()[-1])
+        for item in report["phases"]:
+            if item["phase"] not in samples:
+                order.append(item["phase"])
+            samples.setdefault(item["phase"], []).append(item["ms"])
+    return {phase: round(statistics.median(samples[phase]), 1) for phase in order}
+
+
+def summarize(times):
+    ms = lambda value: None if value is None else round(value * 1000, 1)
+    return {
+        "runs": len(times),
+        "p50_ms": ms(percentile(times, 50)),
+        "p95_ms": ms(percentile(times, 95)),
+        "min_ms": ms(min(times, default=None)),
+        "max_ms": ms(max(times, default=None)),
+    }
+
+
+def compare(baseline, current):
+    print(f"\n비교 기준: {baseline['meta'].get('commit')} → {current['meta'].get('commit')}", file=sys.stderr)
+    base = {r["mode"]: r for r in baseline["results"]}
+    for result in current["results"]:
+        old = base.get(result["mode"])
+        if old is None:
+            continue
+        cells = []
+        for field in ("p50_ms", "p95_ms"):
+            before, after = old.get(field), result.get(field)
+            cells.append(f"{field[:3]} {before:.0f}→{after:.0f}ms ({(after - before) / before * 100:+.0f}%)")
+        print(f"{result['mode']:8} " + "  ".join(cells), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", default=REPO_DIR, help="측정할 소스 트리 (기본: 이 저장소)")
+    parser.add_argument("--runs", type=int, default=20, help="모드별 측정 횟수")
+    parser.add_argument("--modes", nargs="+", default=["first", "second"], choices=["first", "second"])
+    parser.add_argument("--hotkey", action="store_true", help="전역 핫키 백엔드도 시작 (디스플레이 서버 필요)")
+    parser.add_argument("--output", help="결과 JSON 파일 (없으면 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    repo = os.path.abspath(args.repo)
+    home = tempfile.mkdtemp(prefix="cc2-startup-")
+    env = make_env(home)
+    commit, dirty = git_revision(repo)
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "repo": repo,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": env.get("QT_QPA_PLATFORM"),
+            "hotkey": args.hotkey,
+        },
+        "results": [],
+    }
+    try:
+        # 첫 실행에서 만들어지는 설정/DB 파일과 OS 파일 캐시는 측정에서 뺀다
+        measure_first(repo, env, args.hotkey)
+        for mode in args.modes:
+            if mode == "first":
+                times = [measure_first(repo, env, args.hotkey) for _ in range(args.runs)]
+            else:
+                times = measure_second(repo, env, args.runs)
+            result = {"mode": mode, **summarize(times)}
+            report["results"].append(result)
+            print(f"{mode:8} p50 {result['p50_ms']:.0f}ms  p95 {result['p95_ms']:.0f}ms", file=sys.stderr)
+        phases = measure_phases(repo, env, min(args.runs, 10))
+        if phases:
+            report["phases_p50_ms"] = phases
+            for phase, value in phases.items():
+                print(f"  {phase:16} {value:8.1f}ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""벤치마크용 로컬 대역 - Gemini/DeepL API 모의 서버와 가짜 claude/gemini CLI
+
+    python3 bench/mock_backends.py [--port 0] [--latency 0.3] [--jitter 0.1] [--error-rate 0.05] ...
+
+서버는 받은 원문을 그대로 "번역"으로 돌려주므로 호출한 쪽에서 결과를 원문과 비교해 검증할 수 있다.
+첫 줄에 서버 주소를 출력하므로 앱을 실제 API 대신 이 서버에 붙여 실행할 수도 있다:
+
+    CC2TRANSLATE_GEMINI_API_BASE=http://127.0.0.1:PORT CC2TRANSLATE_DEEPL_API_BASE=http://127.0.0.1:PORT \\
+        GEMINI_API_KEY=x DEEPL_API_KEY=x python3 main.py
+"""
+
+import argparse
+import json
+import os
+import random
+import stat
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULTS = {
+    "latency": 0.3,        # 요청당 기본 지연 (초, 첫 바이트까지)
+    "jitter": 0.1,         # 0~jitter초 무작위 추가 지연
+    "per_1k_chars": 0.05,  # 입력 1000자당 추가 지연 (초)
+    "error_rate": 0.0,     # 오류 응답 비율 (0~1)
+    "error_status": 503,   # 오류 응답 상태 코드 (429면 Retry-After: 1 포함)
+    "chunk_chars": 40,     # 스트리밍 이벤트 하나에 담을 응답 글자 수
+    "chunk_delay": 0.02,   # 스트리밍 이벤트 사이 간격 (초)
+}
+
+
+def source_text(prompt):
+    """번역 프롬프트에서 원문 추출 (지시문 뒤 첫 빈 줄 다음부터)"""
+    _, sep, text = prompt.partition("\n\n")
+    return text if sep else prompt
+
+
+class MockBackendHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def settings(self):
+        return self.server.settings
+
+    def log_message(self, format, *args):
+        pass
+
+    def _delay(self, chars):
+        s = self.settings
+        time.sleep(s["latency"] + random.uniform(0, s["jitter"]) + chars / 1000 * s["per_1k_chars"])
+
+    def _send_json(self, status, obj, headers=None):
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _maybe_fail(self):
+        """error_rate 확률로 오류 응답을 보내고 True 반환"""
+        if random.random() >= self.settings["error_rate"]:
+            return False
+        status = self.settings["error_status"]
+        headers = {"Retry-After": "1"} if status == 429 else None
+        self._send_json(status, {"error": {"message": "mock backend error"}, "message": "mock backend error"},
+                        headers)
+        return True
+
+    def _count(self, name):
+        with self.server.lock:
+            self.server.counts[name] = self.server.counts.get(name, 0) + 1
+
+    def do_HEAD(self):
+        self._count("head")
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path.startswith("/v2/usage"):
+            self._count("deepl_usage")
+            return self._send_json(200, {"character_count": 0, "character_limit": 1_000_000_000})
+        if self.path == "/stats":
+            with self.server.lock:
+                counts = dict(self.server.counts)
+            return self._send_json(200, counts)
+        self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/v2/translate":
+            return self._deepl(body)
+        if path.endswith(":generateContent"):
+            return self._gemini(body, stream=False)
+        if path.endswith(":streamGenerateContent"):
+            return self._gemini(body, stream=True)
+        self._send_json(404, {"error": {"message": "not found"}})
+
+    # ── DeepL ──
+
+    def _deepl(self, body):
+        self._count("deepl_translate")
+        texts = [value for key, value in urllib.parse.parse_qsl(body.decode("utf-8"), keep_blank_values=True)
+                 if key == "text"]
+        self._delay(sum(len(t) for t in texts))
+        if self._maybe_fail():
+            return
+        self._send_json(200, {"translations": [{"detected_source_language": "EN", "text": t} for t in texts]})
+
+    # ── Gemini ──
+
+    def _gemini(self, body, stream):
+        self._count("gemini_stream" if stream else "gemini_generate")
+        payload = json.loads(body)
+        text = source_text(payload["contents"][0]["parts"][0]["text"])
+        self._delay(len(text))
+        if self._maybe_fail():
+            return
+        answer = json.dumps({"translation": text}, ensure_ascii=False)
+        usage = {"promptTokenCount": len(text) // 4 + 50, "candidatesTokenCount": len(answer) // 4 + 1}
+        if not stream:
+            return self._send_json(200, {
+                "candidates": [{"content": {"role": "model", "parts": [{"text": answer}]}, "finishReason": "STOP"}],
+                "usageMetadata": usage,
+            })
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        size = max(1, self.settings["chunk_chars"])
+        pieces = [answer[i:i + size] for i in range(0, len(answer), size)]
+        for i, piece in enumerate(pieces):
+            if i:
+                time.sleep(self.settings["chunk_delay"])
+            event = {"candidates": [{"content": {"role": "model", "parts": [{"text": piece}]}}]}
+            if i == len(pieces) - 1:
+                event["candidates"][0]["finishReason"] = "STOP"
+                event["usageMetadata"] = usage
+            data = b"data: " + json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\r\n\r\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class MockBackendServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, **settings):
+        super().__init__(("127.0.0.1", port), MockBackendHandler)
+        self.settings = {**DEFAULTS, **settings}
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 keep-alive 연결을 닫거나 요청을 취소한 경우는 조용히 넘긴다
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+# ── 가짜 CLI ──
+
+# 환경변수 MOCK_CLI_STARTUP(시작 지연), MOCK_CLI_LATENCY, MOCK_CLI_JITTER(요청당 지연)로 조정
+_CLI_COMMON = '''
+import json, os, random, sys, time
+
+def source_text(prompt):
+    _, sep, text = prompt.partition("\\n\\n")
+    return text if sep else prompt
+
+def delay():
+    time.sleep(float(os.environ.get("MOCK_CLI_LATENCY", "0.5"))
+               + random.uniform(0, float(os.environ.get("MOCK_CLI_JITTER", "0.1"))))
+
+time.sleep(float(os.environ.get("MOCK_CLI_STARTUP", "0.3")))
+args = sys.argv[1:]
+'''
+
+_FAKE_CLAUDE = _CLI_COMMON + '''
+# claude -p "프롬프트" 또는 claude -p --model X (프롬프트는 stdin, 예비 프로세스 워커)
+after = args[args.index("-p") + 1:]
+prompt = after[0] if after and not after[0].startswith("-") else sys.stdin.read()
+delay()
+print(json.dumps({"translation": source_text(prompt)}, ensure_ascii=False))
+'''
+
+_FAKE_GEMINI = _CLI_COMMON + '''
+prompt = args[args.index("-p") + 1] if "-p" in args else sys.stdin.read()
+delay()
+print(json.dumps({"translation": source_text(prompt)}, ensure_ascii=False))
+'''
+
+
+def install_fake_clis(bin_dir):
+    """bin_dir에 가짜 claude/gemini 실행 파일을 만든다"""
+    os.makedirs(bin_dir, exist_ok=True)
+    for name, source in (("claude", _FAKE_CLAUDE), ("gemini", _FAKE_GEMINI)):
+        path = os.path.join(bin_dir, name)
+        with open(path, "w") as f:
+            f.write(f"#!{sys.executable}\n" + source)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    for name, value in DEFAULTS.items():
+        parser.add_argument("--" + name.replace("_", "-"), type=type(value), default=value)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    settings = {name: getattr(args, name) for name in DEFAULTS}
+    server = MockBackendServer(args.port, **settings)
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
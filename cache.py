@@ -0,0 +1,234 @@
+"""번역 캐시 - 메모리 LRU + SQLite 디스크 캐시 (2단계)"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from constants import (
+    APP_DATA_DIR, CACHE_DB_NAME, CACHE_MEMORY_ENTRIES,
+    CACHE_MAX_ENTRIES, CACHE_MAX_AGE_DAYS, CACHE_PRUNE_INTERVAL,
+)
+
+DB_PATH = os.path.join(APP_DATA_DIR, CACHE_DB_NAME)
+
+
+def normalize_text(text):
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 줄바꿈 통일, 앞뒤 공백 제거)"""
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+
+def make_key(text, src_lang, tgt_lang, model):
+    """(정규화 텍스트, 원본 언어, 대상 언어, 모델) 해시"""
+    raw = "\x1f".join((normalize_text(text), src_lang, tgt_lang, model))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _InFlight:
+    """진행 중인 요청 - 같은 키의 후속 호출이 결과를 공유"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class TranslationCache:
+    """메모리 LRU 앞단 + SQLite 뒷단 번역 캐시. single-flight로 중복 요청을 합친다."""
+
+    def __init__(self, db_path=DB_PATH, memory_entries=CACHE_MEMORY_ENTRIES,
+                 max_entries=CACHE_MAX_ENTRIES, max_age_days=CACHE_MAX_AGE_DAYS):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._conn = None
+        self._writes = 0
+
+    # ── 디스크 ──
+
+    def _db(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key         TEXT PRIMARY KEY,
+                    value       TEXT NOT NULL,
+                    created_at  REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _disk_get(self, key):
+        now = time.time()
+        with self._db_lock:
+            try:
+                conn = self._db()
+                row = conn.execute(
+                    "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.max_age:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+                return row[0]
+            except sqlite3.Error:
+                return None
+
+    def _disk_put(self, key, value):
+        now = time.time()
+        with self._db_lock:
+            try:
+                conn = self._db()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                self._writes += 1
+                if self._writes % CACHE_PRUNE_INTERVAL == 0:
+                    self._prune(conn, now)
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _prune(self, conn, now):
+        """만료 항목 삭제 후 개수 상한을 넘는 오래된(최근 사용 기준) 항목 삭제"""
+        conn.execute("DELETE FROM cache WHERE created_at < ?", (now - self.max_age,))
+        count = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+
+    # ── 메모리 ──
+
+    def _memory_put(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ── 공개 API ──
+
+    def get(self, key):
+        """캐시 조회. 메모리 → 디스크 순으로 찾고, 없으면 None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        value = self._disk_get(key)
+        if value is not None:
+            with self._lock:
+                self._memory_put(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._memory_put(key, value)
+        self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 반환, 없으면 compute() 실행 후 저장.
+
+        같은 키로 진행 중인 요청이 있으면 새로 호출하지 않고 그 결과를 기다린다.
+
+        Returns:
+            (value, hit: bool)
+        """
+        value = self.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value, True
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                self._inflight[key] = flight
+            self.misses += 1
+
+        if not owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, False
+
+        try:
+            result = compute()
+        except BaseException as e:
+            self.resolve(key, flight, error=e)
+            raise
+        self.resolve(key, flight, result)
+        return result, False
+
+    def claim(self, key):
+        """캐시 조회 후 없으면 이 키의 요청을 맡는다 (여러 키를 한 번에 요청하는 호출자용).
+
+        Returns:
+            (value, None) 캐시 적중 / (None, flight) 맡음 - 끝나면 resolve(key, flight, ...)를 반드시 호출 /
+            (None, None) 같은 키로 진행 중인 요청이 있음 - get_or_compute로 기다린다
+        """
+        value = self.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value, None
+        with self._lock:
+            if key in self._inflight:
+                return None, None
+            flight = self._inflight[key] = _InFlight()
+            self.misses += 1
+        return None, flight
+
+    def resolve(self, key, flight, result=None, error=None):
+        """claim으로 맡은 요청의 결과(또는 오류)를 저장하고 기다리는 호출자에게 알린다"""
+        flight.result = result
+        flight.error = error
+        try:
+            if error is None and result:
+                self.put(key, result)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory": len(self._memory)}
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            try:
+                self._db().execute("DELETE FROM cache")
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
@@ -0,0 +1,187 @@
+"""CLI 워커 - 번역 요청이 CLI 시작을 기다리지 않도록 프로세스를 미리 띄워 둔다
+
+프로세스 하나는 요청 하나에만 쓰고 버린다. 세션을 이어 쓰면 이전 번역(클립보드 내용)이 다음 요청의
+대화 맥락에 남아 섞이고, 맥락이 길어질수록 토큰 비용과 응답 시간도 늘어난다.
+"""
+
+import collections
+import queue
+import subprocess
+import threading
+import time
+
+import tracing
+
+
+class CLIWorkerError(Exception):
+    pass
+
+
+class CLIWorkerTimeout(CLIWorkerError):
+    pass
+
+
+class CLIWorkerCrashed(CLIWorkerError):
+    """응답 도중 프로세스가 종료됨 (다시 띄워 재시도 가능)"""
+
+
+class _Process:
+    """stdout/stderr를 백그라운드 스레드로 읽어 주는 subprocess 래퍼"""
+
+    def __init__(self, cmd, env):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            env=env,
+        )
+        self.lines = queue.Queue()
+        self.stderr = collections.deque(maxlen=50)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_stdout(self):
+        for line in self.proc.stdout:
+            self.lines.put(line)
+        self.lines.put(None)  # EOF
+
+    def _read_stderr(self):
+        for line in self.proc.stderr:
+            self.stderr.append(line)
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def read_line(self, deadline):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise CLIWorkerTimeout()
+        try:
+            return self.lines.get(timeout=remaining)
+        except queue.Empty:
+            raise CLIWorkerTimeout()
+
+    def read_all(self, deadline):
+        """EOF까지 stdout 전체를 읽는다"""
+        out = []
+        while True:
+            line = self.read_line(deadline)
+            if line is None:
+                return "".join(out)
+            out.append(line)
+
+    def error_text(self):
+        return "".join(self.stderr).strip()
+
+    def kill(self):
+        if self.alive():
+            self.proc.kill()
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+class SpareProcessWorker:
+    """stdin으로 프롬프트를 받는 CLI(gemini, claude -p)를 한 개 미리 띄워 두고 요청 시 사용.
+
+    한 번 쓴 프로세스는 버리고 다음 예비 프로세스를 곧바로 띄우므로
+    CLI 시작 비용이 요청 대기 시간에서 빠지고, 요청마다 새 맥락에서 시작한다.
+    """
+
+    def __init__(self, cmd, env):
+        self.cmd = cmd
+        self.env = env
+        self._spare = None
+        self._stopped = False  # stop() 이후에는 예비 프로세스를 다시 띄우지 않음
+        self._lock = threading.Lock()
+
+    def _take(self):
+        with self._lock:
+            proc = self._spare
+            self._spare = None
+        if proc is None or not proc.alive():
+            proc = _Process(self.cmd, self.env)
+            tracing.mark("cli_spawn")
+        return proc
+
+    def start(self):
+        with self._lock:
+            # 종료가 시작된 뒤 늦게 도착한 재생성 요청이 고아 프로세스를 남기지 않도록 잠금 안에서 확인
+            if self._stopped:
+                return
+            if self._spare is None or not self._spare.alive():
+                self._spare = _Process(self.cmd, self.env)
+
+    def request(self, prompt, timeout, cancel=None):
+        """프롬프트를 보내고 stdout 전체를 반환. 잠금 없이 요청마다 프로세스를 따로 쓰므로 조각들이 동시에 실행된다."""
+        proc = self._take()
+        # 제한 시간은 프로세스를 받은 뒤부터
+        deadline = time.monotonic() + timeout
+        if cancel is not None:
+            # 이 요청만 쓰는 프로세스이므로 취소되면 죽여도 예비 프로세스에는 영향이 없다
+            cancel.add_callback(proc.kill)
+        try:
+            proc.proc.stdin.write(prompt)
+            proc.proc.stdin.close()
+            output = proc.read_all(deadline)
+            proc.proc.wait(timeout=max(0.1, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise CLIWorkerTimeout()
+        except CLIWorkerError:
+            proc.kill()
+            raise
+        except OSError as e:
+            proc.kill()
+            raise CLIWorkerError(str(e))
+        finally:
+            if cancel is not None:
+                cancel.remove_callback(proc.kill)
+            threading.Thread(target=self._respawn, daemon=True).start()
+        if proc.proc.returncode != 0:
+            raise CLIWorkerError(proc.error_text() or "번역 실패")
+        return output
+
+    def _respawn(self):
+        try:
+            self.start()
+        except OSError:
+            pass
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            if self._spare is not None:
+                self._spare.kill()
+                self._spare = None
+
+
+_workers = {}
+_workers_lock = threading.Lock()
+
+
+def get_worker(model, is_gemini, env):
+    """모델별 워커 반환 (최초 요청 시 생성)"""
+    with _workers_lock:
+        worker = _workers.get(model)
+        if worker is None:
+            if is_gemini:
+                worker = SpareProcessWorker(["gemini"], env)
+            else:
+                worker = SpareProcessWorker(["claude", "-p", "--model", model], env)
+            _workers[model] = worker
+        return worker
+
+
+def shutdown_all():
+    """앱 종료 시 모든 CLI 프로세스 정리"""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.stop()
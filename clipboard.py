@@ -0,0 +1,129 @@
+"""클립보드 읽기 - UI 스레드 밖에서 시간/크기 제한을 두고 읽는다
+
+X11의 QClipboard.text()는 선택 영역을 가진 프로그램이 내용을 다 보낼 때까지 UI 스레드를 막는다.
+여기서는 xclip/wl-paste/pbpaste/xsel 프로세스로 선호하는 텍스트 형식(CLIPBOARD_PREFERRED_TYPES)을
+골라 읽고, 최대 크기를 넘으면 거기까지만 읽고 프로세스를 끝낸다. 읽은 바이트의 해시(digest)로 같은
+내용이 다시 들어왔는지 알 수 있다. 읽을 도구가 없으면 시간 제한 없이 UI 스레드를 막는 Qt로 읽지 않고
+ClipboardError로 설치를 안내한다.
+"""
+
+import codecs
+import hashlib
+import os
+import select
+import shutil
+import subprocess
+import time
+
+from constants import IS_MACOS, CLIPBOARD_PREFERRED_TYPES
+
+_TYPES_LIMIT = 64 * 1024  # 형식 목록 출력 최대 크기
+
+
+class ClipboardError(Exception):
+    pass
+
+
+class ClipboardContent:
+    """읽은 클립보드 텍스트. truncated면 최대 크기까지만 읽은 것."""
+
+    def __init__(self, text, digest, truncated=False, mime=None):
+        self.text = text
+        self.digest = digest
+        self.truncated = truncated
+        self.mime = mime
+
+
+def _commands():
+    """(형식 목록 명령 또는 None, 형식을 지정한 읽기 명령, 도구 기본 형식으로 읽는 명령)
+
+    쓸 수 있는 도구가 없으면 None
+    """
+    if IS_MACOS:
+        return None, None, ["pbpaste", "-Prefer", "txt"]
+    if os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-paste"):
+        return (["wl-paste", "--list-types"], ["wl-paste", "--no-newline", "--type", "{mime}"],
+                ["wl-paste", "--no-newline"])
+    if shutil.which("xclip"):
+        return (["xclip", "-selection", "clipboard", "-o", "-t", "TARGETS"],
+                ["xclip", "-selection", "clipboard", "-o", "-t", "{mime}"],
+                ["xclip", "-selection", "clipboard", "-o"])
+    if shutil.which("xsel"):
+        return None, None, ["xsel", "--clipboard", "--output"]
+    return None
+
+
+def _run(cmd, limit, deadline):
+    """명령 출력을 limit 바이트까지 읽는다. Returns: (data, 잘렸는지)"""
+    # pbpaste는 로캘 인코딩으로 출력하므로 UTF-8로 고정
+    env = dict(os.environ, LANG="en_US.UTF-8", LC_ALL="en_US.UTF-8") if IS_MACOS else None
+    try:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, env=env)
+    except OSError as e:
+        raise ClipboardError(f"클립보드를 읽을 수 없습니다: {e}")
+    chunks = []
+    size = 0
+    try:
+        fd = proc.stdout.fileno()
+        while size <= limit:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ClipboardError("클립보드를 읽는 데 시간이 너무 오래 걸립니다")
+            if not select.select([fd], [], [], remaining)[0]:
+                continue
+            chunk = os.read(fd, 64 * 1024)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+    data = b"".join(chunks)
+    return data[:limit], size > limit
+
+
+def _pick_type(types):
+    for mime in CLIPBOARD_PREFERRED_TYPES:
+        if mime in types:
+            return mime
+    return None
+
+
+def _content(data, max_chars, truncated, mime=None):
+    encoding = "latin-1" if mime == "STRING" else "utf-8"
+    # 잘린 경우 끝에 걸친 불완전한 문자는 버린다
+    text = codecs.getincrementaldecoder(encoding)("replace").decode(data, final=not truncated)
+    if len(text) > max_chars:
+        text = text[:max_chars]
+        data = text.encode(encoding)
+        truncated = True
+    return ClipboardContent(text, hashlib.sha256(data).hexdigest(), truncated, mime)
+
+
+def read(max_chars, timeout):
+    """클립보드 텍스트를 읽는다 (작업 스레드에서 호출). 텍스트가 없으면 빈 문자열.
+
+    형식 목록에 선호하는 형식이 없으면(소유 프로그램이 목록을 주지 않거나 도구가 실패한 경우 포함)
+    도구의 기본 형식으로 다시 읽는다.
+
+    Raises:
+        ClipboardError: 시간 초과, 도구 실행 실패
+    """
+    commands = _commands()
+    if commands is None:
+        raise ClipboardError("클립보드를 읽을 도구가 없습니다 - xclip(Wayland는 wl-clipboard)을 설치하세요")
+    types_cmd, typed_cmd, read_cmd = commands
+    deadline = time.monotonic() + timeout
+    mime = None
+    if types_cmd:
+        types, _ = _run(types_cmd, _TYPES_LIMIT, deadline)
+        mime = _pick_type(types.decode("utf-8", "replace").split())
+        if mime is not None:
+            read_cmd = [mime if part == "{mime}" else part for part in typed_cmd]
+    # UTF-8 한 글자는 최대 4바이트
+    data, truncated = _run(read_cmd, max_chars * 4, deadline)
+    return _content(data, max_chars, truncated, mime)
@@ -26,6 +26,8 @@ LANGUAGES = {
     "인도네시아어": "Indonesian",
     "아랍어": "Arabic",
 }
+# 표시 이름이나 언어 코드 → 언어 코드 (batch.py / ipc_server.py 입력용)
+LANGUAGE_NAMES = {**{code: code for code in LANGUAGES.values()}, **LANGUAGES}
 
 # Claude 모델
 CLAUDE_MODELS = {
@@ -48,13 +50,55 @@ GEMINI_API_MODELS = {
     "Gemini 2.5 Pro API": "gemini-2.5-pro",
 }
 
+# Gemini API 생성 프로필 (모델별 "fast"/"quality"). 목록에 없는 모델은 GEMINI_PROFILE_DEFAULT 사용.
+# thinking_budget: 0이면 thinking 끔, -1이면 모델이 결정, None이면 보내지 않음 (thinking 미지원 모델)
+GEMINI_API_PROFILES = {
+    "gemini-2.5-flash-lite": {
+        "fast": {"temperature": 0.2, "thinking_budget": 0},
+        "quality": {"temperature": 0.3, "thinking_budget": 512},
+    },
+    "gemini-2.0-flash": {
+        "fast": {"temperature": 0.2, "thinking_budget": None},
+        "quality": {"temperature": 0.3, "thinking_budget": None},
+    },
+    "gemini-2.5-flash": {
+        "fast": {"temperature": 0.2, "thinking_budget": 0},
+        "quality": {"temperature": 0.3, "thinking_budget": 1024},
+    },
+    "gemini-2.5-pro": {
+        "fast": {"temperature": 0.2, "thinking_budget": 128},  # Pro는 thinking을 끌 수 없음 (최소 128)
+        "quality": {"temperature": 0.3, "thinking_budget": -1},
+    },
+}
+GEMINI_PROFILE_DEFAULT = {"temperature": 0.2, "thinking_budget": None}
+GEMINI_API_MODES = {"빠름": "fast", "품질": "quality"}
+
 # DeepL API 모델 (직접 호출)
 DEEPL_API_MODELS = {
     "DeepL API (빠름)": "deepl-free",
 }
 
+# 경쟁 모델 - primary 응답이 hedge_delay(초) 안에 없으면 secondary에도 요청하고 먼저 온 결과 사용
+# hedge_delay가 None이면 primary의 관측 p90 응답 시간을 사용
+RACE_MODELS = {
+    "Gemini 2.5 Flash + DeepL (경쟁)": "race-gemini-flash-deepl",
+    "Gemini 2.5 Flash + 2.0 Flash (경쟁)": "race-gemini-flash-2.0",
+}
+RACE_CONFIGS = {
+    "race-gemini-flash-deepl": {
+        "primary": "gemini-2.5-flash",
+        "secondary": "deepl-free",
+        "hedge_delay": None,
+    },
+    "race-gemini-flash-2.0": {
+        "primary": "gemini-2.5-flash",
+        "secondary": "gemini-2.0-flash",
+        "hedge_delay": None,
+    },
+}
+
 # 전체 모델 (UI 표시용)
-ALL_MODELS = {**CLAUDE_MODELS, **GEMINI_MODELS, **GEMINI_API_MODELS, **DEEPL_API_MODELS}
+ALL_MODELS = {**CLAUDE_MODELS, **GEMINI_MODELS, **GEMINI_API_MODELS, **DEEPL_API_MODELS, **RACE_MODELS}
 
 # ── Timing ──
 API_TIMEOUT = 30
@@ -65,6 +109,45 @@ AUTO_TRANSLATE_DEBOUNCE_MS = 1000
 HISTORY_SEARCH_DEBOUNCE_MS = 300
 SOCKET_CONNECT_TIMEOUT_MS = 500
 HOTKEY_TRIGGER_DELAY = 0.1
+STARTUP_DEFER_MS = 50  # 창을 먼저 그린 뒤 핫키/기록 목록/HTTP 스택 준비를 시작할 때까지의 지연
+HTTP_WARMUP_TIMEOUT = 5
+HTTP_IDLE_RECONNECT = 240  # 서버 keep-alive 만료 전 재연결 (초)
+
+# ── HTTP ──
+# 환경변수로 다른 서버(프록시, bench/mock_backends.py 등)를 가리킬 수 있다
+GEMINI_API_BASE = os.environ.get("CC2TRANSLATE_GEMINI_API_BASE", "https://generativelanguage.googleapis.com")
+DEEPL_API_BASE = os.environ.get("CC2TRANSLATE_DEEPL_API_BASE", "https://api-free.deepl.com")
+HTTP_POOL_SIZE = 4
+HTTP_CONNECT_RETRIES = 2
+GEMINI_API_STREAMING = True  # Gemini API 결과를 streamGenerateContent로 점진 표시
+GEMINI_API_MODE = "fast"  # 기본 생성 프로필 (config.json의 gemini_mode로 변경)
+GEMINI_SYSTEM_INSTRUCTION = (
+    "You are a translation engine. Translate the user's text into the requested language. "
+    "Preserve line breaks, formatting, code, URLs and proper nouns. "
+    "Do not add explanations or notes. "
+    'Return only a JSON object: {"translation": "<translated text>"}'
+)
+# maxOutputTokens = 입력 글자 수 × 비율 + 여유분 (+ thinking 예산). 한중일 문자는 글자당 약 1토큰
+GEMINI_OUTPUT_TOKENS_PER_CHAR = 1.5
+GEMINI_OUTPUT_TOKENS_MARGIN = 256
+GEMINI_DYNAMIC_THINKING_RESERVE = 8192  # thinking_budget이 -1(모델 결정)일 때 출력 한도에 더할 여유분
+GEMINI_PROFILE_LATENCY_SAMPLES = 100
+
+# ── Chunking ──
+CHUNK_THRESHOLD_CHARS = 3000  # 이보다 긴 텍스트는 나눠서 병렬 번역
+CHUNK_MAX_CHARS = 1500
+CHUNK_WORKERS = 4
+DEEPL_BATCH_MAX_TEXTS = 50            # DeepL /v2/translate 요청당 text 최대 개수
+DEEPL_BATCH_MAX_BYTES = 120 * 1024    # DeepL 요청 본문 한도(128 KiB)보다 약간 작게
+
+# ── Race ──
+RACE_DEFAULT_HEDGE_DELAY = 2.0  # 관측 표본이 부족할 때 사용할 hedge 지연 (초)
+RACE_LATENCY_SAMPLES = 50
+RACE_MIN_SAMPLES = 5
+RACE_LOG_SIZE = 100
+
+# ── CLI ──
+CLI_PERSISTENT_WORKERS = True  # CLI 프로세스를 미리 띄워 두고 요청 시 사용 (False면 요청 시점에 새 프로세스)
 
 # ── UI ──
 WINDOW_SIZE = (900, 600)
@@ -77,13 +160,109 @@ SPLITTER_DEFAULT = [450, 450]
 SPLITTER_HISTORY_OPEN = [250, 650]
 SPLITTER_HISTORY_CLOSED = [0, 900]
 HISTORY_PREVIEW_LENGTH = 60
+HISTORY_SNIPPET_MARKERS = ("«", "»")  # 검색 결과 미리보기에서 일치 부분 표시
+HISTORY_SNIPPET_TOKENS = 16
+HISTORY_PAGE_SIZE = 100  # 히스토리 목록을 스크롤할 때마다 추가로 불러올 항목 수
+HISTORY_SHORT_SEARCH_WINDOW = 2000  # 색인을 쓸 수 없는 검색(3글자 미만 등)은 최근 이만큼의 항목에서만 찾는다
 
 # ── App ──
 APP_ID = "cc2translate-single-instance"
 GITHUB_REPO = "ghkim919/cc2translate"
 APP_DATA_DIR = os.path.expanduser("~/.local/share/cc2translate")
+CONFIG_RELOAD_INTERVAL = 1.0  # 메모리에 둔 config.json이 바뀌었는지 이 간격(초)마다 확인
 HISTORY_DB_NAME = "history.db"
-MAX_HISTORY_ENTRIES = 500
+# 보관 한도 기본값 (config.json의 history_max_entries / history_max_bytes / history_max_age_days로 변경, 0이면 무제한)
+MAX_HISTORY_ENTRIES = 200000
+MAX_HISTORY_BYTES = 512 * 1024 * 1024
+MAX_HISTORY_AGE_DAYS = 0
+HISTORY_COMPRESS_THRESHOLD = 512  # 이 크기(바이트) 이상인 텍스트는 zlib 압축해서 저장
+HISTORY_WRITE_BATCH = 64       # 한 트랜잭션으로 묶어 커밋할 최대 항목 수
+HISTORY_WRITE_DELAY = 0.05     # 뒤따르는 항목을 모으기 위해 기다리는 시간 (초)
+HISTORY_WRITE_RETRIES = 2      # 커밋이 실패했을 때 다시 시도할 횟수
+HISTORY_PRUNE_INTERVAL = 50    # 이 횟수만큼 추가될 때마다 보관 개수 초과분 정리
+
+# ── Cache ──
+CACHE_DB_NAME = "cache.db"
+CACHE_MEMORY_ENTRIES = 256
+CACHE_MAX_ENTRIES = 5000
+CACHE_MAX_AGE_DAYS = 30
+CACHE_PRUNE_INTERVAL = 50
+
+# ── IPC ──
+# 단일 인스턴스 소켓으로 받는 번역 요청 (ipc.py / ipc_server.py)
+IPC_MAX_MESSAGE_BYTES = 16 * 1024 * 1024  # 메시지 하나의 최대 크기 - 넘으면 연결을 끊음
+IPC_MAX_INFLIGHT = 4                      # 클라이언트 하나가 동시에 진행할 수 있는 번역 수
+IPC_MAX_PENDING_WRITE = 1024 * 1024       # 클라이언트가 읽지 않은 응답이 이만큼 쌓이면 새 요청을 받지 않음
+IPC_READ_BUFFER = 256 * 1024              # 소켓 읽기 버퍼 - 요청을 받지 않는 동안 그 이상은 커널에 남겨 둠
+IPC_CLIENT_TIMEOUT = CLI_TIMEOUT + 30     # ipc.py 클라이언트의 응답 대기 시간 (초)
+
+# ── Batch ──
+BATCH_PATTERNS = ["*.txt", "*.jsonl"]  # batch.py가 디렉터리에서 읽을 파일
+BATCH_LOOKAHEAD = 4  # 동시 요청 수의 몇 배까지 앞서 읽어 둘지 (순서 유지용 버퍼 크기)
+
+# ── Clipboard ──
+# 클립보드 읽기 (clipboard.py)
+CLIPBOARD_TIMEOUT = 2              # 소유 프로그램이 이 시간(초) 안에 내용을 주지 않으면 포기
+CLIPBOARD_MAX_CHARS = 200_000      # 더 긴 내용은 앞부분만 가져옴 (config.json의 clipboard_max_chars)
+# 여러 형식을 제공하면 이 순서로 고른다 (X11/Wayland 형식 이름)
+CLIPBOARD_PREFERRED_TYPES = ["text/plain;charset=utf-8", "UTF8_STRING", "text/plain", "STRING", "TEXT"]
+
+# ── Speculation ──
+# 첫 번째 복사 입력에서 미리 번역 시작 (speculation.py)
+SPECULATIVE_TRANSLATE = False  # config.json의 speculative_translate
+SPECULATIVE_SNAPSHOT_MS = 150  # 클립보드 변경 알림이 없으면 첫 입력 후 이만큼 기다렸다가 읽음
+SPECULATIVE_EXPIRE_MS = int((DOUBLE_PRESS_INTERVAL + HOTKEY_TRIGGER_DELAY) * 1000) + 500  # 두 번째 입력이 없으면 취소
+SPECULATIVE_MAX_CHARS = CHUNK_THRESHOLD_CHARS  # 더 긴 텍스트(조각 번역)는 미리 번역하지 않음
+
+# ── Tracing ──
+TRACE_BUFFER_SIZE = 50            # 메모리에 보관할 최근 trace 수
+TRACE_FILE_NAME = "traces.jsonl"
+TRACE_LOG = False                 # trace를 파일에도 기록 (config.json의 trace_log)
+TRACE_LOG_MAX_BYTES = 5 * 1024 * 1024  # 넘으면 .1로 옮기고 새 파일 시작
+
+# ── Retry ──
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5   # 지수 백오프 시작값 (초, full jitter)
+RETRY_MAX_DELAY = 8      # 백오프/Retry-After 최대 대기 (초) - 더 길면 재시도하지 않음
+# 백엔드 종류별 시도당 제한 시간과 재시도를 포함한 전체 제한 시간 (초)
+ATTEMPT_TIMEOUTS = {"api": API_TIMEOUT, "cli": 30}
+RETRY_BUDGETS = {"api": 60, "cli": CLI_TIMEOUT}
+CIRCUIT_FAILURE_THRESHOLD = 5  # 연속 실패가 이만큼 쌓이면 백엔드 차단
+CIRCUIT_OPEN_SECONDS = 30      # 차단 후 시험 요청을 보내기까지 대기 (초)
+CIRCUIT_FALLBACK = True        # 차단된 백엔드 대신 다른 모델 사용 (config.json의 circuit_fallback)
+
+# ── Quota ──
+# 무료 등급 기준 기본값. config.json의 rate_limits / daily_request_limits / monthly_char_limits로 모델별 변경
+QUOTA_FILE_NAME = "quota.json"
+RATE_LIMITS = {  # 분당 요청 수
+    "gemini-2.5-flash-lite": 15,
+    "gemini-2.0-flash": 15,
+    "gemini-2.5-flash": 10,
+    "gemini-2.5-pro": 5,
+    "deepl-free": 60,
+}
+DAILY_REQUEST_LIMITS = {
+    "gemini-2.5-flash-lite": 1000,
+    "gemini-2.0-flash": 200,
+    "gemini-2.5-flash": 250,
+    "gemini-2.5-pro": 100,
+}
+MONTHLY_CHAR_LIMITS = {
+    "deepl-free": 500_000,
+}
+QUOTA_WARN_RATIO = 0.9        # 사용량이 한도의 이 비율을 넘으면 상태 표시줄에 경고
+QUOTA_MAX_WAIT = 10           # 속도 제한으로 이보다 오래 기다려야 하면 다른 모델로 전환 (초)
+QUOTA_RATE_LIMIT_COOLDOWN = 60  # 429 응답에 Retry-After가 없을 때 쉬는 시간 (초)
+QUOTA_SYNC_INTERVAL = 3600    # DeepL /v2/usage 동기화 간격 (초)
+QUOTA_SAVE_DELAY = 5          # 요청 사용량은 모아서 이 시간(초) 뒤에 quota.json에 저장
+QUOTA_AUTO_FALLBACK = True    # config.json의 quota_auto_fallback
+# 할당량이 소진되면 설정된(키가 있거나 CLI가 설치된) 모델 중 이 순서로 대신 사용 (config.json의 quota_fallback_models)
+QUOTA_FALLBACK_MODELS = ["gemini-2.5-flash-lite", "deepl-free", "haiku"]
+
+# ── Language detection ──
+DETECT_SAMPLE_CHARS = 4096  # 언어 감지에 사용할 최대 글자 수 (긴 텍스트는 앞/뒤 일부만 사용)
+# 한글/가나/한자가 섞인 텍스트에서 라틴 문자 한 글자의 가중치 (한국어 문장 속 코드·제품명 같은 영어 단어)
+DETECT_LATIN_WEIGHT_WITH_CJK = 0.05
 
 # ── macOS ──
 MACOS_KEY_C = 8
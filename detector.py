@@ -0,0 +1,200 @@
+"""원본 텍스트 언어 감지 - 문자 체계(스크립트) 분포와 발음 구별 기호/기능어 단서 사용
+
+긴 텍스트는 앞/뒤 일부(DETECT_SAMPLE_CHARS)만 보고, 글자별 개수를 한 번에 센 뒤
+서로 다른 글자마다 미리 만든 코드포인트 범위 표로 스크립트를 분류한다.
+한글/가나/한자가 섞여 있으면 라틴 문자는 낮은 가중치로 세어, 영어 용어가 섞인 한국어 문장을 한국어로 본다.
+"""
+
+import bisect
+import collections
+import re
+
+from constants import LANGUAGES, DETECT_SAMPLE_CHARS, DETECT_LATIN_WEIGHT_WITH_CJK
+
+DEFAULT_LANGUAGE = "English"
+
+Detection = collections.namedtuple("Detection", "language confidence scores")
+
+# ── 스크립트 범위 표 ──
+
+_SCRIPT_RANGES = [
+    (0x0041, 0x005A, "latin"),
+    (0x0061, 0x007A, "latin"),
+    (0x00C0, 0x024F, "latin"),
+    (0x0400, 0x052F, "cyrillic"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0x08A0, 0x08FF, "arabic"),
+    (0x0E00, 0x0E7F, "thai"),
+    (0x1100, 0x11FF, "hangul"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x3040, 0x30FF, "kana"),
+    (0x3130, 0x318F, "hangul"),
+    (0x31F0, 0x31FF, "kana"),
+    (0x3400, 0x4DBF, "han"),
+    (0x4E00, 0x9FFF, "han"),
+    (0xA960, 0xA97F, "hangul"),
+    (0xAC00, 0xD7A3, "hangul"),
+    (0xF900, 0xFAFF, "han"),
+    (0xFB50, 0xFDFF, "arabic"),
+    (0xFE70, 0xFEFF, "arabic"),
+    (0xFF21, 0xFF3A, "latin"),
+    (0xFF41, 0xFF5A, "latin"),
+    (0xFF66, 0xFF9F, "kana"),
+    (0x20000, 0x2FA1F, "han"),
+]
+_RANGE_STARTS = [start for start, _, _ in _SCRIPT_RANGES]
+
+# 한 스크립트를 한 언어만 쓰는 경우
+_SCRIPT_LANGUAGE = {
+    "hangul": "Korean",
+    "cyrillic": "Russian",
+    "thai": "Thai",
+    "arabic": "Arabic",
+}
+
+# 간체/번체에서만 쓰이는 자주 나오는 글자
+_SIMPLIFIED_CHARS = set("这们来时个说国过还会对着经发动从后问见实现间进门头车长东话样认让论边谁语区马鸟书学买卖听")
+_TRADITIONAL_CHARS = set("這們來時個說國過還會對著經發動從後問見實現間進門頭車長東話樣認讓論邊誰語區馬鳥書學買賣聽")
+
+_LATIN_LANGUAGES = (
+    "English", "Spanish", "French", "German", "Portuguese", "Italian", "Vietnamese", "Indonesian",
+)
+
+# 단서가 전혀 없을 때의 사전 가중치 (영어가 가장 흔함)
+_LATIN_PRIOR = {lang: 0.5 for lang in _LATIN_LANGUAGES}
+_LATIN_PRIOR["English"] = 1.0
+
+# 글자 → {언어: 가중치}
+_DIACRITIC_CUES = {}
+
+
+def _add_cues(table, chars, languages, weight):
+    for ch in chars:
+        entry = table.setdefault(ch, {})
+        for lang in languages:
+            entry[lang] = entry.get(lang, 0) + weight / len(languages)
+
+
+_add_cues(_DIACRITIC_CUES, "ñ¿¡", ("Spanish",), 3)
+_add_cues(_DIACRITIC_CUES, "áíóú", ("Spanish", "Portuguese"), 1)
+_add_cues(_DIACRITIC_CUES, "ãõ", ("Portuguese",), 3)
+_add_cues(_DIACRITIC_CUES, "ç", ("Portuguese", "French"), 2)
+_add_cues(_DIACRITIC_CUES, "âêô", ("Portuguese", "French", "Vietnamese"), 1)
+_add_cues(_DIACRITIC_CUES, "éè", ("French", "Italian"), 1)
+_add_cues(_DIACRITIC_CUES, "ëïîûœ", ("French",), 3)
+_add_cues(_DIACRITIC_CUES, "àù", ("French", "Italian"), 1)
+_add_cues(_DIACRITIC_CUES, "ìò", ("Italian",), 3)
+_add_cues(_DIACRITIC_CUES, "äöüß", ("German",), 3)
+_add_cues(_DIACRITIC_CUES, "đơưă", ("Vietnamese",), 3)
+# 베트남어 성조 표기 (U+1EA0–U+1EF9)는 사실상 베트남어 전용
+_add_cues(_DIACRITIC_CUES, "".join(chr(cp) for cp in range(0x1EA0, 0x1EFA)), ("Vietnamese",), 3)
+
+# 단어 → {언어: 가중치}
+_WORD_CUES = {}
+for _lang, _words in {
+    "English": "the and is are of to in that it with for you this was not be have",
+    "Spanish": "el la los las de que y es por con una para del se no como",
+    "French": "le la les des est et une que pas pour dans du je il sur au",
+    "German": "der die und das ist nicht ein eine ich zu mit den sie auf auch",
+    "Portuguese": "o os de que não uma com para do da em se um mais são",
+    "Italian": "il di che è la non per un sono della gli con una del nel",
+    "Vietnamese": "không của và là có được những một cho người này",
+    "Indonesian": "yang dan di ini itu dengan untuk tidak ke dari ada saya akan",
+}.items():
+    for _word in _words.split():
+        _WORD_CUES.setdefault(_word, []).append(_lang)
+_WORD_CUES = {word: {lang: 2 / len(langs) for lang in langs} for word, langs in _WORD_CUES.items()}
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+def _script_of(ch):
+    cp = ord(ch)
+    i = bisect.bisect_right(_RANGE_STARTS, cp) - 1
+    if i >= 0:
+        start, end, script = _SCRIPT_RANGES[i]
+        if cp <= end:
+            return script
+    return None
+
+
+def _sample(text, limit):
+    """긴 텍스트는 앞/뒤 절반씩만 사용"""
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return text[:half] + "\n" + text[-half:]
+
+
+def detect(text, sample_chars=DETECT_SAMPLE_CHARS):
+    """텍스트 언어 감지.
+
+    Returns:
+        Detection(language, confidence, scores) - scores는 LANGUAGES의 모든 언어(자동 감지 제외)에 대한
+        0~1 점수(합 1). 글자가 없으면 DEFAULT_LANGUAGE와 confidence 0.
+    """
+    sample = _sample(text, sample_chars)
+    scripts = collections.Counter()
+    cues = collections.Counter()
+    simplified = traditional = 0
+    for ch, count in collections.Counter(sample).items():
+        script = _script_of(ch)
+        if script is None:
+            continue
+        scripts[script] += count
+        if script == "latin":
+            for lang, weight in _DIACRITIC_CUES.get(ch.lower(), {}).items():
+                cues[lang] += weight * count
+        elif script == "han":
+            if ch in _SIMPLIFIED_CHARS:
+                simplified += count
+            elif ch in _TRADITIONAL_CHARS:
+                traditional += count
+
+    scores = {lang: 0.0 for lang in LANGUAGES.values() if lang != "auto"}
+    if not scripts:
+        return Detection(DEFAULT_LANGUAGE, 0.0, scores)
+    latin = scripts["latin"]
+    if scripts["hangul"] or scripts["kana"] or scripts["han"]:
+        # 한글/가나/한자 한 글자가 라틴 문자 여러 글자만큼의 단서 - "Deployment의 replicas 설정"은 한국어
+        latin *= DETECT_LATIN_WEIGHT_WITH_CJK
+    total = sum(scripts.values()) - scripts["latin"] + latin
+
+    for script, lang in _SCRIPT_LANGUAGE.items():
+        scores[lang] += scripts[script] / total
+
+    # 가나가 한자의 10% 이상 섞여 있으면 한자도 일본어로 본다
+    kana, han = scripts["kana"], scripts["han"]
+    if kana or han:
+        ja_share = min(1.0, kana / (0.1 * (kana + han)))
+        scores["Japanese"] += (kana + han * ja_share) / total
+        chinese = han * (1 - ja_share) / total
+        if simplified or traditional:
+            traditional_share = traditional / (simplified + traditional)
+        else:
+            traditional_share = 0.2
+        scores["Simplified Chinese"] += chinese * (1 - traditional_share)
+        scores["Traditional Chinese"] += chinese * traditional_share
+
+    if latin:
+        # 라틴 문자 언어는 발음 구별 기호 + 기능어로 구분
+        for word in _WORD_RE.findall(sample.lower()):
+            for lang, weight in _WORD_CUES.get(word, {}).items():
+                cues[lang] += weight
+        evidence = {lang: _LATIN_PRIOR[lang] + cues[lang] for lang in _LATIN_LANGUAGES}
+        evidence_total = sum(evidence.values())
+        for lang, value in evidence.items():
+            scores[lang] += latin / total * value / evidence_total
+
+    language = max(scores, key=scores.get)
+    return Detection(language, scores[language], scores)
+
+
+if __name__ == "__main__":
+    import sys
+    result = detect(sys.stdin.read())
+    print(f"{result.language} ({result.confidence:.2f})")
+    for lang, score in sorted(result.scores.items(), key=lambda item: -item[1]):
+        if score > 0:
+            print(f"  {lang:20} {score:.3f}")
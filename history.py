@@ -1,84 +1,532 @@
-"""번역 히스토리 SQLite 저장소"""
+"""번역 히스토리 SQLite 저장소
+
+쓰기 연결과 조회 연결을 하나씩 계속 사용한다(WAL 모드). DB를 열고 마이그레이션하는 일과 추가/삭제는
+백그라운드 쓰기 스레드가 하며, 새 항목은 모아서 한 트랜잭션으로 커밋한다.
+조회는 조회 전용 연결로 쓰기를 기다리지 않고 이미 커밋된 항목만 읽는다.
+오래된 항목 정리는 매 삽입이 아니라 일정 횟수마다 수행한다.
+긴 텍스트는 zlib으로 압축한 BLOB으로 저장하고, 읽을 때 history_text() SQL 함수로 푼다.
+"""
 
 import os
+import queue
 import sqlite3
+import sys
+import threading
+import time
+import traceback
+import zlib
 
-from constants import APP_DATA_DIR, HISTORY_DB_NAME, MAX_HISTORY_ENTRIES
+from constants import (
+    APP_DATA_DIR, HISTORY_DB_NAME, MAX_HISTORY_ENTRIES, MAX_HISTORY_BYTES, MAX_HISTORY_AGE_DAYS,
+    HISTORY_COMPRESS_THRESHOLD, HISTORY_WRITE_BATCH, HISTORY_WRITE_DELAY, HISTORY_WRITE_RETRIES,
+    HISTORY_PRUNE_INTERVAL,
+    HISTORY_SNIPPET_MARKERS, HISTORY_SNIPPET_TOKENS, HISTORY_PAGE_SIZE, HISTORY_PREVIEW_LENGTH,
+    HISTORY_SHORT_SEARCH_WINDOW,
+)
 
 DB_DIR = APP_DATA_DIR
 DB_PATH = os.path.join(DB_DIR, HISTORY_DB_NAME)
 
+SCHEMA_VERSION = 1
+
+_conn = None    # 쓰기 스레드 전용
+_reader = None  # 조회 전용 (_read_lock)
+_read_lock = threading.Lock()
+_open_error = None
+_migration = None  # 이번 실행에서 마이그레이션했으면 _migrate()의 전후 디스크 크기
+_ready = threading.Event()  # 쓰기 스레드가 DB를 열었거나 열지 못함
+_on_ready = None
+_lock = threading.RLock()
+_queue = queue.Queue()
+_writer = None
+_inserts_since_prune = 0
+_limits = (MAX_HISTORY_ENTRIES, MAX_HISTORY_BYTES, MAX_HISTORY_AGE_DAYS)
+
+
+# ── 압축 ──
+
+def _encode(text):
+    """저장용 값과 저장 크기 반환. 임계값 이상이면 zlib 압축 BLOB, 아니면 평문 TEXT."""
+    data = text.encode("utf-8")
+    if len(data) >= HISTORY_COMPRESS_THRESHOLD:
+        compressed = zlib.compress(data, 6)
+        if len(compressed) < len(data):
+            return compressed, len(compressed)
+    return text, len(data)
+
 
-def _connect():
-    os.makedirs(DB_DIR, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+def _decode(value):
+    """history_text() SQL 함수 - 압축 BLOB이면 풀어서 문자열로"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+# ── 연결 / 스키마 ──
+
+def _new_connection():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS history (
-            id         INTEGER PRIMARY KEY AUTOINCREMENT,
-            src_text   TEXT NOT NULL,
-            tgt_text   TEXT NOT NULL,
-            src_lang   TEXT NOT NULL,
-            tgt_lang   TEXT NOT NULL,
-            model      TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    conn.commit()
+    conn.create_function("history_text", 1, _decode, deterministic=True)
     return conn
 
 
-def add_entry(src_text, tgt_text, src_lang, tgt_lang, model):
-    conn = _connect()
+def _open():
+    """연결을 열고 스키마 준비 및 마이그레이션 (쓰기 스레드에서 한 번)"""
+    global _conn, _reader, _open_error, _migration
     try:
-        conn.execute(
-            "INSERT INTO history (src_text, tgt_text, src_lang, tgt_lang, model) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (src_text, tgt_text, src_lang, tgt_lang, model),
-        )
-        # 오래된 항목 자동 삭제
-        conn.execute(
-            "DELETE FROM history WHERE id NOT IN "
-            "(SELECT id FROM history ORDER BY id DESC LIMIT ?)",
-            (MAX_HISTORY_ENTRIES,),
-        )
+        os.makedirs(DB_DIR, exist_ok=True)
+        conn = _new_connection()
+        is_new = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history'"
+        ).fetchone() is None
+        if is_new:
+            # auto_vacuum은 테이블 생성 전에만 바로 적용된다
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS history (
+                id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                src_text   TEXT NOT NULL,
+                tgt_text   TEXT NOT NULL,
+                src_lang   TEXT NOT NULL,
+                tgt_lang   TEXT NOT NULL,
+                model      TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                size       INTEGER NOT NULL DEFAULT 0
+            )
+        """)
         conn.commit()
+        migration = None
+        if is_new:
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        else:
+            migration = _migrate(conn)
+        _setup_fts(conn)
+        if migration is not None:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            _migration = migration
+        # 조회 전용 연결 - WAL 모드라 쓰기 스레드의 트랜잭션을 기다리지 않고 커밋된 내용을 읽는다
+        reader = _new_connection()
+        reader.execute("PRAGMA query_only=1")
+        _conn, _reader = conn, reader
+    except (sqlite3.Error, OSError) as e:
+        traceback.print_exc()
+        _open_error = e
     finally:
-        conn.close()
+        _ready.set()
 
 
-def get_entries(search=""):
-    conn = _connect()
+def _connect(reader=False):
+    """쓰기 연결(쓰기 스레드 전용) 또는 조회 연결 반환. 쓰기 스레드가 DB를 열 때까지 기다린다.
+
+    조회 연결은 _read_lock을 잡고 사용한다.
+
+    Raises:
+        sqlite3.Error: DB를 열지 못한 경우
+    """
+    _ensure_writer()
+    _ready.wait()
+    conn = _reader if reader else _conn
+    if conn is None:
+        raise sqlite3.OperationalError(f"히스토리 DB를 열 수 없습니다: {_open_error}")
+    return conn
+
+
+def start(limits=None, on_ready=None):
+    """쓰기 스레드를 시작해 DB를 연다 (마이그레이션 포함). 바로 반환하고, 열리면 쓰기 스레드에서 on_ready()를 호출한다.
+
+    limits: 보관 한도 (개수, 총 바이트, 일수) - 0이면 무제한, None이면 기본값
+    """
+    global _limits, _on_ready
+    if limits is not None:
+        _limits = tuple(limits)
+    with _lock:
+        if _ready.is_set():
+            ready = True
+        else:
+            ready = False
+            _on_ready = on_ready
+        _ensure_writer()
+    if ready and on_ready:
+        on_ready()
+
+
+def ready():
+    """DB가 열려 바로 조회할 수 있는지"""
+    return _ready.is_set()
+
+
+def _db_size():
+    """DB 파일과 WAL 파일의 디스크 크기 합"""
+    total = 0
+    for path in (DB_PATH, DB_PATH + "-wal"):
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _migrate(conn):
+    """기존 DB를 현재 스키마로 변환 (1회). 텍스트 압축, 크기 컬럼, 점진적 auto-vacuum 적용.
+
+    변환했으면 재압축 + VACUUM 전후 디스크 크기 {"before_bytes", "after_bytes"}를, 이미 최신이면 None을 반환한다.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return None
+
+    before = _db_size()
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(history)")}
+    with conn:
+        if "size" not in columns:
+            conn.execute("ALTER TABLE history ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+        # 이전 FTS 인덱스는 평문 컬럼을 직접 참조하므로 다시 만든다
+        for trigger in ("history_fts_ai", "history_fts_ad", "history_fts_au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute("DROP TABLE IF EXISTS history_fts")
+
+        cursor = conn.execute("SELECT id, src_text, tgt_text FROM history")
+        while True:
+            rows = cursor.fetchmany(500)
+            if not rows:
+                break
+            updates = []
+            for entry_id, src_text, tgt_text in rows:
+                src_value, src_size = _encode(_decode(src_text))
+                tgt_value, tgt_size = _encode(_decode(tgt_text))
+                updates.append((src_value, tgt_value, src_size + tgt_size, entry_id))
+            conn.executemany(
+                "UPDATE history SET src_text = ?, tgt_text = ?, size = ? WHERE id = ?", updates
+            )
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+    conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return {"before_bytes": before, "after_bytes": _db_size()}
+
+
+_fts_enabled = False
+
+
+def _setup_fts(conn):
+    """검색용 FTS5 인덱스(trigram - 한중일 부분 문자열 검색 가능) 준비.
+
+    압축된 값을 풀어 주는 history_plain 뷰를 외부 콘텐츠로 사용한다.
+    인덱스가 새로 만들어지면 기존 항목으로 채운다.
+    """
+    global _fts_enabled
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history_fts'"
+    ).fetchone()
     try:
-        if search:
+        with conn:
+            conn.execute("""
+                CREATE VIEW IF NOT EXISTS history_plain AS
+                SELECT id, history_text(src_text) AS src_text, history_text(tgt_text) AS tgt_text
+                FROM history
+            """)
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                    src_text, tgt_text,
+                    content='history_plain', content_rowid='id', tokenize='trigram'
+                )
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS history_fts_ai AFTER INSERT ON history BEGIN
+                    INSERT INTO history_fts(rowid, src_text, tgt_text)
+                    VALUES (new.id, history_text(new.src_text), history_text(new.tgt_text));
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS history_fts_ad AFTER DELETE ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, src_text, tgt_text)
+                    VALUES ('delete', old.id, history_text(old.src_text), history_text(old.tgt_text));
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS history_fts_au AFTER UPDATE ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, src_text, tgt_text)
+                    VALUES ('delete', old.id, history_text(old.src_text), history_text(old.tgt_text));
+                    INSERT INTO history_fts(rowid, src_text, tgt_text)
+                    VALUES (new.id, history_text(new.src_text), history_text(new.tgt_text));
+                END
+            """)
+            if not exists:
+                # 기존 DB 마이그레이션: 이미 있는 항목으로 인덱스 생성
+                conn.execute("INSERT INTO history_fts(history_fts) VALUES ('rebuild')")
+        _fts_enabled = True
+    except sqlite3.OperationalError:
+        # FTS5/trigram을 지원하지 않는 SQLite (3.34 미만) - LIKE 검색으로 동작
+        _fts_enabled = False
+
+
+# ── 백그라운드 쓰기 ──
+
+def _ensure_writer():
+    global _writer
+    with _lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_writer_loop, daemon=True)
+            _writer.start()
+
+
+def _writer_loop():
+    global _on_ready
+    if not _ready.is_set():
+        _open()
+        with _lock:
+            on_ready, _on_ready = _on_ready, None
+        if on_ready:
+            on_ready()
+    while True:
+        item = _queue.get()
+        batch = [item]
+        # 짧게 기다리며 뒤따르는 항목을 모아 한 번에 커밋
+        while len(batch) < HISTORY_WRITE_BATCH:
+            try:
+                batch.append(_queue.get(timeout=HISTORY_WRITE_DELAY))
+            except queue.Empty:
+                break
+        try:
+            _write_batch([b for b in batch if b is not None])
+        finally:
+            for _ in batch:
+                _queue.task_done()
+        if None in batch:
+            return
+
+
+def _write_batch(batch):
+    """작업들을 한 트랜잭션으로 커밋하고 각 on_done(결과)를 호출한다.
+
+    결과는 추가면 entry_id, 삭제면 지운 행 수. 실패하면 오류를 출력하고 HISTORY_WRITE_RETRIES번까지
+    다시 시도한 뒤, 그래도 안 되면 on_done(None)을 호출한다.
+    """
+    if not batch:
+        return
+    for attempt in range(HISTORY_WRITE_RETRIES + 1):
+        try:
+            done = _apply_batch(batch)
+            break
+        except sqlite3.Error:
+            traceback.print_exc()
+            if attempt < HISTORY_WRITE_RETRIES:
+                time.sleep(HISTORY_WRITE_DELAY)
+    else:
+        print(f"히스토리 작업 {len(batch)}개를 저장하지 못했습니다", file=sys.stderr)
+        done = [(on_done, None) for _, _, on_done in batch]
+    for on_done, result in done:
+        if on_done:
+            on_done(result)
+
+
+def _apply_batch(batch):
+    """Returns: [(on_done, 결과)]. sqlite3.Error면 트랜잭션은 롤백된다."""
+    global _inserts_since_prune
+    done = []
+    inserts = sum(1 for op, _, _ in batch if op == "insert")
+    prune = _inserts_since_prune + inserts >= HISTORY_PRUNE_INTERVAL
+    vacuum = False
+    conn = _connect()
+    with conn:
+        for op, value, on_done in batch:
+            if op == "insert":
+                src_text, tgt_text, src_lang, tgt_lang, model = value
+                src_value, src_size = _encode(src_text)
+                tgt_value, tgt_size = _encode(tgt_text)
+                cur = conn.execute(
+                    "INSERT INTO history (src_text, tgt_text, src_lang, tgt_lang, model, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (src_value, tgt_value, src_lang, tgt_lang, model, src_size + tgt_size),
+                )
+                done.append((on_done, cur.lastrowid))
+            elif op == "delete":
+                done.append((on_done, conn.execute("DELETE FROM history WHERE id = ?", (value,)).rowcount))
+            else:  # delete_all
+                done.append((on_done, conn.execute("DELETE FROM history").rowcount))
+                vacuum = True
+        if prune:
+            vacuum = _prune(conn) or vacuum
+    # 커밋된 뒤에만 센다 (롤백 후 다시 시도할 때 두 번 세지 않도록)
+    _inserts_since_prune = 0 if prune else _inserts_since_prune + inserts
+    if vacuum:
+        conn.execute("PRAGMA incremental_vacuum")
+    return done
+
+
+def _prune(conn):
+    """보관 한도(개수/총 크기/기간)를 넘는 오래된 항목 삭제. 삭제가 있었으면 True."""
+    max_entries, max_bytes, max_age_days = _limits
+    cutoff = None
+    if max_entries:
+        row = conn.execute(
+            "SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?", (max_entries,)
+        ).fetchone()
+        if row is not None:
+            cutoff = row[0]
+    if max_bytes:
+        # 최신 항목부터 크기를 누적해 한도를 처음 넘는 항목 이하를 삭제
+        row = conn.execute(
+            "SELECT id FROM (SELECT id, SUM(size) OVER (ORDER BY id DESC) AS total FROM history) "
+            "WHERE total > ? ORDER BY id DESC LIMIT 1",
+            (max_bytes,),
+        ).fetchone()
+        if row is not None:
+            cutoff = max(cutoff or 0, row[0])
+
+    deleted = 0
+    if cutoff is not None:
+        deleted += conn.execute("DELETE FROM history WHERE id <= ?", (cutoff,)).rowcount
+    if max_age_days:
+        deleted += conn.execute(
+            "DELETE FROM history WHERE created_at < datetime('now', ?)",
+            (f"-{int(max_age_days)} days",),
+        ).rowcount
+    return deleted > 0
+
+
+def add_entry(src_text, tgt_text, src_lang, tgt_lang, model, on_done=None):
+    """항목 추가를 쓰기 스레드에 맡기고 바로 반환. 커밋 후 on_done(entry_id)를 쓰기 스레드에서 호출.
+
+    저장하지 못하면 on_done(None)을 호출한다.
+    """
+    _ensure_writer()
+    _queue.put(("insert", (src_text, tgt_text, src_lang, tgt_lang, model), on_done))
+
+
+def flush():
+    """대기 중인 쓰기가 모두 커밋될 때까지 대기"""
+    _queue.join()
+
+
+def close():
+    """쓰기 스레드를 마무리하고 연결 종료 (앱 종료 시)"""
+    global _conn, _reader, _open_error, _writer
+    if _writer is not None and _writer.is_alive():
+        _queue.put(None)
+        _writer.join()
+    _writer = None
+    with _lock, _read_lock:
+        for conn in (_conn, _reader):
+            if conn is not None:
+                conn.close()
+        _conn = _reader = None
+        _open_error = None
+        _ready.clear()
+
+
+def stats():
+    """항목 수, 저장된 텍스트 크기 합, 디스크 크기, 이번 실행의 마이그레이션 전후 크기 (없으면 None)"""
+    flush()
+    with _read_lock:
+        count, stored = _connect(reader=True).execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM history"
+        ).fetchone()
+    return {"entries": count, "stored_bytes": stored, "disk_bytes": _db_size(), "migration": _migration}
+
+
+# ── 조회 / 삭제 ──
+
+_ENTRY_COLUMNS = (
+    "h.id, history_text(h.src_text) AS src_text, history_text(h.tgt_text) AS tgt_text, "
+    "h.src_lang, h.tgt_lang, h.model, h.created_at"
+)
+
+# 압축된 값은 임계값 이상 크기이므로 항상 미리보기 길이보다 길다
+_SUMMARY_COLUMNS = (
+    "h.id, substr(history_text(h.src_text), 1, :preview) AS preview, "
+    "(typeof(h.src_text) = 'blob' OR length(h.src_text) > :preview) AS truncated, "
+    "h.src_lang, h.tgt_lang, h.model, h.created_at"
+)
+
+
+def get_page(search="", offset=0, limit=HISTORY_PAGE_SIZE, before_id=None):
+    """목록 표시용 요약(id, 미리보기, 메타데이터)을 한 페이지 조회. 전체 텍스트는 읽지 않는다.
+
+    검색어가 없으면 before_id보다 작은 id를 최신순으로(키셋 페이지네이션),
+    있으면 관련도순으로 offset부터 가져온다. 색인을 쓸 수 없는 검색어는 최근 항목에서만 찾는다.
+    """
+    params = {"preview": HISTORY_PREVIEW_LENGTH, "limit": limit, "offset": offset}
+    with _read_lock:
+        conn = _connect(reader=True)
+        if search and not recent_only(search):
+            start, end = HISTORY_SNIPPET_MARKERS
+            params.update(start=start, end=end, tokens=HISTORY_SNIPPET_TOKENS, query=_fts_phrase(search))
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS}, "
+                "snippet(history_fts, -1, :start, :end, '…', :tokens) AS snippet "
+                "FROM history_fts JOIN history h ON h.id = history_fts.rowid "
+                "WHERE history_fts MATCH :query "
+                "ORDER BY bm25(history_fts), h.id DESC LIMIT :limit OFFSET :offset",
+                params,
+            ).fetchall()
+        elif search:
+            # 모든 행을 풀어 비교하지 않도록 최근 HISTORY_SHORT_SEARCH_WINDOW개 id 범위로 제한
+            params.update(like=f"%{search}%", window=HISTORY_SHORT_SEARCH_WINDOW)
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM history h "
+                "WHERE h.id > (SELECT COALESCE(MAX(id), 0) FROM history) - :window "
+                "AND (history_text(h.src_text) LIKE :like OR history_text(h.tgt_text) LIKE :like) "
+                "ORDER BY h.id DESC LIMIT :limit OFFSET :offset",
+                params,
+            ).fetchall()
+        elif before_id is not None:
+            params["before"] = before_id
             rows = conn.execute(
-                "SELECT * FROM history "
-                "WHERE src_text LIKE ? OR tgt_text LIKE ? "
-                "ORDER BY id DESC",
-                (f"%{search}%", f"%{search}%"),
+                f"SELECT {_SUMMARY_COLUMNS} FROM history h "
+                "WHERE h.id < :before ORDER BY h.id DESC LIMIT :limit",
+                params,
             ).fetchall()
         else:
             rows = conn.execute(
-                "SELECT * FROM history ORDER BY id DESC"
+                f"SELECT {_SUMMARY_COLUMNS} FROM history h ORDER BY h.id DESC LIMIT :limit",
+                params,
             ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
-def delete_entry(entry_id):
-    conn = _connect()
-    try:
-        conn.execute("DELETE FROM history WHERE id = ?", (entry_id,))
-        conn.commit()
-    finally:
-        conn.close()
+def recent_only(search):
+    """검색어가 색인(FTS5 trigram, 3글자 이상)을 쓸 수 없어 최근 항목에서만 찾는지"""
+    return bool(search) and not (_fts_enabled and len(search) >= 3)
 
 
-def delete_all():
-    conn = _connect()
-    try:
-        conn.execute("DELETE FROM history")
-        conn.commit()
-    finally:
-        conn.close()
+def get_entry(entry_id):
+    """항목 하나의 전체 내용 조회 (없으면 None)"""
+    with _read_lock:
+        row = _connect(reader=True).execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM history h WHERE h.id = ?", (entry_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+
+def _fts_phrase(search):
+    """검색어를 FTS5 구문 문자열로 감싸 특수 문자가 연산자로 해석되지 않게 한다"""
+    return '"' + search.replace('"', '""') + '"'
+
+
+def delete_entry(entry_id, on_done=None):
+    """항목 삭제를 쓰기 스레드에 맡기고 바로 반환. 커밋 후 on_done(지운 행 수), 실패하면 on_done(None)."""
+    _ensure_writer()
+    _queue.put(("delete", entry_id, on_done))
+
+
+def delete_all(on_done=None):
+    """전체 삭제를 쓰기 스레드에 맡기고 바로 반환 (앞서 맡긴 추가도 함께 지워진다).
+
+    커밋 후 on_done(지운 행 수), 실패하면 on_done(None)을 쓰기 스레드에서 호출한다.
+    """
+    _ensure_writer()
+    _queue.put(("delete_all", None, on_done))
+
+
+if __name__ == "__main__":
+    # 마이그레이션 실행 및 현재 저장소 크기 보고
+    info = stats()
+    if info["migration"]:
+        print(f"마이그레이션 완료: {info['migration']['before_bytes'] / 1024:.1f} KB → "
+              f"{info['migration']['after_bytes'] / 1024:.1f} KB")
+    print(f"항목 {info['entries']}개, 저장 텍스트 {info['stored_bytes'] / 1024:.1f} KB, "
+          f"디스크 {info['disk_bytes'] / 1024:.1f} KB")
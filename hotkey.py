@@ -1,19 +1,65 @@
-"""글로벌 핫키 리스너 - Ctrl+C / Cmd+C 두 번 감지"""
+"""글로벌 핫키 리스너 - Ctrl+C / Cmd+C 두 번 감지
 
-import time
+사용자가 치는 모든 키 입력마다 불리는 경로이므로 콜백은 정수 비교만 하고 바로 돌아간다. 비교할 키(Ctrl,
+C)는 리스너를 시작할 때 한 번만 구하고, Ctrl 상태는 키코드별 비트로 추적한다. Linux(X11)에서는 pynput이
+이벤트마다 하는 KeySym 조회와 Key/KeyCode 객체 생성을 건너뛰고 원시 키코드로 판단한다.
+stats()는 처리한 이벤트 수와 콜백에서 쓴 시간을 돌려준다 (bench/bench_hotkey.py).
+"""
+
+import traceback
+from time import monotonic, perf_counter_ns
 
 from constants import IS_MACOS, MACOS_KEY_C, DOUBLE_PRESS_INTERVAL
 
 if IS_MACOS:
     import Quartz
 
+_NEVER = float("-inf")
+
+
+def _x11_listener_class(base):
+    """pynput X11 Listener를 원시 키코드로 HotkeyListener에 바로 넘기도록 바꾼 하위 클래스
+
+    pynput 1.8부터 있는 내부 메서드 _handle_message를 덮어쓰므로 base가 그 메서드를 정의할 때만 쓴다
+    (_start_linux). 키코드는 리스너를 시작할 때 한 번만 구하며, 이후 키보드 매핑이 바뀌어도(xmodmap,
+    다른 배치의 자판 연결 등) 다시 구하지 않는다 - 앱을 다시 시작해야 반영된다.
+    """
+    from Xlib import X, XK
+
+    key_press, shift_mask = X.KeyPress, X.ShiftMask
+
+    class X11Listener(base):
+        def __init__(self, owner):
+            super().__init__()
+            self._owner = owner
+            self._key_event = owner._key_event
+
+        def _initialize(self, display):
+            super()._initialize(display)
+            # 키보드 배치마다 다르므로 리스너 스레드가 이벤트를 받기 전에 X 서버에 한 번만 묻는다
+            def keycodes(*keysyms):
+                return [code for keysym in keysyms for code, _ in display.keysym_to_keycodes(keysym)]
+            self._owner._set_keys(keycodes(XK.XK_Control_L, XK.XK_Control_R), keycodes(XK.XK_c))
+
+        def _handle_message(self, display, event, injected):
+            # Shift와 함께 누른 C는 이전처럼 무시 (pynput에서는 'C'로 들어왔음)
+            self._key_event(event.detail, event.type == key_press, event.state & shift_mask)
+
+    return X11Listener
+
 
 class HotkeyListener:
     """복사 단축키 더블 프레스를 감지하여 콜백을 호출하는 리스너"""
 
-    def __init__(self, on_double_copy):
+    def __init__(self, on_double_copy, on_first_copy=None):
         self.on_double_copy = on_double_copy
-        self.last_copy_time = 0
+        self.on_first_copy = on_first_copy
+        self.last_copy_time = _NEVER
+        self.events = 0        # 처리한 키 이벤트 수
+        self.callback_ns = 0   # 이벤트 콜백에서 쓴 시간 합계
+        self._ctrl_bits = {}   # Ctrl 키 → 눌림 상태 비트
+        self._copy_keys = frozenset()
+        self._ctrl_mask = 0
 
     def start(self):
         if IS_MACOS:
@@ -27,6 +73,29 @@ class HotkeyListener:
         else:
             self._stop_linux()
 
+    def stats(self):
+        """처리한 키 이벤트 수와 콜백에서 쓴 시간"""
+        events, elapsed = self.events, self.callback_ns
+        return {
+            "events": events,
+            "callback_ms": elapsed / 1e6,
+            "per_event_us": elapsed / events / 1000 if events else 0.0,
+        }
+
+    def _copy_pressed(self, now):
+        """복사 단축키 입력 - 이전 입력과 DOUBLE_PRESS_INTERVAL 안이면 더블 프레스"""
+        if now - self.last_copy_time < DOUBLE_PRESS_INTERVAL:
+            self.last_copy_time = _NEVER
+            self.on_double_copy()
+        else:
+            self.last_copy_time = now
+            self._notify_first_copy()
+
+    def _notify_first_copy(self):
+        """더블 프레스의 첫 번째 입력 알림 - 콜백은 즉시 반환해야 함 (무거운 작업은 스레드로)"""
+        if self.on_first_copy:
+            self.on_first_copy()
+
     # ── macOS: Quartz CGEventTap (메인 RunLoop에서 실행) ──
 
     def _start_macos(self):
@@ -55,6 +124,7 @@ class HotkeyListener:
         Quartz.CGEventTapEnable(self._tap, True)
 
     def _cg_event_callback(self, proxy, event_type, event, refcon):
+        started = perf_counter_ns()
         try:
             if event_type == Quartz.kCGEventFlagsChanged:
                 flags = Quartz.CGEventGetFlags(event)
@@ -64,14 +134,11 @@ class HotkeyListener:
                     event, Quartz.kCGKeyboardEventKeycode
                 )
                 if keycode == MACOS_KEY_C:
-                    now = time.time()
-                    if now - self.last_copy_time < DOUBLE_PRESS_INTERVAL:
-                        self.last_copy_time = 0
-                        self.on_double_copy()
-                    else:
-                        self.last_copy_time = now
+                    self._copy_pressed(monotonic())
         except Exception:
-            pass
+            traceback.print_exc()
+        self.events += 1
+        self.callback_ns += perf_counter_ns() - started
         return event
 
     def _stop_macos(self):
@@ -82,37 +149,48 @@ class HotkeyListener:
 
     def _start_linux(self):
         from pynput import keyboard
-        self._ctrl_pressed = False
-        self._listener = keyboard.Listener(
-            on_press=self._on_press_linux,
-            on_release=self._on_release_linux
-        )
+        self._ctrl_mask = 0
+        if keyboard.Listener.__module__.endswith("._xorg") and "_handle_message" in vars(keyboard.Listener):
+            # 키코드는 리스너 스레드에서 X 서버에 물어 정한다 (X11Listener._initialize)
+            self._listener = _x11_listener_class(keyboard.Listener)(self)
+        else:
+            # 다른 백엔드(uinput 등)나 _handle_message가 없는 pynput 1.7은 공개 콜백으로 받아 Key 객체와 문자로 비교
+            self._set_keys((keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r), ("c",))
+            self._listener = keyboard.Listener(
+                on_press=self._on_press_pynput,
+                on_release=self._on_release_pynput
+            )
         self._listener.daemon = True
         self._listener.start()
 
-    def _on_press_linux(self, key):
-        from pynput import keyboard
+    def _set_keys(self, ctrl_keys, copy_keys):
+        """비교할 키를 정한다. Ctrl 키마다 비트를 따로 두어 양쪽 Ctrl을 함께 눌렀다 하나만 떼도 눌린 상태로 본다."""
+        self._ctrl_bits = {key: 1 << i for i, key in enumerate(ctrl_keys)}
+        self._copy_keys = frozenset(copy_keys)
+
+    def _key_event(self, key, pressed, shifted=0):
+        """키 이벤트 하나 처리 (리스너 스레드). key는 X11 키코드 또는 pynput Key/문자."""
+        started = perf_counter_ns()
         try:
-            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                self._ctrl_pressed = True
-                return
-            if hasattr(key, 'char') and key.char == 'c' and self._ctrl_pressed:
-                now = time.time()
-                if now - self.last_copy_time < DOUBLE_PRESS_INTERVAL:
-                    self.last_copy_time = 0
-                    self.on_double_copy()
+            bit = self._ctrl_bits.get(key)
+            if bit:
+                if pressed:
+                    self._ctrl_mask |= bit
                 else:
-                    self.last_copy_time = now
+                    self._ctrl_mask &= ~bit
+            elif pressed and self._ctrl_mask and not shifted and key in self._copy_keys:
+                self._copy_pressed(monotonic())
         except Exception:
-            pass
+            traceback.print_exc()
+        self.events += 1
+        self.callback_ns += perf_counter_ns() - started
 
-    def _on_release_linux(self, key):
-        from pynput import keyboard
-        try:
-            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                self._ctrl_pressed = False
-        except Exception:
-            pass
+    def _on_press_pynput(self, key):
+        # KeyCode는 문자로, Key(특수 키)와 None은 그대로 비교
+        self._key_event(getattr(key, "char", key), True)
+
+    def _on_release_pynput(self, key):
+        self._key_event(getattr(key, "char", key), False)
 
     def _stop_linux(self):
         if hasattr(self, '_listener'):
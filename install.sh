@@ -1,8 +1,23 @@
 #!/bin/bash
 # CC2Translate 설치 스크립트 (Linux / macOS)
+#
+#   ./install.sh [--onedir | --onefile]
+#
+# Linux 기본 빌드(--onefile)는 실행할 때마다 임시 디렉터리에 압축을 풀어 시작이 느리다.
+# --onedir은 풀린 디렉터리를 그대로 설치해 바로 실행한다. 선택한 방식은 config.json에 저장되어
+# 앱 안에서 업데이트할 때도 유지된다. (macOS는 항상 .app 번들 디렉터리)
 
 set -e
 
+PACKAGE_MODE=""
+for arg in "$@"; do
+    case "$arg" in
+        --onedir)  PACKAGE_MODE="onedir";;
+        --onefile) PACKAGE_MODE="onefile";;
+        *)         echo "알 수 없는 옵션: $arg (사용법: ./install.sh [--onedir | --onefile])"; exit 1;;
+    esac
+done
+
 echo "==================================="
 echo "  CC2Translate 설치"
 echo "==================================="
@@ -31,6 +46,13 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 INSTALL_DIR="$HOME/.local/share/cc2translate"
 BIN_DIR="$HOME/.local/bin"
 APP_DIR="$HOME/Applications"
+CONFIG_FILE="$INSTALL_DIR/config.json"
+
+# 옵션이 없으면 이전 설치 방식 유지
+if [ -z "$PACKAGE_MODE" ] && [ -f "$CONFIG_FILE" ]; then
+    PACKAGE_MODE=$(python3 -c "import json; print(json.load(open('$CONFIG_FILE')).get('package_mode', ''))" 2>/dev/null || true)
+fi
+PACKAGE_MODE="${PACKAGE_MODE:-onefile}"
 
 # Python 확인
 echo -e "${YELLOW}[1/5]${NC} Python 확인 중..."
@@ -80,9 +102,10 @@ if [ "$OS" = "macos" ]; then
         python3 -m PyInstaller --windowed --name CC2Translate --osx-bundle-identifier com.cc2translate.app --add-data "version.txt:." main.py
     }
 else
-    # Linux
+    # Linux (onefile: 단일 실행 파일 / onedir: 압축을 풀어 둔 디렉터리)
+    echo "      패키징 방식: $PACKAGE_MODE"
     python3 -m PyInstaller \
-        --onefile \
+        --$PACKAGE_MODE \
         --windowed \
         --name cc2translate \
         --add-data "version.txt:." \
@@ -90,7 +113,7 @@ else
         --noconfirm \
         main.py 2>/dev/null || {
         echo -e "${YELLOW}상세 로그로 재시도...${NC}"
-        python3 -m PyInstaller --onefile --windowed --name cc2translate --add-data "version.txt:." main.py
+        python3 -m PyInstaller --$PACKAGE_MODE --windowed --name cc2translate --add-data "version.txt:." main.py
     }
 fi
 echo -e "      ${GREEN}바이너리 빌드 완료${NC}"
@@ -112,7 +135,15 @@ if [ "$OS" = "macos" ]; then
     # CLI에서도 실행 가능하도록 심볼릭 링크
     ln -sf "$APP_DIR/CC2Translate.app/Contents/MacOS/CC2Translate" "$BIN_DIR/cc2translate"
 else
-    cp "$SCRIPT_DIR/dist/cc2translate" "$BIN_DIR/"
+    # 이전 설치가 다른 방식이었을 수 있으므로 둘 다 정리 (심볼릭 링크에 복사하면 링크 대상을 덮어씀)
+    rm -f "$BIN_DIR/cc2translate"
+    rm -rf "$INSTALL_DIR/app"
+    if [ "$PACKAGE_MODE" = "onedir" ]; then
+        cp -R "$SCRIPT_DIR/dist/cc2translate" "$INSTALL_DIR/app"
+        ln -sf "$INSTALL_DIR/app/cc2translate" "$BIN_DIR/cc2translate"
+    else
+        cp "$SCRIPT_DIR/dist/cc2translate" "$BIN_DIR/"
+    fi
 fi
 chmod +x "$BIN_DIR/cc2translate"
 echo -e "      ${GREEN}프로그램 설치 완료${NC}"
@@ -138,10 +169,9 @@ EOF
     echo -e "      ${GREEN}앱 메뉴 등록 완료${NC}"
 fi
 
-# 소스 repo 경로를 config.json에 저장
-CONFIG_FILE="$INSTALL_DIR/config.json"
+# 소스 repo 경로와 패키징 방식을 config.json에 저장
 if [ -f "$CONFIG_FILE" ]; then
-    # 기존 config가 있으면 repo_path만 업데이트
+    # 기존 config가 있으면 repo_path/package_mode만 업데이트
     python3 -c "
 import json
 try:
@@ -150,12 +180,13 @@ try:
 except (FileNotFoundError, json.JSONDecodeError):
     config = {}
 config['repo_path'] = '$SCRIPT_DIR'
+config['package_mode'] = '$PACKAGE_MODE'
 with open('$CONFIG_FILE', 'w') as f:
     json.dump(config, f, indent=2)
 "
 else
     mkdir -p "$INSTALL_DIR"
-    echo "{\"repo_path\": \"$SCRIPT_DIR\"}" > "$CONFIG_FILE"
+    echo "{\"repo_path\": \"$SCRIPT_DIR\", \"package_mode\": \"$PACKAGE_MODE\"}" > "$CONFIG_FILE"
 fi
 
 # 빌드 파일 정리
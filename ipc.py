@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""실행 중인 CC2Translate에 번역을 요청하는 로컬 소켓 프로토콜과 클라이언트 (Qt 불필요)
+
+    echo "Hello" | python3 ipc.py -t Korean
+    python3 ipc.py -t Japanese -m deepl-free --stream "Good morning"
+
+단일 인스턴스용 QLocalServer 소켓(APP_ID)에 4바이트 빅엔디언 길이 + UTF-8 JSON 메시지를 주고받는다.
+
+    요청  {"id": 1, "type": "translate", "text": "...", "src": "auto", "tgt": "Korean", "model": null, "stream": false}
+          {"id": 1, "type": "cancel"} / {"type": "activate"} / {"id": 2, "type": "ping"}
+    응답  {"id": 1, "type": "partial", "text": "..."}   (stream이 true이고 스트리밍을 지원하는 모델일 때)
+          {"id": 1, "type": "result", "translation": "...", "cached": false, "model": "..."}
+          {"id": 1, "type": "error", "error": "..."} / {"id": 2, "type": "pong"}
+
+한 연결에서 id가 다른 요청을 여러 개 동시에 보낼 수 있고 응답은 끝나는 순서대로 온다.
+아무 메시지 없이 연결을 닫으면 이전처럼 창을 활성화한다.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import struct
+import sys
+
+from constants import APP_ID, IPC_MAX_MESSAGE_BYTES, IPC_CLIENT_TIMEOUT
+
+_HEADER = struct.Struct(">I")
+
+
+class IPCError(Exception):
+    pass
+
+
+def socket_path():
+    """QLocalServer가 만드는 유닉스 소켓 경로 (Qt의 QDir::tempPath() + 서버 이름)"""
+    override = os.environ.get("CC2TRANSLATE_SOCKET")
+    if override:
+        return override
+    temp_dir = (os.environ.get("TMPDIR") or "/tmp").rstrip("/") or "/"
+    return os.path.join(temp_dir, APP_ID)
+
+
+def encode_message(message):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    if len(body) > IPC_MAX_MESSAGE_BYTES:
+        raise IPCError(f"메시지가 너무 큽니다 ({len(body):,}바이트)")
+    return _HEADER.pack(len(body)) + body
+
+
+def decode_frames(buffer, limit=None):
+    """buffer(bytearray) 앞쪽의 완전한 메시지를 최대 limit개 꺼내 반환. 남은 조각은 buffer에 그대로 둔다."""
+    messages = []
+    offset = 0
+    while len(buffer) - offset >= _HEADER.size and (limit is None or len(messages) < limit):
+        (length,) = _HEADER.unpack_from(buffer, offset)
+        if length > IPC_MAX_MESSAGE_BYTES:
+            raise IPCError(f"메시지가 너무 큽니다 ({length:,}바이트)")
+        end = offset + _HEADER.size + length
+        if len(buffer) < end:
+            break
+        try:
+            messages.append(json.loads(bytes(buffer[offset + _HEADER.size:end]).decode("utf-8")))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise IPCError(f"잘못된 메시지: {e}") from None
+        offset = end
+    del buffer[:offset]
+    return messages
+
+
+class Client:
+    """실행 중인 앱에 연결하는 동기 클라이언트"""
+
+    def __init__(self, path=None, timeout=IPC_CLIENT_TIMEOUT):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(path or socket_path())
+        except OSError as e:
+            self._sock.close()
+            raise IPCError(f"CC2Translate가 실행 중이 아닙니다 ({e})") from None
+        self._buffer = bytearray()
+        self._inbox = []
+        self._ids = itertools.count(1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._sock.close()
+
+    def send(self, message):
+        self._sock.sendall(encode_message(message))
+
+    def receive(self):
+        """다음 응답 메시지 (연결이 끊기면 IPCError)"""
+        while not self._inbox:
+            try:
+                data = self._sock.recv(65536)
+            except socket.timeout:
+                raise IPCError("응답 시간 초과") from None
+            if not data:
+                raise IPCError("연결이 끊어졌습니다")
+            self._buffer += data
+            self._inbox.extend(decode_frames(self._buffer))
+        return self._inbox.pop(0)
+
+    def translate(self, text, tgt_lang, src_lang="auto", model=None, on_partial=None):
+        """번역 결과 dict {translation, cached, model} 반환. on_partial이 있으면 스트리밍 조각 전달."""
+        request_id = next(self._ids)
+        self.send({"id": request_id, "type": "translate", "text": text, "src": src_lang, "tgt": tgt_lang,
+                   "model": model, "stream": on_partial is not None})
+        while True:
+            message = self.receive()
+            if message.get("id") != request_id:
+                continue
+            if message["type"] == "partial":
+                on_partial(message["text"])
+            elif message["type"] == "result":
+                return message
+            else:
+                raise IPCError(message.get("error") or "번역 실패")
+
+    def ping(self):
+        request_id = next(self._ids)
+        self.send({"id": request_id, "type": "ping"})
+        while True:
+            message = self.receive()
+            if message.get("id") == request_id:
+                return message
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("text", nargs="*", help="번역할 텍스트 (없으면 표준 입력)")
+    parser.add_argument("-t", "--target", default="Korean", help="대상 언어 (기본: Korean)")
+    parser.add_argument("-s", "--source", default="auto", help="원본 언어 (기본: 자동 감지)")
+    parser.add_argument("-m", "--model", help="모델 (기본: 앱에서 선택된 모델)")
+    parser.add_argument("--stream", action="store_true", help="부분 번역을 도착하는 대로 출력")
+    args = parser.parse_args()
+
+    text = " ".join(args.text) if args.text else sys.stdin.read()
+    if not text.strip():
+        parser.error("번역할 텍스트가 없습니다")
+    try:
+        with Client() as client:
+            streamed = []
+
+            def _emit_partial(chunk):
+                streamed.append(chunk)
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+
+            on_partial = _emit_partial if args.stream else None
+            result = client.translate(text, args.target, args.source, args.model, on_partial)
+    except (IPCError, OSError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    if "".join(streamed) != result["translation"]:
+        if streamed:
+            sys.stdout.write("\n")
+        sys.stdout.write(result["translation"])
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
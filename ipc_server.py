@@ -0,0 +1,240 @@
+"""단일 인스턴스 소켓으로 들어오는 번역 요청 처리 (프로토콜은 ipc.py 참고)
+
+소켓 읽기/쓰기는 모두 Qt 메인 스레드에서 하고, 번역은 요청마다 데몬 스레드에서 실행해
+결과를 시그널로 메인 스레드에 돌려준다. 클라이언트별로 진행 중인 번역이 IPC_MAX_INFLIGHT개면 새 번역
+요청은 자리가 날 때까지 보류하되 cancel/ping 같은 제어 메시지는 계속 읽어 처리한다. 보류한 요청도
+IPC_MAX_INFLIGHT개가 되거나 보내지 못한 응답이 IPC_MAX_PENDING_WRITE를 넘으면 그 클라이언트의 메시지를
+더 읽지 않는다 (읽기 버퍼가 차면 클라이언트의 쓰기가 막힘). 밀린 동안 도착한 스트리밍 조각은 합쳐서 보낸다.
+"""
+
+import collections
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import ipc
+import translator
+from constants import LANGUAGE_NAMES, ALL_MODELS, IPC_MAX_INFLIGHT, IPC_MAX_PENDING_WRITE, IPC_READ_BUFFER
+
+
+class _Connection:
+    """클라이언트 연결 하나의 상태 (메인 스레드에서만 접근)"""
+
+    def __init__(self, socket):
+        self.socket = socket
+        self.buffer = bytearray()
+        self.requests = {}   # 요청 id → CancelToken
+        self.held = collections.deque()  # 진행 중인 번역이 가득 차서 보류한 translate 메시지
+        self.partials = {}   # 요청 id → 아직 보내지 못한 스트리밍 조각
+        self.received = False
+        self.closed = False
+
+    @property
+    def full(self):
+        """새 번역을 시작할 자리가 없음"""
+        return len(self.requests) >= IPC_MAX_INFLIGHT
+
+    @property
+    def paused(self):
+        """메시지를 더 읽지 않음 (보류한 요청도 가득 찼거나 클라이언트가 응답을 읽지 않음)"""
+        return (len(self.held) >= IPC_MAX_INFLIGHT
+                or self.socket.bytesToWrite() > IPC_MAX_PENDING_WRITE)
+
+
+class TranslationService(QObject):
+    """QLocalServer에 붙어 번역 요청을 처리한다.
+
+    on_activate: 빈 연결이나 activate 메시지를 받으면 호출 (창 활성화)
+    default_model: 요청에 모델이 없을 때 사용할 모델 id를 반환
+    """
+
+    _reply = pyqtSignal(object, object, object)  # connection, request id, message
+
+    def __init__(self, server, on_activate, default_model):
+        super().__init__()
+        self._server = server
+        self._on_activate = on_activate
+        self._default_model = default_model
+        self._connections = set()
+        self._reply.connect(self._on_reply)
+        server.newConnection.connect(self._on_new_connection)
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.setReadBufferSize(IPC_READ_BUFFER)
+            conn = _Connection(socket)
+            self._connections.add(conn)
+            socket.readyRead.connect(lambda conn=conn: self._process(conn))
+            socket.bytesWritten.connect(lambda _count, conn=conn: self._on_bytes_written(conn))
+            socket.disconnected.connect(lambda conn=conn: self._on_disconnected(conn))
+
+    # ── 수신 ──
+
+    def _process(self, conn):
+        """보류한 요청을 자리가 나는 만큼 시작하고 버퍼의 완전한 메시지를 처리.
+        일시 중지 상태면 나머지는 다음 기회로 미룬다."""
+        while conn.held and not conn.full and not conn.closed:
+            message = conn.held.popleft()
+            self._start_translation(conn, message.get("id"), message)
+        while not conn.closed and not conn.paused:
+            try:
+                # 하나씩 꺼내야 요청마다 일시 중지 여부를 다시 확인할 수 있다
+                messages = ipc.decode_frames(conn.buffer, limit=1)
+            except ipc.IPCError as e:
+                # 프레임 경계를 잃었으므로 오류를 알리고 연결을 끊는다
+                self._send(conn, {"type": "error", "error": str(e)})
+                self._close(conn)
+                conn.socket.disconnectFromServer()
+                return
+            if messages:
+                conn.received = True
+                self._handle(conn, messages[0])
+                continue
+            if not conn.socket.bytesAvailable():
+                return
+            conn.buffer += bytes(conn.socket.readAll())
+
+    def _handle(self, conn, message):
+        if not isinstance(message, dict):
+            return self._send(conn, {"type": "error", "error": "메시지는 JSON 객체여야 합니다"})
+        request_id = message.get("id")
+        kind = message.get("type", "translate")
+        if kind == "activate":
+            self._on_activate()
+        elif kind == "ping":
+            self._send(conn, {"id": request_id, "type": "pong"})
+        elif kind == "cancel":
+            cancel = conn.requests.get(request_id)
+            if cancel is not None:
+                cancel.cancel()
+                return
+            for held in conn.held:
+                if held.get("id") == request_id:
+                    conn.held.remove(held)
+                    self._send(conn, {"id": request_id, "type": "error", "error": "취소됨", "cancelled": True})
+                    return
+        elif kind == "translate":
+            if conn.full:
+                conn.held.append(message)
+            else:
+                self._start_translation(conn, request_id, message)
+        else:
+            self._send(conn, {"id": request_id, "type": "error", "error": f"알 수 없는 요청입니다: {kind}"})
+
+    def _start_translation(self, conn, request_id, message):
+        def reject(error):
+            self._send(conn, {"id": request_id, "type": "error", "error": error})
+
+        if request_id in conn.requests:
+            return reject(f"이미 진행 중인 요청 id입니다: {request_id}")
+        text = message.get("text")
+        if not isinstance(text, str) or not text.strip():
+            return reject("번역할 텍스트가 없습니다")
+        src_lang = LANGUAGE_NAMES.get(message.get("src") or "auto")
+        tgt_lang = LANGUAGE_NAMES.get(message.get("tgt") or "Korean")
+        if src_lang is None or tgt_lang in (None, "auto"):
+            return reject("지원하지 않는 언어입니다")
+        model = message.get("model") or self._default_model()
+        model = ALL_MODELS.get(model, model)
+        if model not in ALL_MODELS.values():
+            return reject(f"알 수 없는 모델입니다: {model}")
+        if not translator.is_configured(model):
+            return reject(f"{model} 모델을 사용할 수 없습니다 (API 키 또는 CLI 설치 필요)")
+
+        cancel = translator.CancelToken()
+        conn.requests[request_id] = cancel
+        thread = threading.Thread(
+            target=self._run_translation,
+            args=(conn, request_id, cancel, text, src_lang, tgt_lang, model, bool(message.get("stream"))),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _run_translation(self, conn, request_id, cancel, text, src_lang, tgt_lang, model, stream):
+        def _emit_partial(chunk):
+            self._reply.emit(conn, request_id, {"type": "partial", "text": chunk})
+
+        on_partial = _emit_partial if stream else None
+        try:
+            translation, cached = translator.translate_cached(
+                text, src_lang, tgt_lang, model, on_partial=on_partial, cancel=cancel
+            )
+        except translator.TranslationCancelled:
+            reply = {"type": "error", "error": "취소됨", "cancelled": True}
+        except Exception as e:
+            reply = {"type": "error", "error": str(e)}
+        else:
+            reply = {"type": "result", "translation": translation, "cached": cached, "model": model}
+        self._reply.emit(conn, request_id, reply)
+
+    # ── 송신 ──
+
+    def _on_reply(self, conn, request_id, message):
+        if conn.closed or request_id not in conn.requests:
+            return
+        if message["type"] == "partial":
+            # 클라이언트가 응답을 읽지 않는 동안에는 조각을 합쳐 두었다가 한 번에 보낸다
+            conn.partials[request_id] = conn.partials.get(request_id, "") + message["text"]
+            if conn.socket.bytesToWrite() <= IPC_MAX_PENDING_WRITE:
+                self._flush_partials(conn)
+            return
+        self._flush_partials(conn, request_id)
+        del conn.requests[request_id]
+        self._send(conn, {"id": request_id, **message})
+        self._process(conn)
+
+    def _flush_partials(self, conn, request_id=None):
+        ids = [request_id] if request_id is not None else list(conn.partials)
+        for rid in ids:
+            text = conn.partials.pop(rid, None)
+            if text:
+                self._send(conn, {"id": rid, "type": "partial", "text": text})
+
+    def _send(self, conn, message):
+        if conn.closed:
+            return
+        try:
+            conn.socket.write(ipc.encode_message(message))
+        except ipc.IPCError as e:
+            conn.socket.write(ipc.encode_message({"id": message.get("id"), "type": "error", "error": str(e)}))
+
+    def _on_bytes_written(self, conn):
+        if conn.closed or conn.socket.bytesToWrite() > IPC_MAX_PENDING_WRITE:
+            return
+        self._flush_partials(conn)
+        self._process(conn)
+
+    def _on_disconnected(self, conn):
+        self._connections.discard(conn)
+        conn.socket.deleteLater()
+        if conn.closed:
+            return
+        # 연결 직후 보내고 바로 닫은 activate 메시지까지 처리 (남은 번역 요청은 응답할 곳이 없으므로 버림)
+        conn.buffer += bytes(conn.socket.readAll())
+        messages = self._drain(conn)
+        received = conn.received or bool(messages) or bool(conn.buffer)
+        if any(isinstance(message, dict) and message.get("type") == "activate" for message in messages):
+            self._on_activate()
+        self._close(conn)
+        if not received:
+            # 이전 버전처럼 메시지 없이 접속했다 끊으면 창 활성화 (main.is_already_running)
+            self._on_activate()
+
+    @staticmethod
+    def _close(conn):
+        """진행 중인 번역을 취소하고 이후 응답은 버린다"""
+        conn.closed = True
+        conn.buffer.clear()
+        for cancel in conn.requests.values():
+            cancel.cancel()
+        conn.requests.clear()
+        conn.held.clear()
+        conn.partials.clear()
+
+    @staticmethod
+    def _drain(conn):
+        try:
+            return ipc.decode_frames(conn.buffer)
+        except ipc.IPCError:
+            return []
@@ -1,23 +1,76 @@
 #!/usr/bin/env python3
-"""CC2Translate - Ctrl+C (macOS: Cmd+C) 두 번으로 번역하는 GUI 프로그램"""
+"""CC2Translate - Ctrl+C (macOS: Cmd+C) 두 번으로 번역하는 GUI 프로그램
 
-import sys
+    python3 main.py [--startup-profile]
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+시작 시간을 줄이기 위해 단일 인스턴스 확인은 Qt 없이 소켓으로 하고(ipc.py), PyQt5와 창 모듈(window,
+translator 등)은 확인 뒤에 import한다. 핫키 백엔드, 기록 DB, HTTP 스택은 창을 그린 뒤 준비한다
+(TranslatorWindow._finish_startup). --startup-profile은 단계별 import/초기화 시간을 출력하고 종료한다.
+"""
 
-from constants import IS_MACOS, APP_ID, SOCKET_CONNECT_TIMEOUT_MS
-from window import TranslatorWindow
+import json
+import sys
+import time
+
+_STARTED = time.perf_counter()
+
+import ipc  # noqa: E402
+from constants import IS_MACOS, APP_ID, SOCKET_CONNECT_TIMEOUT_MS  # noqa: E402
+
+# 단계 이름 → 출력 표시 이름 (각 단계는 이전 단계가 끝난 뒤부터)
+STARTUP_PHASES = {
+    "instance_probe": "실행 중인 인스턴스 확인",
+    "qt_import": "PyQt5 import",
+    "app_init": "QApplication 생성",
+    "accessibility": "손쉬운 사용 권한 확인",
+    "server_listen": "소켓 서버 시작",
+    "window_import": "창 모듈 import",
+    "window_init": "창 생성",
+    "window_show": "창 표시",
+    "first_paint": "첫 이벤트 처리 (창 그리기)",
+    "startup_delay": "나머지 초기화 대기",
+    "hotkey": "핫키 백엔드 시작",
+    "deferred_init": "기록 목록/업데이트 확인 시작",
+    "preload": "HTTP 스택 불러오기 (백그라운드)",
+}
+
+
+class StartupProfile:
+    """시작 단계별 소요 시간 (--startup-profile)"""
+
+    def __init__(self):
+        self.phases = []
+        self.window_shown_at = None
+        self._last = _STARTED
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+        if phase == "first_paint":
+            self.window_shown_at = time.time()
+
+    def report(self):
+        """사람이 읽을 표는 표준 오류로, 기계가 읽을 JSON 한 줄은 표준 출력으로"""
+        total = sum(elapsed for _, elapsed in self.phases)
+        for phase, elapsed in self.phases:
+            print(f"{STARTUP_PHASES.get(phase, phase)}: {elapsed * 1000:.1f}ms", file=sys.stderr)
+        print(f"합계 (인터프리터 시작 제외): {total * 1000:.1f}ms", file=sys.stderr)
+        print(json.dumps({
+            "phases": [{"phase": phase, "ms": round(elapsed * 1000, 2)} for phase, elapsed in self.phases],
+            "total_ms": round(total * 1000, 2),
+            "window_shown_at": self.window_shown_at,
+        }), flush=True)
 
 
 def is_already_running():
     """이미 실행 중인 인스턴스가 있는지 확인하고, 있으면 활성화 신호를 보냄"""
-    socket = QLocalSocket()
-    socket.connectToServer(APP_ID)
-    if socket.waitForConnected(SOCKET_CONNECT_TIMEOUT_MS):
-        socket.close()
+    try:
+        with ipc.Client(timeout=SOCKET_CONNECT_TIMEOUT_MS / 1000) as client:
+            client.send({"type": "activate"})
         return True
-    return False
+    except (ipc.IPCError, OSError):
+        return False
 
 
 def check_accessibility():
@@ -59,30 +112,55 @@ def check_accessibility():
 
 
 def main():
+    profiling = "--startup-profile" in sys.argv
+    startup = StartupProfile()
+
+    running = is_already_running()
+    startup.mark("instance_probe")
+    if running:
+        if profiling:
+            startup.report()
+        print("CC2Translate가 이미 실행 중입니다.")
+        sys.exit(0)
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtNetwork import QLocalServer
+    startup.mark("qt_import")
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    startup.mark("app_init")
 
     check_accessibility()
-
-    if is_already_running():
-        print("CC2Translate가 이미 실행 중입니다.")
-        sys.exit(0)
+    if IS_MACOS:
+        startup.mark("accessibility")
 
     # 이전 비정상 종료로 남은 소켓 정리
     QLocalServer.removeServer(APP_ID)
 
     server = QLocalServer()
+    # 소켓으로 번역 요청을 받으므로 같은 사용자만 접속 가능하게
+    server.setSocketOptions(QLocalServer.UserAccessOption)
     server.listen(APP_ID)
+    startup.mark("server_listen")
+
+    from window import TranslatorWindow
+    from ipc_server import TranslationService
+    startup.mark("window_import")
 
-    window = TranslatorWindow()
+    window = TranslatorWindow(startup)
+    startup.mark("window_init")
 
-    # 다른 인스턴스가 접속하면 기존 창 활성화
-    server.newConnection.connect(lambda: (
-        server.nextPendingConnection().close(),
-        window.show_and_activate(),
-    ))
+    # 다른 인스턴스가 접속하면 기존 창 활성화, 외부 프로세스의 번역 요청 처리 (ipc.py)
+    # 서비스가 GC되면 newConnection 슬롯이 끊기므로 창에 참조를 붙여 둔다
+    window._ipc_service = TranslationService(server, window.show_and_activate, window.current_model)
 
     window.show()
+    startup.mark("window_show")
+    QTimer.singleShot(0, lambda: startup.mark("first_paint"))
+    if profiling:
+        window.signal_emitter.startup_done.connect(lambda: (startup.report(), app.quit()))
     sys.exit(app.exec_())
 
 
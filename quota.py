@@ -0,0 +1,249 @@
+"""백엔드별 사용량 집계와 클라이언트 측 속도 제한
+
+요청 수/문자 수를 기간(일 또는 월)별로 APP_DATA_DIR/quota.json에 저장하고,
+보내기 전에 일/월 한도와 분당 요청 수(token bucket)를 확인한다. 요청마다 늘어나는 사용량은
+QUOTA_SAVE_DELAY 동안 모아서 저장하고, 종료할 때 남은 것을 저장한다.
+한도는 constants 기본값에 config.json 값을 덮어써서 사용한다.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import updater
+from constants import (
+    APP_DATA_DIR, QUOTA_FILE_NAME, RATE_LIMITS, DAILY_REQUEST_LIMITS, MONTHLY_CHAR_LIMITS,
+    QUOTA_WARN_RATIO, QUOTA_MAX_WAIT, QUOTA_SYNC_INTERVAL, QUOTA_SAVE_DELAY,
+)
+
+QUOTA_PATH = os.path.join(APP_DATA_DIR, QUOTA_FILE_NAME)
+
+
+class QuotaExceeded(Exception):
+    pass
+
+
+class TokenBucket:
+    """분당 per_minute개 요청 허용. 토큰을 미리 예약하고 기다려야 할 시간을 돌려준다."""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def reserve(self, max_wait):
+        """토큰 하나 예약. 대기 시간(초)을 반환하고, max_wait보다 길면 예약하지 않고 None."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        if wait > max_wait:
+            return None
+        self.tokens -= 1
+        return wait
+
+    def drain(self):
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = time.monotonic()
+
+
+_lock = threading.Lock()
+_usage = None
+_buckets = {}
+_cooldown_until = {}
+_save_timer = None
+
+
+# ── 한도 / 저장 ──
+
+def _limits(name, defaults):
+    """constants 기본값에 config.json 값을 덮어쓴 모델별 한도"""
+    return {**defaults, **(updater.get_setting(name) or {})}
+
+
+def _period(model):
+    """사용량 집계 기간 - 월 문자 한도가 있는 모델은 월, 나머지는 일 (UTC)"""
+    now = datetime.now(timezone.utc)
+    if model in _limits("monthly_char_limits", MONTHLY_CHAR_LIMITS):
+        return now.strftime("%Y-%m")
+    return now.strftime("%Y-%m-%d")
+
+
+def _load():
+    global _usage
+    if _usage is None:
+        try:
+            with open(QUOTA_PATH, "r") as f:
+                _usage = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _usage = {}
+    return _usage
+
+
+def _save():
+    global _save_timer
+    if _save_timer is not None:
+        _save_timer.cancel()
+        _save_timer = None
+    os.makedirs(APP_DATA_DIR, exist_ok=True)
+    tmp_path = QUOTA_PATH + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(_usage, f, indent=2)
+        os.replace(tmp_path, QUOTA_PATH)
+    except OSError:
+        pass
+
+
+def _save_later():
+    """QUOTA_SAVE_DELAY 뒤에 저장 (그 사이의 기록은 한 번에 저장된다)"""
+    global _save_timer
+    if _save_timer is None:
+        _save_timer = threading.Timer(QUOTA_SAVE_DELAY, flush)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def _entry(model):
+    """모델의 현재 기간 사용량 (기간이 바뀌었으면 초기화)"""
+    usage = _load()
+    period = _period(model)
+    entry = usage.get(model)
+    if entry is None or entry.get("period") != period:
+        previous = entry or {}
+        entry = usage[model] = {"period": period, "requests": 0, "chars": 0}
+        # DeepL 동기화 시각은 기간과 무관하게 유지
+        if "synced_at" in previous:
+            entry["synced_at"] = previous["synced_at"]
+    return entry
+
+
+def _bucket(model):
+    per_minute = _limits("rate_limits", RATE_LIMITS).get(model)
+    if not per_minute:
+        return None
+    bucket = _buckets.get(model)
+    if bucket is None or bucket.capacity != per_minute:
+        bucket = _buckets[model] = TokenBucket(per_minute)
+    return bucket
+
+
+def _check_budget(model, entry, chars):
+    """일/월 한도 확인. 초과면 QuotaExceeded."""
+    until = _cooldown_until.get(model, 0)
+    if time.monotonic() < until:
+        raise QuotaExceeded(f"{model} 요청 한도 초과 - {until - time.monotonic():.0f}초 후 다시 시도하세요")
+    char_limit = entry.get("limit") or _limits("monthly_char_limits", MONTHLY_CHAR_LIMITS).get(model)
+    if char_limit and (entry.get("exhausted") or entry["chars"] + chars > char_limit):
+        raise QuotaExceeded(f"{model} 이번 달 문자 할당량({char_limit:,}자)을 모두 사용했습니다")
+    request_limit = _limits("daily_request_limits", DAILY_REQUEST_LIMITS).get(model)
+    if request_limit and entry["requests"] >= request_limit:
+        raise QuotaExceeded(f"{model} 오늘 요청 한도({request_limit:,}회)를 모두 사용했습니다")
+
+
+# ── 공개 API ──
+
+def reserve(model, chars):
+    """요청 전 호출. 한도를 확인하고 속도 제한 토큰을 예약해 보내기 전 기다릴 시간(초)을 반환.
+
+    한도가 소진됐거나 QUOTA_MAX_WAIT보다 오래 기다려야 하면 QuotaExceeded.
+    """
+    with _lock:
+        _check_budget(model, _entry(model), chars)
+        bucket = _bucket(model)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve(QUOTA_MAX_WAIT)
+        if wait is None:
+            raise QuotaExceeded(f"{model} 분당 요청 한도({bucket.capacity}회) 초과")
+        return wait
+
+
+def available(model):
+    """예약 없이 한도만 확인"""
+    with _lock:
+        try:
+            _check_budget(model, _entry(model), 0)
+        except QuotaExceeded:
+            return False
+        return True
+
+
+def record(model, chars):
+    """성공한 요청의 사용량 기록"""
+    with _lock:
+        entry = _entry(model)
+        entry["requests"] += 1
+        entry["chars"] += chars
+        _save_later()
+
+
+def flush():
+    """아직 저장하지 않은 사용량을 저장"""
+    with _lock:
+        if _save_timer is not None:
+            _save()
+
+
+atexit.register(flush)
+
+
+def cooldown(model, seconds):
+    """서버가 속도 제한(429)을 알린 경우 seconds 동안 요청하지 않는다"""
+    with _lock:
+        _cooldown_until[model] = time.monotonic() + seconds
+        bucket = _bucket(model)
+        if bucket is not None:
+            bucket.drain()
+
+
+def mark_exhausted(model):
+    """서버가 할당량 소진(DeepL 456)을 알린 경우 - 이번 기간 동안 요청하지 않는다"""
+    with _lock:
+        _entry(model)["exhausted"] = True
+        _save()
+
+
+def set_usage(model, chars, limit):
+    """서버에서 받은 사용량으로 동기화 (DeepL /v2/usage)"""
+    with _lock:
+        entry = _entry(model)
+        entry["chars"] = chars
+        entry["limit"] = limit
+        entry["exhausted"] = chars >= limit
+        entry["synced_at"] = time.time()
+        _save()
+
+
+def needs_sync(model):
+    with _lock:
+        return time.time() - _entry(model).get("synced_at", 0) > QUOTA_SYNC_INTERVAL
+
+
+def usage(model):
+    """현재 기간 사용량 {requests, chars, used, limit, unit} (한도가 없으면 limit None)"""
+    with _lock:
+        entry = _entry(model)
+        char_limit = entry.get("limit") or _limits("monthly_char_limits", MONTHLY_CHAR_LIMITS).get(model)
+        if char_limit:
+            used, limit, unit = entry["chars"], char_limit, "자"
+        else:
+            used = entry["requests"]
+            limit = _limits("daily_request_limits", DAILY_REQUEST_LIMITS).get(model)
+            unit = "회"
+        return {"requests": entry["requests"], "chars": entry["chars"],
+                "used": used, "limit": limit, "unit": unit}
+
+
+def warning(model):
+    """한도의 QUOTA_WARN_RATIO 이상을 썼으면 경고 문구, 아니면 None"""
+    info = usage(model)
+    if not info["limit"] or info["used"] < info["limit"] * QUOTA_WARN_RATIO:
+        return None
+    period = "이번 달" if info["unit"] == "자" else "오늘"
+    percent = info["used"] * 100 // info["limit"]
+    return f"{model} {period} 사용량 {percent}% ({info['used']:,}/{info['limit']:,}{info['unit']})"
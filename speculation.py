@@ -0,0 +1,139 @@
+"""첫 번째 복사 입력에서 미리 시작하는 번역 (config.json의 speculative_translate)
+
+두 번째 복사 입력을 기다리지 않고 첫 입력 직후의 클립보드 내용을 번역하기 시작한다. 두 번째 입력이 같은
+텍스트/언어/모델로 들어오면 창이 진행 중이거나 끝난 결과를 넘겨받고(claim), 다른 내용이거나 두 번째 입력이
+오지 않으면 취소한다(discard). 기록은 창이 결과를 받을 때 저장하므로 취소된 번역은 남지 않는다.
+요청 비용이 드는 CLI 모델은 캐시 조회만 미리 하고, 할당량 경고가 있는 모델은 미리 번역하지 않는다.
+"""
+
+import threading
+
+import translator
+from cache import normalize_text
+from constants import GEMINI_API_MODELS, DEEPL_API_MODELS, SPECULATIVE_MAX_CHARS
+
+_API_MODELS = set(GEMINI_API_MODELS.values()) | set(DEEPL_API_MODELS.values())
+
+_stats = {"started": 0, "hits": 0, "misses": 0, "expired": 0, "wasted": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def stats():
+    """시작/적중/불일치(다른 내용으로 두 번째 입력)/만료(두 번째 입력 없음)/낭비된 요청 수와 적중률"""
+    with _stats_lock:
+        result = dict(_stats)
+    settled = result["hits"] + result["misses"] + result["expired"]
+    result["hit_rate"] = result["hits"] / settled if settled else 0.0
+    return result
+
+
+def start(text, src_lang, tgt_lang, model):
+    """미리 번역할 수 있으면 시작한 Speculation을, 아니면 None을 반환"""
+    if not text or len(text) > SPECULATIVE_MAX_CHARS:
+        return None
+    members = translator.member_models(model)
+    if not all(translator.is_configured(m) for m in members) or translator.quota_warning(model):
+        return None
+    speculation = Speculation(text, src_lang, tgt_lang, model, all(m in _API_MODELS for m in members))
+    _count("started")
+    thread = threading.Thread(target=speculation._run)
+    thread.daemon = True
+    thread.start()
+    return speculation
+
+
+class Speculation:
+    """미리 시작한 번역 하나. claim/discard는 둘 중 하나만, 한 번만 적용된다."""
+
+    def __init__(self, text, src_lang, tgt_lang, model, request):
+        self.text = text
+        self.src_lang = src_lang
+        self.tgt_lang = tgt_lang
+        self.model = model
+        self.request = request  # False면 캐시 조회만
+        self.cancel = translator.CancelToken()
+        self.result = None
+        self.cached = False
+        self.error = None
+        self._key = (normalize_text(text), src_lang, tgt_lang, model)
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._chunks = []         # 넘겨받기 전에 도착한 스트리밍 조각
+        self._on_partial = None
+        self._settled = False
+
+    def _run(self):
+        try:
+            if self.request:
+                on_partial = self._partial if translator.supports_streaming(self.model) else None
+                self.result, self.cached = translator.translate_cached(
+                    self.text, self.src_lang, self.tgt_lang, self.model, on_partial=on_partial, cancel=self.cancel
+                )
+            else:
+                self.result = translator.lookup_cache(self.text, self.src_lang, self.tgt_lang, self.model)
+                self.cached = self.result is not None
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def _partial(self, chunk):
+        with self._lock:
+            if self._on_partial is None:
+                self._chunks.append(chunk)
+            else:
+                self._on_partial(chunk)
+
+    def _settle(self, outcome):
+        with self._lock:
+            if self._settled:
+                return False
+            self._settled = True
+        _count(outcome)
+        return True
+
+    def matches(self, text, src_lang, tgt_lang, model):
+        return self._key == (normalize_text(text), src_lang, tgt_lang, model)
+
+    def claim(self, on_partial=None, cancel=None):
+        """결과를 넘겨받는다 (번역 스레드에서 호출). 이미 도착한 조각부터 on_partial로 전달하고 끝날 때까지 기다린다.
+
+        cancel이 취소되면 미리 시작한 번역도 취소한다. Returns: (translation, cached)
+        """
+        self._settle("hits")
+        with self._lock:
+            if on_partial is not None and self._chunks:
+                on_partial("".join(self._chunks))
+            self._chunks = []
+            self._on_partial = on_partial
+        if cancel is not None:
+            cancel.add_callback(self.cancel.cancel)
+        try:
+            self._done.wait()
+        finally:
+            if cancel is not None:
+                cancel.remove_callback(self.cancel.cancel)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        if self.error is not None:
+            raise self.error
+        if self.result is None:
+            # 캐시 조회만 했는데 없던 경우
+            return translator.translate_cached(
+                self.text, self.src_lang, self.tgt_lang, self.model, on_partial=on_partial, cancel=cancel
+            )
+        return self.result, self.cached
+
+    def discard(self, outcome):
+        """쓰지 않을 번역을 취소한다. outcome: "misses"(다른 내용) 또는 "expired"(두 번째 입력 없음)"""
+        if not self._settle(outcome):
+            return
+        self.cancel.cancel()
+        # 캐시에서 바로 끝난 경우가 아니면 백엔드 요청을 보냈거나 보내는 중이었다
+        if self.request and not (self._done.is_set() and self.cached):
+            _count("wasted")
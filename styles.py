@@ -62,13 +62,13 @@ LINE_EDIT = """
 """
 
 HISTORY_LIST = """
-    QListWidget {
+    QListView {
         border: 1px solid #ccc; border-radius: 3px;
     }
-    QListWidget::item {
+    QListView::item {
         padding: 6px; border-bottom: 1px solid #eee;
     }
-    QListWidget::item:selected {
+    QListView::item:selected {
         background-color: #d0e4f7;
     }
 """
@@ -0,0 +1,49 @@
+"""detector.detect - 영어 용어가 섞인 한국어/일본어/중국어 입력"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import detector  # noqa: E402
+
+
+@pytest.mark.parametrize("text", [
+    "Kubernetes Deployment의 replicas 설정",
+    "error: cannot find module react-dom 에러",
+    "git rebase --onto main feature 브랜치를 옮기는 방법",
+    "useEffect cleanup function이 언제 호출되나요?",
+    "안녕하세요, 오늘 날씨가 정말 좋네요.",
+])
+def test_korean_with_english_terms(text):
+    assert detector.detect(text).language == "Korean"
+
+
+@pytest.mark.parametrize("text, language", [
+    ("React コンポーネントの props を渡す", "Japanese"),
+    ("这个 API 的 timeout 设置", "Simplified Chinese"),
+])
+def test_cjk_with_english_terms(text, language):
+    assert detector.detect(text).language == language
+
+
+def test_english_with_a_korean_word():
+    text = "The Korean word 안녕 means hello and is used as a greeting at any time of the day."
+    assert detector.detect(text).language == "English"
+
+
+@pytest.mark.parametrize("text, language", [
+    ("The quick brown fox jumps over the lazy dog.", "English"),
+    ("Сегодня очень хорошая погода.", "Russian"),
+    ("¿Dónde está la biblioteca? El niño no sabe.", "Spanish"),
+])
+def test_single_script(text, language):
+    assert detector.detect(text).language == language
+
+
+def test_empty():
+    result = detector.detect("1234 !?")
+    assert result.language == detector.DEFAULT_LANGUAGE
+    assert result.confidence == 0.0
@@ -0,0 +1,181 @@
+"""번역 파이프라인 단계별 소요 시간 기록
+
+단축키 입력부터 결과 표시, 기록 저장까지 단계가 끝날 때마다 mark()로 시각을 남긴다.
+끝난 trace는 최근 TRACE_BUFFER_SIZE개를 메모리에 보관하고, config.json의 trace_log가 켜져 있으면
+APP_DATA_DIR/traces.jsonl에 한 줄씩 덧붙인다.
+
+번역 스레드에서는 activate(trace)로 현재 trace를 지정해 두면 translator/cli_worker의
+tracing.mark() 호출이 그 trace에 기록된다 (지정하지 않은 스레드에서는 아무 일도 하지 않음).
+조각/경쟁 요청처럼 작업 스레드 풀에서 실행되는 부분은 세부 단계 없이 전체 시간만 남는다.
+"""
+
+import collections
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+
+import updater
+from constants import APP_DATA_DIR, TRACE_BUFFER_SIZE, TRACE_FILE_NAME, TRACE_LOG, TRACE_LOG_MAX_BYTES
+
+TRACE_PATH = os.path.join(APP_DATA_DIR, TRACE_FILE_NAME)
+
+# 단계 이름 → 툴팁 표시 이름 (각 단계는 이전 mark부터 해당 mark까지)
+STAGE_LABELS = {
+    "hotkey_delay": "단축키 처리 지연",
+    "event_loop": "UI 이벤트 대기",
+    "show": "창 표시",
+    "clipboard": "클립보드 읽기",
+    "source_render": "원문 표시",
+    "detect": "언어 감지",
+    "thread_start": "번역 스레드 시작",
+    "quota": "사용량 한도 확인",
+    "network": "요청 전송/응답 대기",
+    "first_partial": "첫 스트리밍 조각",
+    "body": "응답 수신",
+    "cli_spawn": "CLI 프로세스 시작",
+    "cli": "CLI 응답 대기",
+    "parse": "응답 파싱",
+    "retry_wait": "재시도 대기",
+    "translate": "번역 (나머지)",
+    "result_signal": "결과 전달",
+    "first_render": "첫 조각 표시",
+    "render": "결과 표시",
+    "history": "기록 저장",
+}
+
+_ids = itertools.count(1)
+_recent = collections.deque(maxlen=TRACE_BUFFER_SIZE)
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class Trace:
+    """번역 요청 하나의 단계별 시각. origin은 시작 경로 (hotkey, manual, auto 등)."""
+
+    def __init__(self, origin):
+        self.id = next(_ids)
+        self.origin = origin
+        self.started_at = time.time()
+        self.status = None
+        self.attrs = {}
+        self._start = time.perf_counter()
+        self._marks = []
+
+    @property
+    def finished(self):
+        return self.status is not None
+
+    def mark(self, stage, once=False):
+        """stage 단계가 끝난 시각 기록. once=True면 이미 기록된 단계는 무시."""
+        if self.status is not None or (once and any(name == stage for name, _ in self._marks)):
+            return
+        self._marks.append((stage, time.perf_counter() - self._start))
+
+    def stages(self):
+        """[(단계, 소요 시간(초))] - 여러 스레드에서 기록하므로 시각 순으로 정렬해 계산"""
+        result = []
+        previous = 0.0
+        for stage, at in sorted(self._marks, key=lambda item: item[1]):
+            result.append((stage, at - previous))
+            previous = at
+        return result
+
+    @property
+    def total(self):
+        return max((at for _, at in self._marks), default=0.0)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "origin": self.origin,
+            "started_at": self.started_at,
+            "status": self.status,
+            "total_ms": round(self.total * 1000, 2),
+            "stages": [{"stage": stage, "ms": round(elapsed * 1000, 2)} for stage, elapsed in self.stages()],
+            **self.attrs,
+        }
+
+    def summary(self):
+        """상태 표시줄 툴팁용 여러 줄 요약"""
+        lines = [f"최근 번역 단계별 시간 ({self.origin}, 합계 {self.total * 1000:.0f}ms)"]
+        for stage, elapsed in self.stages():
+            lines.append(f"{STAGE_LABELS.get(stage, stage)}: {elapsed * 1000:.1f}ms")
+        return "\n".join(lines)
+
+
+def finish(trace, status="ok"):
+    """trace를 끝내고 보관. 이미 끝난 trace면 False."""
+    with _lock:
+        if trace.status is not None:
+            return False
+        trace.status = status
+        _recent.append(trace)
+    if updater.get_setting("trace_log", TRACE_LOG):
+        _write(trace)
+    return True
+
+
+def _write(trace):
+    line = json.dumps(trace.to_dict(), ensure_ascii=False) + "\n"
+    with _lock:
+        try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            if os.path.exists(TRACE_PATH) and os.path.getsize(TRACE_PATH) > TRACE_LOG_MAX_BYTES:
+                os.replace(TRACE_PATH, TRACE_PATH + ".1")
+            with open(TRACE_PATH, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            pass
+
+
+def recent():
+    """최근에 끝난 trace 목록 (오래된 것부터)"""
+    with _lock:
+        return list(_recent)
+
+
+@contextlib.contextmanager
+def activate(trace):
+    """with 블록 안에서 이 스레드의 mark()가 trace에 기록되도록 한다"""
+    previous = getattr(_local, "trace", None)
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+
+def mark(stage, once=False):
+    """현재 스레드에 지정된 trace가 있으면 단계 기록"""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.mark(stage, once)
+
+
+def annotate(**attrs):
+    """현재 스레드에 지정된 trace가 있으면 속성 기록 (경쟁 요청의 승자 등)"""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.attrs.update(attrs)
+
+
+if __name__ == "__main__":
+    # traces.jsonl의 단계별 평균/최대 시간 요약
+    totals = collections.defaultdict(list)
+    count = 0
+    try:
+        with open(TRACE_PATH, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                count += 1
+                for item in record["stages"]:
+                    totals[item["stage"]].append(item["ms"])
+    except FileNotFoundError:
+        print(f"{TRACE_PATH} 없음 (config.json에 \"trace_log\": true 설정)")
+    print(f"trace {count}건")
+    for stage, values in sorted(totals.items(), key=lambda item: -sum(item[1])):
+        print(f"  {STAGE_LABELS.get(stage, stage):16} {len(values):>5}회  평균 {sum(values) / len(values):>8.1f}ms  "
+              f"최대 {max(values):>8.1f}ms")
@@ -1,13 +1,36 @@
 """번역 백엔드 - Claude/Gemini CLI 및 API를 이용한 번역 처리"""
 
+import collections
+import concurrent.futures
 import json
 import os
+import queue
+import random
 import re
+import shutil
 import subprocess
+import threading
+import time
 
-import requests
-
-from constants import GEMINI_MODELS, GEMINI_API_MODELS, DEEPL_API_MODELS, API_TIMEOUT, CLI_TIMEOUT
+import cli_worker
+import quota
+import tracing
+import updater
+from cache import TranslationCache, make_key
+from constants import (
+    GEMINI_MODELS, GEMINI_API_MODELS, DEEPL_API_MODELS, API_TIMEOUT, CLI_TIMEOUT,
+    GEMINI_API_BASE, DEEPL_API_BASE, HTTP_POOL_SIZE, HTTP_CONNECT_RETRIES,
+    HTTP_IDLE_RECONNECT, HTTP_WARMUP_TIMEOUT, GEMINI_API_STREAMING,
+    CLI_PERSISTENT_WORKERS, RACE_CONFIGS, RACE_DEFAULT_HEDGE_DELAY, RACE_LATENCY_SAMPLES,
+    RACE_MIN_SAMPLES, RACE_LOG_SIZE, CHUNK_THRESHOLD_CHARS, CHUNK_MAX_CHARS, CHUNK_WORKERS,
+    DEEPL_BATCH_MAX_TEXTS, DEEPL_BATCH_MAX_BYTES,
+    GEMINI_API_PROFILES, GEMINI_PROFILE_DEFAULT, GEMINI_API_MODES, GEMINI_API_MODE,
+    GEMINI_SYSTEM_INSTRUCTION, GEMINI_OUTPUT_TOKENS_PER_CHAR, GEMINI_OUTPUT_TOKENS_MARGIN,
+    GEMINI_DYNAMIC_THINKING_RESERVE, GEMINI_PROFILE_LATENCY_SAMPLES,
+    QUOTA_RATE_LIMIT_COOLDOWN, QUOTA_AUTO_FALLBACK, QUOTA_FALLBACK_MODELS, CLAUDE_MODELS,
+    RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, ATTEMPT_TIMEOUTS, RETRY_BUDGETS,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_OPEN_SECONDS, CIRCUIT_FALLBACK,
+)
 
 # DeepL 언어 코드 매핑
 DEEPL_LANG_MAP = {
@@ -26,6 +49,46 @@ DEEPL_LANG_MAP = {
     "Arabic": "AR",
 }
 
+# 번역 결과 캐시 (메모리 LRU + 디스크)
+cache = TranslationCache()
+
+
+class _LazyModule:
+    """속성에 처음 접근할 때 loader()로 모듈을 import하는 대리 객체"""
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = self._loader()
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+def _import_requests():
+    # import 문으로 써야 PyInstaller가 의존성으로 찾는다
+    import requests
+    import requests.adapters
+    return requests
+
+
+# requests(urllib3/ssl 포함)는 불러오는 데 100ms 넘게 걸려 창 표시를 늦추므로 첫 HTTP 요청이나
+# preload()까지 미룬다
+requests = _LazyModule(_import_requests)
+
+
+def preload():
+    """HTTP 스택을 미리 불러온다 - 시작 후 백그라운드 스레드에서 호출해 첫 번역 지연을 없앤다"""
+    requests.load()
+
+
 def _get_api_key(key_name):
     """환경변수에서 API 키 조회"""
     return os.environ.get(key_name, "")
@@ -47,6 +110,169 @@ class TranslationError(Exception):
     pass
 
 
+class TranslationCancelled(TranslationError):
+    """새 요청에 밀려 취소된 번역"""
+
+    def __init__(self):
+        super().__init__("번역이 취소되었습니다")
+
+
+class QuotaExceededError(TranslationError):
+    """할당량 소진 또는 속도 제한 - 다른 모델로 전환 가능"""
+
+
+class RetryableError(TranslationError):
+    """일시적 오류 (5xx, 연결 끊김, 시간 초과) - 다시 시도할 수 있음"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitedError(QuotaExceededError, RetryableError):
+    """서버 속도 제한(429) - Retry-After만큼 기다린 뒤 재시도하거나 다른 모델로 전환"""
+
+
+class BackendUnavailableError(TranslationError):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않음 - 다른 모델로 전환 가능"""
+
+
+class CancelToken:
+    """진행 중인 번역 취소용 토큰. 취소 시 등록된 중단 콜백(응답 닫기, 프로세스 kill)을 실행."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def add_callback(self, callback):
+        """취소 시 호출할 콜백 등록. 이미 취소됐으면 즉시 호출."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback):
+        """작업이 끝나 더 이상 중단할 필요가 없는 콜백 해제"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TranslationCancelled()
+
+    def wait(self, timeout):
+        """timeout초 동안 대기. 그 사이 취소되면 TranslationCancelled."""
+        if self._event.wait(timeout):
+            raise TranslationCancelled()
+
+
+# ── HTTP 세션 풀 (백엔드별 keep-alive) ──
+
+_BACKEND_BASES = {
+    "gemini": GEMINI_API_BASE,
+    "deepl": DEEPL_API_BASE,
+}
+_BACKEND_KEYS = {
+    "gemini": "GEMINI_API_KEY",
+    "deepl": "DEEPL_API_KEY",
+}
+_sessions = {}
+_last_used = {}
+_session_lock = threading.Lock()
+
+
+def _new_session():
+    """커넥션 풀 크기와 연결 재시도를 조정한 keep-alive 세션 생성"""
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # POST는 멱등이 아니므로 연결 단계 실패만 재시도
+    retry = Retry(total=HTTP_CONNECT_RETRIES, connect=HTTP_CONNECT_RETRIES,
+                  read=0, status=0, backoff_factor=0.2)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session(backend):
+    """백엔드 세션 반환. 오래 쉬었으면 서버가 끊었을 연결을 버리고 새로 만든다."""
+    now = time.monotonic()
+    with _session_lock:
+        session = _sessions.get(backend)
+        if session is not None and now - _last_used.get(backend, now) > HTTP_IDLE_RECONNECT:
+            session.close()
+            session = None
+        if session is None:
+            session = _new_session()
+            _sessions[backend] = session
+        _last_used[backend] = now
+        return session
+
+
+def warm_up(backends=None):
+    """API 키가 설정된 백엔드에 미리 연결해 DNS/TCP/TLS 비용을 선지불한다."""
+    for backend in backends or _BACKEND_BASES:
+        if not _get_api_key(_BACKEND_KEYS[backend]):
+            continue
+        with _session_lock:
+            last = _last_used.get(backend)
+        if backend in _sessions and last is not None and time.monotonic() - last < HTTP_IDLE_RECONNECT / 2:
+            continue
+        if backend == "deepl" and any(quota.needs_sync(m) for m in DEEPL_API_MODELS.values()):
+            # 사용량 동기화 요청으로 예열을 대신한다
+            sync_deepl_usage()
+            continue
+        try:
+            _get_session(backend).head(_BACKEND_BASES[backend], timeout=HTTP_WARMUP_TIMEOUT)
+        except requests.RequestException:
+            pass
+
+
+def warm_up_async(backends=None):
+    """백그라운드 스레드에서 warm_up 실행"""
+    thread = threading.Thread(target=warm_up, args=(backends,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _post(backend, url, cancel=None, **kwargs):
+    """백엔드 세션으로 POST. 본문은 stream으로 받아 취소 시 응답을 닫아 중단할 수 있게 한다."""
+    resp = _get_session(backend).post(url, stream=True, **kwargs)
+    tracing.mark("network")
+    if cancel is not None:
+        cancel.add_callback(resp.close)
+        cancel.raise_if_cancelled()
+    return resp
+
+
+def close_sessions():
+    with _session_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _last_used.clear()
+
+
 def build_prompt(text, src_lang, tgt_lang):
     """번역 프롬프트 생성"""
     if src_lang == "auto":
@@ -55,49 +281,848 @@ def build_prompt(text, src_lang, tgt_lang):
         return f'Translate the following {src_lang} text to {tgt_lang}. Return ONLY a JSON object: {{"translation": "your translation here"}}\n\n{text}'
 
 
+def build_gemini_prompt(text, src_lang, tgt_lang):
+    """Gemini API용 요청 본문 (공통 지시는 GEMINI_SYSTEM_INSTRUCTION에 있음)"""
+    if src_lang == "auto":
+        return f"Translate to {tgt_lang}.\n\n{text}"
+    return f"Translate from {src_lang} to {tgt_lang}.\n\n{text}"
+
+
 def translate(text, src_lang, tgt_lang, model):
-    """번역 실행. API 모델이면 API 호출, 아니면 CLI 호출."""
+    """번역 실행 (캐시 사용). 번역 결과 문자열을 반환."""
+    return translate_cached(text, src_lang, tgt_lang, model)[0]
+
+
+def translate_cached(text, src_lang, tgt_lang, model, on_partial=None, cancel=None, on_progress=None):
+    """캐시를 거쳐 번역한다.
+
+    on_partial이 주어지고 스트리밍을 지원하는 모델이면 부분 번역 조각을 도착 순서대로 전달한다.
+    cancel(CancelToken)이 취소되면 진행 중인 HTTP 응답/CLI 프로세스를 중단하고
+    TranslationCancelled를 발생시킨다.
+    CHUNK_THRESHOLD_CHARS보다 긴 텍스트는 조각으로 나눠 병렬 번역하며,
+    조각이 끝날 때마다 on_progress(완료 수, 전체 수)를 호출한다.
+
+    Returns:
+        (translation: str, cached: bool)
+    """
+    if len(text) > CHUNK_THRESHOLD_CHARS:
+        return _translate_chunked(text, src_lang, tgt_lang, model, cancel, on_progress)
+    return _translate_one(text, src_lang, tgt_lang, model, on_partial, cancel)
+
+
+def _translate_one(text, src_lang, tgt_lang, model, on_partial=None, cancel=None):
+    """텍스트 하나를 캐시(single-flight 포함)를 거쳐 번역"""
+    key = _cache_key(text, src_lang, tgt_lang, model)
+    while True:
+        try:
+            return cache.get_or_compute(
+                key, lambda: _translate_backend(text, src_lang, tgt_lang, model, on_partial, cancel)
+            )
+        except TranslationCancelled:
+            if cancel is not None and cancel.cancelled:
+                raise
+            # 같은 키로 진행 중이던 다른 요청이 취소된 경우 - 직접 다시 요청
+
+
+def lookup_cache(text, src_lang, tgt_lang, model):
+    """캐시에 있는 번역 (없거나 조각으로 나눠 번역할 길이면 None). 디스크에만 있던 항목은 메모리로 올라온다."""
+    if len(text) > CHUNK_THRESHOLD_CHARS:
+        return None
+    return cache.get(_cache_key(text, src_lang, tgt_lang, model))
+
+
+def _cache_key(text, src_lang, tgt_lang, model):
+    """캐시 키 - 모든 번역 경로(단일, 조각, DeepL 묶음)가 이 키를 쓴다"""
+    return make_key(text, src_lang, tgt_lang, _cache_model(model))
+
+
+def _cache_model(model):
+    """캐시 키용 모델 이름. Gemini API 모델은 생성 모드별로 따로 저장한다."""
+    if any(m in GEMINI_API_MODELS.values() for m in member_models(model)):
+        return f"{model}:{gemini_mode()}"
+    return model
+
+
+def supports_streaming(model):
+    if model in RACE_CONFIGS:
+        model = RACE_CONFIGS[model]["primary"]
+    return GEMINI_API_STREAMING and model in GEMINI_API_MODELS.values()
+
+
+def member_models(model):
+    """실제로 호출되는 백엔드 모델 목록 (경쟁 모델이면 primary/secondary)"""
+    if model in RACE_CONFIGS:
+        config = RACE_CONFIGS[model]
+        return [config["primary"], config["secondary"]]
+    return [model]
+
+
+def _translate_backend(text, src_lang, tgt_lang, model, on_partial=None, cancel=None, reroute=True):
+    """번역 실행. 취소로 중단된 경우 원래 오류 대신 TranslationCancelled를 발생.
+
+    일시적 오류는 백오프하며 재시도하고, 할당량이 소진됐거나 서킷 브레이커가 열린 모델이면
+    설정된 다른 모델로 전환한다 (reroute=False면 그대로 실패).
+    """
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    start = time.monotonic()
+    try:
+        if model in RACE_CONFIGS:
+            # 경쟁 모델은 구성 모델별로 재시도한다
+            result = _translate_race(text, src_lang, tgt_lang, model, on_partial, cancel)
+        else:
+            result = _call_with_retry(
+                model, lambda timeout: _dispatch(text, src_lang, tgt_lang, model, on_partial, cancel, timeout),
+                cancel,
+            )
+    except (QuotaExceededError, BackendUnavailableError) as e:
+        if cancel is not None and cancel.cancelled:
+            raise TranslationCancelled() from None
+        kind = "quota" if isinstance(e, QuotaExceededError) else "circuit"
+        fallback = _fallback_model(model, kind) if reroute else None
+        if fallback is None:
+            raise
+        route_log.append({"model": model, "fallback": fallback, "kind": kind, "reason": str(e),
+                          "time": time.time()})
+        return _translate_backend(text, src_lang, tgt_lang, fallback, on_partial, cancel, reroute=False)
+    except Exception:
+        if cancel is not None and cancel.cancelled:
+            raise TranslationCancelled() from None
+        raise
+    _record_latency(model, time.monotonic() - start)
+    return result
+
+
+def _dispatch(text, src_lang, tgt_lang, model, on_partial=None, cancel=None, timeout=None):
+    """번역 한 번 시도. API 모델이면 API 호출, 아니면 CLI 호출. timeout은 이번 시도의 제한 시간."""
+    if model in GEMINI_API_MODELS.values():
+        if on_partial and GEMINI_API_STREAMING:
+            return _translate_gemini_api_stream(
+                text, src_lang, tgt_lang, model, on_partial, cancel, timeout=timeout or API_TIMEOUT
+            )
+        return _translate_gemini_api(text, src_lang, tgt_lang, model, cancel, timeout=timeout or API_TIMEOUT)
+    if model in DEEPL_API_MODELS.values():
+        return _translate_deepl_api(text, src_lang, tgt_lang, model, cancel, timeout=timeout or API_TIMEOUT)
+    return _translate_cli(text, src_lang, tgt_lang, model, cancel, timeout=timeout or CLI_TIMEOUT)
+
+
+# ── 긴 텍스트 분할 번역 ──
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。！？])\s+')
+_PARAGRAPH_RE = re.compile(r'(\n[ \t]*\n\s*)')
+
+
+def _split_long(piece, max_chars):
+    """문단 하나가 너무 길면 문장 단위로, 문장도 너무 길면 글자 수로 자른다.
+
+    Returns:
+        [(조각, 뒤따르는 구분자)]
+    """
+    parts = []
+    pos = 0
+    for match in _SENTENCE_END_RE.finditer(piece):
+        parts.append((piece[pos:match.start()], match.group()))
+        pos = match.end()
+    parts.append((piece[pos:], ""))
+
+    result = []
+    body, sep = "", ""
+    for sentence, sentence_sep in parts:
+        while len(sentence) > max_chars:
+            if body:
+                result.append((body, sep))
+                body, sep = "", ""
+            result.append((sentence[:max_chars], ""))
+            sentence = sentence[max_chars:]
+        if body and len(body) + len(sep) + len(sentence) > max_chars:
+            result.append((body, sep))
+            body, sep = "", ""
+        body = body + sep + sentence if body else sentence
+        sep = sentence_sep
+    if body or sep:
+        result.append((body, sep))
+    return result
+
+
+def split_chunks(text, max_chars=CHUNK_MAX_CHARS):
+    """문단/문장 경계에서 max_chars 이하 조각으로 나눈다.
+
+    Returns:
+        [(조각, 뒤따르는 구분자)] - 번역된 조각과 구분자를 순서대로 이으면 원래 구조가 복원된다.
+    """
+    pieces = _PARAGRAPH_RE.split(text)
+    paragraphs = [(pieces[i], pieces[i + 1] if i + 1 < len(pieces) else "")
+                  for i in range(0, len(pieces), 2)]
+
+    chunks = []
+    body, sep = "", ""
+    for paragraph, paragraph_sep in paragraphs:
+        if len(paragraph) > max_chars:
+            if body:
+                chunks.append((body, sep))
+                body, sep = "", ""
+            chunks.extend(_split_long(paragraph, max_chars))
+            # 마지막 조각의 구분자를 문단 구분자로 교체
+            last_body, last_sep = chunks[-1]
+            chunks[-1] = (last_body, last_sep + paragraph_sep)
+            continue
+        if body and len(body) + len(sep) + len(paragraph) > max_chars:
+            chunks.append((body, sep))
+            body, sep = "", ""
+        body = body + sep + paragraph if body else paragraph
+        sep = paragraph_sep
+    if body or sep:
+        chunks.append((body, sep))
+    return chunks
+
+
+def _translate_chunked(text, src_lang, tgt_lang, model, cancel=None, on_progress=None):
+    """조각으로 나눠 병렬 번역한 뒤 원래 순서대로 합친다"""
+    chunks = split_chunks(text)
+    indexes = [i for i, (body, _sep) in enumerate(chunks) if body.strip()]
+    translated = translate_batch(
+        [chunks[i][0] for i in indexes], src_lang, tgt_lang, model, cancel, on_progress
+    )
+
+    results = [body for body, _sep in chunks]
+    for i, (translation, _cached) in zip(indexes, translated):
+        results[i] = translation
+    all_cached = all(cached for _translation, cached in translated)
+    joined = "".join(result + sep for result, (_body, sep) in zip(results, chunks))
+    return joined.strip(), all_cached
+
+
+def translate_batch(texts, src_lang, tgt_lang, model, cancel=None, on_progress=None):
+    """여러 텍스트를 캐시를 거쳐 번역. 입력 순서대로 (번역, 캐시 여부) 리스트를 반환.
+
+    DeepL은 캐시에 없는 텍스트를 요청 한도에 맞춰 묶어 한 번에 보내고,
+    나머지 모델은 CHUNK_WORKERS 크기의 워커 풀로 병렬 요청한다.
+    텍스트가 끝날 때마다 on_progress(완료 수, 전체 수)를 호출한다.
+    """
+    # 한 묶음이 실패하면 나머지만 취소 (호출자 토큰은 건드리지 않음)
+    group = CancelToken()
+    if cancel is not None:
+        cancel.add_callback(group.cancel)
+
+    total = len(texts)
+    results = [None] * total
+    progress = {"done": 0}
+
+    def _finish(i, translation, cached):
+        results[i] = (translation, cached)
+        progress["done"] += 1
+        if on_progress:
+            on_progress(progress["done"], total)
+
+    # 할당량이 소진된 DeepL은 묶음 요청 대신 조각별 경로(다른 모델로 전환)를 탄다
+    flights = {}  # 이 호출이 맡은(claim) 키의 인덱스 → flight
+    if model in DEEPL_API_MODELS.values() and quota.available(model):
+        keys = [_cache_key(text, src_lang, tgt_lang, model) for text in texts]
+        owned = []
+        waiting = []
+        for i, key in enumerate(keys):
+            value, flight = cache.claim(key)
+            if value is not None:
+                _finish(i, value, True)
+            elif flight is not None:
+                flights[i] = flight
+                owned.append(i)
+            else:
+                # 같은 텍스트를 다른 요청(또는 이 호출의 앞 항목)이 번역 중 - 조각별 경로에서 기다린다
+                waiting.append([i])
+        # 워커 풀은 제출 순서대로 실행하므로 묶음 요청이 기다리는 조각보다 먼저 시작된다
+        batches = [[owned[j] for j in batch] for batch in _deepl_batches([texts[i] for i in owned])] + waiting
+    else:
+        batches = [[i] for i in range(total)]
+
+    def _run(batch):
+        """묶음 하나를 번역해 [(번역, 캐시 여부)]를 반환"""
+        if batch[0] not in flights:
+            return [_translate_one(texts[batch[0]], src_lang, tgt_lang, model, None, group)]
+        try:
+            translations = _call_with_retry(
+                model,
+                lambda timeout: _translate_deepl_batch(
+                    [texts[i] for i in batch], src_lang, tgt_lang, model, group, timeout
+                ),
+                group,
+            )
+        except BaseException as e:
+            for i in batch:
+                cache.resolve(keys[i], flights.pop(i), error=e)
+            raise
+        for i, translation in zip(batch, translations):
+            cache.resolve(keys[i], flights.pop(i), translation)
+        return [(translation, False) for translation in translations]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as pool:
+        futures = {pool.submit(_run, batch): batch for batch in batches}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                for i, (translation, cached) in zip(futures[future], future.result()):
+                    _finish(i, translation, cached)
+        except BaseException:
+            group.cancel()
+            for future, batch in futures.items():
+                # 시작하지 않은 묶음이 맡은 키는 여기서 풀어 준다
+                if future.cancel():
+                    for i in batch:
+                        if i in flights:
+                            cache.resolve(keys[i], flights.pop(i), error=TranslationCancelled())
+            if cancel is not None and cancel.cancelled:
+                raise TranslationCancelled() from None
+            raise
+    return results
+
+
+# ── 할당량 / 속도 제한 ──
+
+route_log = collections.deque(maxlen=RACE_LOG_SIZE)
+
+
+def _acquire_quota(model, chars, cancel=None):
+    """보내기 전에 한도를 확인하고, 속도 제한에 걸리면 토큰이 찰 때까지 기다린다"""
+    try:
+        wait = quota.reserve(model, chars)
+    except quota.QuotaExceeded as e:
+        raise QuotaExceededError(str(e)) from None
+    if wait > 0:
+        if cancel is not None:
+            cancel.wait(wait)
+        else:
+            time.sleep(wait)
+    tracing.mark("quota")
+
+
+def _retry_after(resp, default=QUOTA_RATE_LIMIT_COOLDOWN):
+    """Retry-After 헤더(초). 없거나 날짜 형식이면 default."""
+    try:
+        return max(1.0, float(resp.headers.get("Retry-After", "")))
+    except ValueError:
+        return default
+
+
+def is_configured(model):
+    """API 키가 있거나 CLI가 설치되어 바로 쓸 수 있는 모델인지 (CLI는 실제 호출과 같은 PATH에서 찾는다)"""
+    if model in GEMINI_API_MODELS.values():
+        return bool(_get_api_key("GEMINI_API_KEY"))
+    if model in DEEPL_API_MODELS.values():
+        return bool(_get_api_key("DEEPL_API_KEY"))
+    if model in GEMINI_MODELS.values():
+        return shutil.which("gemini", path=_get_env()["PATH"]) is not None
+    if model in CLAUDE_MODELS.values():
+        return shutil.which("claude", path=_get_env()["PATH"]) is not None
+    return False
+
+
+def _fallback_model(model, kind):
+    """할당량이 소진됐거나(kind="quota") 백엔드가 차단된(kind="circuit") model 대신 쓸 모델 (없으면 None)"""
+    if kind == "quota" and not updater.get_setting("quota_auto_fallback", QUOTA_AUTO_FALLBACK):
+        return None
+    if kind == "circuit" and not updater.get_setting("circuit_fallback", CIRCUIT_FALLBACK):
+        return None
+    for candidate in updater.get_setting("quota_fallback_models", QUOTA_FALLBACK_MODELS):
+        if (candidate not in member_models(model) and is_configured(candidate)
+                and quota.available(candidate) and _breaker(candidate).available()):
+            return candidate
+    return None
+
+
+def sync_deepl_usage():
+    """DeepL /v2/usage로 이번 결제 기간 사용량을 동기화 (연결 예열도 겸함)"""
+    api_key = _get_api_key("DEEPL_API_KEY")
+    if not api_key:
+        return
+    try:
+        resp = _get_session("deepl").get(
+            f"{DEEPL_API_BASE}/v2/usage",
+            headers={"Authorization": f"DeepL-Auth-Key {api_key}"},
+            timeout=HTTP_WARMUP_TIMEOUT,
+        )
+        data = resp.json()
+        count, limit = int(data["character_count"]), int(data["character_limit"])
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return
+    for model in DEEPL_API_MODELS.values():
+        quota.set_usage(model, count, limit)
+
+
+def sync_deepl_usage_async():
+    threading.Thread(target=sync_deepl_usage, daemon=True).start()
+
+
+def quota_warning(model):
+    """모델(경쟁 모델이면 구성 모델)의 사용량 경고 문구 (없으면 None)"""
+    warnings = [quota.warning(m) for m in member_models(model)]
+    return " / ".join(w for w in warnings if w) or None
+
+
+# ── 재시도 / 서킷 브레이커 ──
+
+def _transient_errors():
+    """연결 끊김/시간 초과 계열 (응답 본문을 읽는 도중의 끊김 포함)"""
+    return requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError
+
+
+class CircuitBreaker:
+    """백엔드별 서킷 브레이커.
+
+    연속 실패가 CIRCUIT_FAILURE_THRESHOLD번 쌓이면 열려(open) 요청을 바로 거절하고,
+    CIRCUIT_OPEN_SECONDS 뒤 시험 요청 하나만 보내(half-open) 성공하면 닫는다.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def _ready(self):
+        return time.monotonic() - self.opened_at >= CIRCUIT_OPEN_SECONDS
+
+    def available(self):
+        """지금 요청을 보낼 수 있는지 (상태는 바꾸지 않음)"""
+        with self._lock:
+            return self.state == "closed" or (self._ready() and not self._trial)
+
+    def before_call(self):
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and self._ready():
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial:
+                self._trial = True
+                return
+            retry_in = max(0.0, CIRCUIT_OPEN_SECONDS - (time.monotonic() - self.opened_at))
+            raise BackendUnavailableError(
+                f"{self.name} 백엔드가 응답하지 않아 잠시 사용을 멈췄습니다 ({retry_in:.0f}초 후 재시도)"
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if self.state == "half_open" or self.failures >= CIRCUIT_FAILURE_THRESHOLD:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """백엔드 상태와 무관하게 끝난 시도 (취소, 요청 오류) - 시험 요청 자리만 반납"""
+        with self._lock:
+            self._trial = False
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = None
+            if self.state != "closed":
+                retry_in = max(0.0, CIRCUIT_OPEN_SECONDS - (time.monotonic() - self.opened_at))
+            return {"state": self.state, "failures": self.failures, "retry_in": retry_in}
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def _backend_name(model):
+    """서킷 브레이커/재시도 설정 단위 (API 백엔드 또는 CLI 종류)"""
     if model in GEMINI_API_MODELS.values():
-        return _translate_gemini_api(text, src_lang, tgt_lang, model)
+        return "gemini"
     if model in DEEPL_API_MODELS.values():
-        return _translate_deepl_api(text, src_lang, tgt_lang)
-    return _translate_cli(text, src_lang, tgt_lang, model)
+        return "deepl"
+    if model in GEMINI_MODELS.values():
+        return "gemini-cli"
+    return "claude-cli"
+
+
+def _breaker(model):
+    name = _backend_name(model)
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def breaker_states():
+    """백엔드별 서킷 브레이커 상태 {name: {state, failures, retry_in}}"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+def _backoff(attempt):
+    """지수 백오프 + full jitter"""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def _call_with_retry(model, call, cancel=None):
+    """call(timeout)을 일시적 오류에 한해 백오프하며 재시도.
+
+    시도마다 ATTEMPT_TIMEOUTS, 전체로는 RETRY_BUDGETS 안에서만 시도하며
+    결과를 백엔드 서킷 브레이커에 기록한다.
+    """
+    kind = "api" if _backend_name(model) in ("gemini", "deepl") else "cli"
+    breaker = _breaker(model)
+    deadline = time.monotonic() + RETRY_BUDGETS[kind]
+    attempt = 0
+    while True:
+        breaker.before_call()
+        timeout = max(1.0, min(ATTEMPT_TIMEOUTS[kind], deadline - time.monotonic()))
+        try:
+            result = call(timeout)
+        except RetryableError as e:
+            if cancel is not None and cancel.cancelled:
+                breaker.release()
+                raise TranslationCancelled() from None
+            if isinstance(e, RateLimitedError):
+                breaker.release()  # 속도 제한은 장애가 아님
+            else:
+                breaker.record_failure()
+            attempt += 1
+            delay = e.retry_after if e.retry_after is not None else _backoff(attempt)
+            if (attempt >= RETRY_MAX_ATTEMPTS or delay > RETRY_MAX_DELAY
+                    or time.monotonic() + delay >= deadline):
+                raise
+            if cancel is not None:
+                cancel.wait(delay)
+            else:
+                time.sleep(delay)
+            tracing.mark("retry_wait")
+            continue
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+
+# ── 경쟁(hedged) 요청 ──
+
+_latencies = {}
+_latency_lock = threading.Lock()
+race_log = collections.deque(maxlen=RACE_LOG_SIZE)
+
+
+def _record_latency(model, elapsed):
+    with _latency_lock:
+        samples = _latencies.get(model)
+        if samples is None:
+            samples = _latencies[model] = collections.deque(maxlen=RACE_LATENCY_SAMPLES)
+        samples.append(elapsed)
+
+
+def latency_percentile(model, pct):
+    """관측된 성공 응답 시간의 백분위수 (표본이 부족하면 None)"""
+    with _latency_lock:
+        samples = sorted(_latencies.get(model, ()))
+    if len(samples) < RACE_MIN_SAMPLES:
+        return None
+    index = min(len(samples) - 1, int(len(samples) * pct / 100))
+    return samples[index]
+
+
+def _hedge_delay(config):
+    """secondary를 보내기 전 대기 시간. 설정값이 없으면 primary의 p90 응답 시간."""
+    if config.get("hedge_delay") is not None:
+        return config["hedge_delay"]
+    p90 = latency_percentile(config["primary"], 90)
+    return p90 if p90 is not None else RACE_DEFAULT_HEDGE_DELAY
+
+
+def _translate_race(text, src_lang, tgt_lang, race_model, on_partial=None, cancel=None):
+    """primary로 보내고 hedge 지연 안에 답이 없으면 secondary에도 보낸 뒤 먼저 성공한 결과를 사용"""
+    config = RACE_CONFIGS[race_model]
+    results = queue.Queue()
+    tokens = {}
+    start = time.monotonic()
+    # 승자가 정해지면 진 primary의 스트리밍 조각은 더 전달하지 않는다
+    forwarding = threading.Lock()
+    decided = {"winner": None}
+
+    def _primary_partial(chunk):
+        with forwarding:
+            if decided["winner"] in (None, config["primary"]):
+                on_partial(chunk)
+
+    def _run(model, partial):
+        try:
+            # 다른 모델로의 전환은 경쟁 전체에 맡기고 구성 모델은 그대로 실패시킨다
+            result = _translate_backend(text, src_lang, tgt_lang, model, partial, tokens[model], reroute=False)
+            results.put((model, result, None))
+        except Exception as e:
+            results.put((model, None, e))
+
+    def _launch(model, partial=None):
+        token = CancelToken()
+        tokens[model] = token
+        if cancel is not None:
+            cancel.add_callback(token.cancel)
+        threading.Thread(target=_run, args=(model, partial), daemon=True).start()
+
+    _launch(config["primary"], _primary_partial if on_partial else None)
+    pending = 1
+    try:
+        first = results.get(timeout=_hedge_delay(config))
+    except queue.Empty:
+        first = None
+    # 시간 안에 답이 없거나 primary가 바로 실패하면 secondary 출발
+    if first is None or first[2] is not None:
+        _launch(config["secondary"])
+        pending += 1
+
+    errors = []
+    while True:
+        if first is not None:
+            model, result, error = first
+            pending -= 1
+            first = None
+        else:
+            model, result, error = results.get()
+            pending -= 1
+        if error is None:
+            break
+        errors.append(error)
+        if pending == 0:
+            raise errors[0]
+
+    with forwarding:
+        decided["winner"] = model
+    # 진 쪽 요청 취소
+    for other, token in tokens.items():
+        if other != model:
+            token.cancel()
+    race = {
+        "race": race_model,
+        "winner": model,
+        "elapsed": time.monotonic() - start,
+        "hedged": len(tokens) > 1,
+    }
+    race_log.append(race)
+    # 이 요청의 trace에 남긴다 (race_log의 마지막 항목은 다른 요청의 것일 수 있음)
+    tracing.annotate(race=race)
+    return result
+
+
+# ── Gemini API 생성 프로필 ──
+
+_GEMINI_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"translation": {"type": "STRING"}},
+    "required": ["translation"],
+}
+
+_profile_stats = {}
+_profile_lock = threading.Lock()
+
+
+def gemini_mode():
+    """현재 Gemini API 생성 모드 ("fast" 또는 "quality")"""
+    mode = updater.get_setting("gemini_mode", GEMINI_API_MODE)
+    return mode if mode in GEMINI_API_MODES.values() else GEMINI_API_MODE
+
+
+def gemini_profile(model, mode):
+    """모델/모드별 생성 프로필 (temperature, thinking_budget)"""
+    return GEMINI_API_PROFILES.get(model, {}).get(mode, GEMINI_PROFILE_DEFAULT)
 
 
-def _translate_gemini_api(text, src_lang, tgt_lang, model):
-    """Gemini API 직접 호출 - model 파라미터로 어떤 모델이든 동적 호출"""
+def _generation_config(text, profile):
+    """JSON 구조화 출력 + 프로필 설정. 출력 토큰 한도는 입력 길이에서 계산한다."""
+    max_tokens = int(len(text) * GEMINI_OUTPUT_TOKENS_PER_CHAR) + GEMINI_OUTPUT_TOKENS_MARGIN
+    config = {
+        "responseMimeType": "application/json",
+        "responseSchema": _GEMINI_RESPONSE_SCHEMA,
+        "temperature": profile["temperature"],
+    }
+    budget = profile.get("thinking_budget")
+    if budget is not None:
+        config["thinkingConfig"] = {"thinkingBudget": budget}
+        # thinking 토큰도 maxOutputTokens에 포함된다
+        max_tokens += budget if budget >= 0 else GEMINI_DYNAMIC_THINKING_RESERVE
+    config["maxOutputTokens"] = max_tokens
+    return config
+
+
+def _record_profile(model, mode, elapsed, usage):
+    """프로필별 응답 시간과 토큰 사용량 기록"""
+    with _profile_lock:
+        stats = _profile_stats.get((model, mode))
+        if stats is None:
+            stats = _profile_stats[(model, mode)] = {
+                "requests": 0,
+                "latencies": collections.deque(maxlen=GEMINI_PROFILE_LATENCY_SAMPLES),
+                "prompt_tokens": 0,
+                "output_tokens": 0,
+                "thought_tokens": 0,
+            }
+        stats["requests"] += 1
+        stats["latencies"].append(elapsed)
+        stats["prompt_tokens"] += usage.get("promptTokenCount", 0)
+        stats["output_tokens"] += usage.get("candidatesTokenCount", 0)
+        stats["thought_tokens"] += usage.get("thoughtsTokenCount", 0)
+
+
+def gemini_profile_stats():
+    """프로필별 요약 {(model, mode): {requests, p50, p90, avg_*_tokens}}"""
+    summary = {}
+    with _profile_lock:
+        for key, stats in _profile_stats.items():
+            latencies = sorted(stats["latencies"])
+            count = stats["requests"]
+            summary[key] = {
+                "requests": count,
+                "p50": latencies[len(latencies) // 2],
+                "p90": latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))],
+                "avg_prompt_tokens": stats["prompt_tokens"] / count,
+                "avg_output_tokens": stats["output_tokens"] / count,
+                "avg_thought_tokens": stats["thought_tokens"] / count,
+            }
+    return summary
+
+
+def _gemini_post(text, src_lang, tgt_lang, model, profile, stream=False, cancel=None, timeout=API_TIMEOUT):
+    """Gemini API 요청 전송. 상태 코드까지 확인한 응답을 반환."""
     api_key = _get_api_key("GEMINI_API_KEY")
     if not api_key:
         raise TranslationError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
 
-    prompt = build_prompt(text, src_lang, tgt_lang)
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+    if stream:
+        url = f"{GEMINI_API_BASE}/v1beta/models/{model}:streamGenerateContent?alt=sse"
+    else:
+        url = f"{GEMINI_API_BASE}/v1beta/models/{model}:generateContent"
     headers = {"x-goog-api-key": api_key}
+    _acquire_quota(model, len(text), cancel)
+    # 공통 지시는 systemInstruction으로 보내고 요청마다 언어와 본문만 보낸다
     payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
+        "systemInstruction": {"parts": [{"text": GEMINI_SYSTEM_INSTRUCTION}]},
+        "contents": [{"role": "user", "parts": [{"text": build_gemini_prompt(text, src_lang, tgt_lang)}]}],
+        "generationConfig": _generation_config(text, profile),
     }
 
     try:
-        resp = requests.post(url, json=payload, headers=headers, timeout=API_TIMEOUT)
+        resp = _post("gemini", url, cancel, json=payload, headers=headers, timeout=timeout)
     except requests.Timeout:
-        raise TranslationError(f"Gemini API 시간 초과 ({API_TIMEOUT}초)")
+        raise RetryableError(f"Gemini API 시간 초과 ({timeout:.0f}초)")
     except requests.ConnectionError:
-        raise TranslationError("Gemini API 연결 실패. 네트워크를 확인하세요.")
+        raise RetryableError("Gemini API 연결 실패. 네트워크를 확인하세요.")
 
     if resp.status_code != 200:
-        error_msg = resp.json().get("error", {}).get("message", resp.text)
+        try:
+            error_msg = resp.json().get("error", {}).get("message", resp.text)
+        except ValueError:
+            error_msg = resp.text
+        if resp.status_code == 429:
+            retry_after = _retry_after(resp)
+            quota.cooldown(model, retry_after)
+            raise RateLimitedError(f"Gemini API 요청 한도 초과: {error_msg}", retry_after)
+        if resp.status_code >= 500:
+            raise RetryableError(f"Gemini API 오류: {error_msg}", _retry_after(resp, None))
         raise TranslationError(f"Gemini API 오류: {error_msg}")
+    quota.record(model, len(text))
+    return resp
+
+
+def _check_finish(candidate):
+    if candidate.get("finishReason") == "MAX_TOKENS":
+        raise TranslationError("Gemini API 응답이 출력 토큰 한도에서 잘렸습니다")
+
 
+def _translate_gemini_api(text, src_lang, tgt_lang, model, cancel=None, mode=None, timeout=API_TIMEOUT):
+    """Gemini API 직접 호출 - model 파라미터로 어떤 모델이든 동적 호출. mode가 없으면 설정값 사용."""
+    mode = mode or gemini_mode()
+    start = time.monotonic()
+    resp = _gemini_post(
+        text, src_lang, tgt_lang, model, gemini_profile(model, mode), cancel=cancel, timeout=timeout
+    )
     try:
         data = resp.json()
-        raw = data["candidates"][0]["content"]["parts"][0]["text"]
-        return parse_translation(raw)
-    except (KeyError, IndexError):
+        candidate = data["candidates"][0]
+        _check_finish(candidate)
+        raw = candidate["content"]["parts"][0]["text"]
+    except _transient_errors():
+        raise RetryableError("Gemini API 응답을 받는 중 연결이 끊어졌습니다")
+    except (ValueError, KeyError, IndexError):
         raise TranslationError("Gemini API 응답을 파싱할 수 없습니다")
+    tracing.mark("body")
+    _record_profile(model, mode, time.monotonic() - start, data.get("usageMetadata", {}))
+    translation = parse_translation(raw)
+    tracing.mark("parse")
+    return translation
 
 
-def _translate_deepl_api(text, src_lang, tgt_lang):
+def _translate_gemini_api_stream(text, src_lang, tgt_lang, model, on_partial, cancel=None, mode=None,
+                                 timeout=API_TIMEOUT):
+    """Gemini API 스트리밍 호출 (SSE). 번역 조각이 디코딩되는 대로 on_partial 호출.
+
+    이미 일부를 화면에 보낸 뒤 끊기면 다시 시도하지 않는다 (같은 내용이 중복 표시되므로).
+    """
+    mode = mode or gemini_mode()
+    start = time.monotonic()
+    resp = _gemini_post(
+        text, src_lang, tgt_lang, model, gemini_profile(model, mode), stream=True, cancel=cancel,
+        timeout=timeout,
+    )
+    parser = TranslationStreamParser()
+    raw_parts = []
+    usage = {}
+    try:
+        # SSE 응답에 charset이 없으면 requests가 latin-1로 디코딩하므로 바이트로 읽는다.
+        # chunk_size=None: 고정 크기 버퍼를 채울 때까지 기다리지 않고 도착한 청크를 바로 처리
+        for line in resp.iter_lines(chunk_size=None):
+            if not line.startswith(b"data:"):
+                continue
+            event = json.loads(line[5:].decode("utf-8"))
+            # 사용량은 마지막 이벤트에 누적값으로 온다
+            usage = event.get("usageMetadata", usage)
+            candidate = event["candidates"][0]
+            for part in candidate.get("content", {}).get("parts", []):
+                chunk = part.get("text", "")
+                raw_parts.append(chunk)
+                delta = parser.feed(chunk)
+                if delta:
+                    tracing.mark("first_partial", once=True)
+                    on_partial(delta)
+            _check_finish(candidate)
+    except _transient_errors() as e:
+        message = (f"Gemini API 시간 초과 ({timeout:.0f}초)" if isinstance(e, requests.Timeout)
+                   else "Gemini API 연결이 끊어졌습니다")
+        if parser.text:
+            raise TranslationError(message)
+        raise RetryableError(message)
+    except (ValueError, KeyError, IndexError):
+        raise TranslationError("Gemini API 응답을 파싱할 수 없습니다")
+    finally:
+        resp.close()
+
+    tracing.mark("body")
+    _record_profile(model, mode, time.monotonic() - start, usage)
+    if parser.done:
+        return parser.text
+    # JSON 래퍼가 없거나 깨진 응답은 전체 텍스트로 다시 파싱
+    return parse_translation("".join(raw_parts))
+
+
+def _translate_deepl_api(text, src_lang, tgt_lang, model, cancel=None, timeout=API_TIMEOUT):
     """DeepL API 직접 호출"""
+    return _deepl_request([text], src_lang, tgt_lang, model, cancel, timeout)[0]
+
+
+class _PayloadTooLarge(TranslationError):
+    pass
+
+
+def _deepl_request(texts, src_lang, tgt_lang, model, cancel=None, timeout=API_TIMEOUT):
+    """DeepL /v2/translate 한 번 호출로 여러 text를 번역. 입력 순서대로 결과 리스트 반환."""
     api_key = _get_api_key("DEEPL_API_KEY")
     if not api_key:
         raise TranslationError("DEEPL_API_KEY 환경변수가 설정되지 않았습니다.")
@@ -106,42 +1131,92 @@ def _translate_deepl_api(text, src_lang, tgt_lang):
     if not tgt_code:
         raise TranslationError(f"DeepL에서 '{tgt_lang}' 언어를 지원하지 않습니다")
 
-    url = "https://api-free.deepl.com/v2/translate"
-    params = {
-        "text": text,
-        "target_lang": tgt_code,
-    }
+    url = f"{DEEPL_API_BASE}/v2/translate"
+    params = [("text", text) for text in texts]
+    params.append(("target_lang", tgt_code))
     if src_lang != "auto":
         src_code = DEEPL_LANG_MAP.get(src_lang)
         if src_code:
             # DeepL source_lang은 상위 코드만 사용 (EN, ZH 등)
-            params["source_lang"] = src_code.split("-")[0]
+            params.append(("source_lang", src_code.split("-")[0]))
 
     headers = {"Authorization": f"DeepL-Auth-Key {api_key}"}
+    chars = sum(len(text) for text in texts)
+    _acquire_quota(model, chars, cancel)
 
     try:
-        resp = requests.post(url, data=params, headers=headers, timeout=API_TIMEOUT)
+        resp = _post("deepl", url, cancel, data=params, headers=headers, timeout=timeout)
     except requests.Timeout:
-        raise TranslationError(f"DeepL API 시간 초과 ({API_TIMEOUT}초)")
+        raise RetryableError(f"DeepL API 시간 초과 ({timeout:.0f}초)")
     except requests.ConnectionError:
-        raise TranslationError("DeepL API 연결 실패. 네트워크를 확인하세요.")
+        raise RetryableError("DeepL API 연결 실패. 네트워크를 확인하세요.")
 
     if resp.status_code == 403:
         raise TranslationError("DeepL API 키가 유효하지 않습니다")
+    if resp.status_code == 413:
+        raise _PayloadTooLarge("DeepL API 요청 크기가 너무 큽니다")
     if resp.status_code == 456:
-        raise TranslationError("DeepL API 무료 할당량이 초과되었습니다")
+        quota.mark_exhausted(model)
+        raise QuotaExceededError("DeepL API 무료 할당량이 초과되었습니다")
+    if resp.status_code == 429:
+        retry_after = _retry_after(resp)
+        quota.cooldown(model, retry_after)
+        raise RateLimitedError("DeepL API 요청이 너무 많습니다", retry_after)
+    if resp.status_code >= 500:
+        # 529(Too many requests)를 포함한 서버 측 오류
+        raise RetryableError(f"DeepL API 오류 ({resp.status_code})", _retry_after(resp, None))
     if resp.status_code != 200:
         raise TranslationError(f"DeepL API 오류 ({resp.status_code}): {resp.text}")
+    quota.record(model, chars)
+    if quota.needs_sync(model):
+        sync_deepl_usage_async()
 
     try:
-        data = resp.json()
-        return data["translations"][0]["text"]
-    except (KeyError, IndexError):
+        translations = resp.json()["translations"]
+        if len(translations) != len(texts):
+            raise TranslationError("DeepL API 응답 개수가 요청과 다릅니다")
+        tracing.mark("body")
+        return [item["text"] for item in translations]
+    except _transient_errors():
+        raise RetryableError("DeepL API 응답을 받는 중 연결이 끊어졌습니다")
+    except (ValueError, KeyError, IndexError, TypeError):
         raise TranslationError("DeepL API 응답을 파싱할 수 없습니다")
 
 
-def _translate_cli(text, src_lang, tgt_lang, model):
+def _deepl_batches(texts):
+    """DeepL 요청 한도(text 개수, 요청 크기)에 맞춰 인덱스 묶음으로 나눈다"""
+    batches = []
+    batch, size = [], 0
+    for i, text in enumerate(texts):
+        # text= 파라미터는 URL 인코딩되므로 여유를 두고 계산
+        text_size = len(text.encode("utf-8")) * 3 + 8
+        if batch and (len(batch) >= DEEPL_BATCH_MAX_TEXTS or size + text_size > DEEPL_BATCH_MAX_BYTES):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(i)
+        size += text_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _translate_deepl_batch(texts, src_lang, tgt_lang, model, cancel=None, timeout=API_TIMEOUT):
+    """묶음 하나를 번역. 서버가 크기 초과(413)로 거절하면 반으로 나눠 다시 요청."""
+    try:
+        return _deepl_request(texts, src_lang, tgt_lang, model, cancel, timeout)
+    except _PayloadTooLarge:
+        if len(texts) == 1:
+            raise
+        mid = len(texts) // 2
+        return (_translate_deepl_batch(texts[:mid], src_lang, tgt_lang, model, cancel, timeout)
+                + _translate_deepl_batch(texts[mid:], src_lang, tgt_lang, model, cancel, timeout))
+
+
+def _translate_cli(text, src_lang, tgt_lang, model, cancel=None, timeout=CLI_TIMEOUT):
     """CLI를 이용한 번역 실행"""
+    if CLI_PERSISTENT_WORKERS:
+        return _translate_cli_worker(text, src_lang, tgt_lang, model, cancel, timeout)
+
     prompt = build_prompt(text, src_lang, tgt_lang)
     is_gemini = model in GEMINI_MODELS.values()
 
@@ -151,36 +1226,187 @@ def _translate_cli(text, src_lang, tgt_lang, model):
         cmd = ['claude', '-p', prompt, '--model', model]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=CLI_TIMEOUT, env=_get_env())
-    except subprocess.TimeoutExpired:
-        raise TranslationError(f"번역 시간 초과 ({CLI_TIMEOUT}초)")
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=_get_env())
     except FileNotFoundError:
         cli_name = "Gemini" if is_gemini else "Claude"
         raise TranslationError(f"{cli_name} CLI가 설치되어 있지 않습니다")
+    if cancel is not None:
+        cancel.add_callback(proc.kill)
+
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise RetryableError(f"번역 시간 초과 ({timeout:.0f}초)")
 
-    if result.returncode == 0:
-        return parse_translation(result.stdout)
+    tracing.mark("cli")
+    if proc.returncode == 0:
+        translation = parse_translation(stdout)
+        tracing.mark("parse")
+        return translation
     else:
-        raise TranslationError(result.stderr.strip() or "번역 실패")
+        raise TranslationError(stderr.strip() or "번역 실패")
+
+
+def _translate_cli_worker(text, src_lang, tgt_lang, model, cancel=None, timeout=CLI_TIMEOUT):
+    """유지 중인 CLI 워커 프로세스로 번역 (프롬프트는 stdin으로 전달)"""
+    prompt = build_prompt(text, src_lang, tgt_lang)
+    is_gemini = model in GEMINI_MODELS.values()
+    worker = cli_worker.get_worker(model, is_gemini, _get_env())
+
+    try:
+        output = worker.request(prompt, timeout, cancel)
+    except cli_worker.CLIWorkerTimeout:
+        raise RetryableError(f"번역 시간 초과 ({timeout:.0f}초)")
+    except cli_worker.CLIWorkerCrashed as e:
+        raise RetryableError(str(e) or "CLI 프로세스가 종료되었습니다")
+    except FileNotFoundError:
+        cli_name = "Gemini" if is_gemini else "Claude"
+        raise TranslationError(f"{cli_name} CLI가 설치되어 있지 않습니다")
+    except cli_worker.CLIWorkerError as e:
+        raise TranslationError(str(e) or "번역 실패")
+    tracing.mark("cli")
+    translation = parse_translation(output)
+    tracing.mark("parse")
+    return translation
+
+
+def start_cli_worker(model):
+    """CLI 모델이면 워커 프로세스를 미리 띄운다 (백그라운드 스레드에서 호출)"""
+    if not CLI_PERSISTENT_WORKERS:
+        return
+    for member in member_models(model):
+        if member in GEMINI_API_MODELS.values() or member in DEEPL_API_MODELS.values():
+            continue
+        worker = cli_worker.get_worker(member, member in GEMINI_MODELS.values(), _get_env())
+        try:
+            worker.start()
+        except OSError:
+            pass
+
+
+def shutdown_cli_workers():
+    cli_worker.shutdown_all()
+
+
+# JSON 키 위치에 있는 "translation": " (앞에 { 또는 , 가 와야 값 안의 문자열과 구분된다)
+_TRANSLATION_KEY_RE = re.compile(r'[{,]\s*"translation"\s*:\s*(?=")')
+# 따옴표로 시작하는 JSON 문자열 중 유효한 앞부분 (닫는 따옴표 직전까지)
+_JSON_STRING_PREFIX_RE = re.compile(r'"(?:[^"\\]+|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*')
+_CODE_FENCE_RE = re.compile(r'^```[\w-]*[ \t]*\n(.*?)\n?```$', re.DOTALL)
+# strict=False: 모델이 문자열 안에 이스케이프하지 않은 줄바꿈을 넣는 경우 허용
+_json_decoder = json.JSONDecoder(strict=False)
 
 
 def parse_translation(raw_output):
-    """JSON 응답에서 번역 텍스트를 추출. CLI 노이즈가 섞여도 JSON만 파싱."""
-    match = re.search(r'\{[^{}]*"translation"\s*:\s*"', raw_output)
-    if match:
-        json_start = match.start()
-        # JSON 끝 위치 찾기: 중첩 없는 단순 객체이므로 다음 } 탐색
-        depth = 0
-        for i in range(json_start, len(raw_output)):
-            if raw_output[i] == '{':
-                depth += 1
-            elif raw_output[i] == '}':
-                depth -= 1
-                if depth == 0:
+    """JSON 응답에서 번역 텍스트를 추출. CLI 노이즈, 코드 펜스, 여러 JSON 객체가 섞여도 처리.
+
+    "translation" 키 후보 위치마다 값 문자열의 유효한 앞부분을 확인한 뒤 raw_decode하고,
+    유효하지 않으면 그 위치부터 다음 후보를 찾으므로 입력 길이에 선형이다.
+    (JSONDecodeError는 줄/열 번호 계산에 문서 앞부분을 다시 세므로 예외에 의존하지 않는다)
+    """
+    pos = 0
+    while True:
+        match = _TRANSLATION_KEY_RE.search(raw_output, pos)
+        if not match:
+            break
+        end = _JSON_STRING_PREFIX_RE.match(raw_output, match.end()).end()
+        if end < len(raw_output) and raw_output[end] == '"':
+            return _json_decoder.raw_decode(raw_output, match.end())[0]
+        if end == len(raw_output):
+            # 닫는 따옴표 없이 끝났으므로 뒤쪽 후보도 모두 실패한다
+            break
+        pos = end  # 잘못된 이스케이프 다음부터 계속
+    # JSON 파싱 실패 시 원본 출력에서 노이즈(앞뒤 공백, 코드 펜스) 제거 후 반환
+    text = raw_output.strip()
+    fenced = _CODE_FENCE_RE.match(text)
+    return fenced.group(1).strip() if fenced else text
+
+
+_JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class TranslationStreamParser:
+    """부분 응답에서 {"translation": "..."} 값을 점진적으로 디코딩한다.
+
+    feed()에 응답 조각을 순서대로 넣으면 새로 디코딩된 번역 텍스트를 반환한다.
+    아직 처리하지 못한 끝부분만 버퍼에 남기므로 전체 처리량은 응답 길이에 선형이다.
+    """
+
+    # 키가 조각 경계에 걸칠 수 있으므로 키를 찾지 못하면 끝부분을 이만큼 남겨 둔다
+    _KEY_OVERLAP = 64
+    _PLAIN_RE = re.compile(r'[^"\\]+')
+
+    def __init__(self):
+        self._buf = ""
+        self._in_value = False
+        self._out = []
+        self.done = False
+
+    @property
+    def text(self):
+        return "".join(self._out)
+
+    def feed(self, chunk):
+        if self.done:
+            return ""
+        buf = self._buf + chunk
+        if not self._in_value:
+            match = _TRANSLATION_KEY_RE.search(buf)
+            if not match:
+                self._buf = buf[-self._KEY_OVERLAP:]
+                return ""
+            self._in_value = True
+            buf = buf[match.end() + 1:]  # 여는 따옴표 다음부터
+
+        start = len(self._out)
+        i = 0
+        n = len(buf)
+        while i < n:
+            c = buf[i]
+            if c == '"':
+                self.done = True
+                i += 1
+                break
+            if c != '\\':
+                j = self._PLAIN_RE.match(buf, i).end()
+                self._out.append(buf[i:j])
+                i = j
+                continue
+            if i + 1 >= n:
+                break
+            esc = buf[i + 1]
+            if esc != 'u':
+                self._out.append(_JSON_ESCAPES.get(esc, esc))
+                i += 2
+                continue
+            if i + 6 > n:
+                break
+            try:
+                code = int(buf[i + 2:i + 6], 16)
+            except ValueError:
+                # 잘못된 \uXXXX는 글자 그대로 둔다
+                self._out.append(buf[i:i + 6])
+                i += 6
+                continue
+            if 0xD800 <= code < 0xDC00:
+                # 서로게이트 쌍은 두 번째 \uXXXX까지 받은 뒤 결합. 뒤가 \u로 시작할 수 없으면 짝이 없는 것
+                if '\\u'.startswith(buf[i + 6:i + 8]) and i + 12 > n:
+                    break
+                if buf[i + 6:i + 8] == '\\u':
                     try:
-                        data = json.loads(raw_output[json_start:i + 1])
-                        return data["translation"]
-                    except (json.JSONDecodeError, KeyError):
-                        break
-    # JSON 파싱 실패 시 원본 출력에서 노이즈 제거 후 반환
-    return raw_output.strip()
+                        low = int(buf[i + 8:i + 12], 16)
+                    except ValueError:
+                        low = None
+                    if low is not None and 0xDC00 <= low < 0xE000:
+                        self._out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                        i += 12
+                        continue
+            if 0xD800 <= code < 0xE000:
+                # 짝이 없는 서로게이트는 UTF-8로 인코딩할 수 없으므로 대체 문자로 바꾼다
+                code = 0xFFFD
+            self._out.append(chr(code))
+            i += 6
+        self._buf = "" if self.done else buf[i:]
+        return "".join(self._out[start:])
@@ -5,16 +5,29 @@ import os
 import subprocess
 import sys
 import threading
-import urllib.request
-import urllib.error
+import time
 
-from constants import GITHUB_REPO, APP_DATA_DIR, GITHUB_API_TIMEOUT
+from constants import GITHUB_REPO, APP_DATA_DIR, GITHUB_API_TIMEOUT, CONFIG_RELOAD_INTERVAL
 
 CONFIG_DIR = APP_DATA_DIR
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
 
+# config.json은 메모리에 두고, CONFIG_RELOAD_INTERVAL마다 파일이 바뀌었는지(수정 시각, 크기) 확인해 다시 읽는다
+_config = None
+_config_stamp = None
+_config_checked = 0.0
+_config_lock = threading.Lock()
 
-def _load_config():
+
+def _stamp():
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config():
     try:
         with open(CONFIG_PATH, "r") as f:
             return json.load(f)
@@ -22,10 +35,41 @@ def _load_config():
         return {}
 
 
+def _load_config():
+    """메모리에 둔 설정 (파일이 바뀌었으면 다시 읽음). 호출한 쪽에서 수정하지 않는다."""
+    global _config, _config_stamp, _config_checked
+    with _config_lock:
+        now = time.monotonic()
+        if _config is None or now - _config_checked >= CONFIG_RELOAD_INTERVAL:
+            _config_checked = now
+            stamp = _stamp()
+            if _config is None or stamp != _config_stamp:
+                _config = _read_config()
+                _config_stamp = stamp
+        return _config
+
+
 def _save_config(config):
+    global _config, _config_stamp, _config_checked
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    with _config_lock:
+        with open(CONFIG_PATH, "w") as f:
+            json.dump(config, f, indent=2)
+        _config = config
+        _config_stamp = _stamp()
+        _config_checked = time.monotonic()
+
+
+def get_setting(key, default=None):
+    """config.json의 사용자 설정값 조회 (없으면 default)"""
+    return _load_config().get(key, default)
+
+
+def set_setting(key, value):
+    """config.json에 사용자 설정값 저장"""
+    config = dict(_read_config())
+    config[key] = value
+    _save_config(config)
 
 
 def get_current_version():
@@ -46,6 +90,10 @@ def get_current_version():
 
 def get_remote_version():
     """GitHub API로 master 브랜치의 최신 커밋 해시를 조회한다."""
+    # urllib.request는 불러오는 데 수십 ms가 걸리고 업데이트 확인(백그라운드)에서만 쓰므로 여기서 import
+    import urllib.request
+    import urllib.error
+
     url = f"https://api.github.com/repos/{GITHUB_REPO}/commits/master"
     req = urllib.request.Request(url, headers={"Accept": "application/vnd.github.v3+json"})
     try:
@@ -74,8 +122,7 @@ def check_for_update():
         return False, remote, None
 
     # 건너뛴 버전 확인
-    config = _load_config()
-    if config.get("skipped_version") == remote:
+    if get_setting("skipped_version") == remote:
         return False, remote, None
 
     return True, remote, None
@@ -83,15 +130,12 @@ def check_for_update():
 
 def skip_version(sha):
     """특정 버전을 건너뛰기로 설정한다."""
-    config = _load_config()
-    config["skipped_version"] = sha
-    _save_config(config)
+    set_setting("skipped_version", sha)
 
 
 def _get_repo_path():
     """소스 repo 경로를 반환한다. 없으면 자동 clone한다."""
-    config = _load_config()
-    repo_path = config.get("repo_path")
+    repo_path = get_setting("repo_path")
 
     if repo_path and os.path.isdir(os.path.join(repo_path, ".git")):
         return repo_path
@@ -107,8 +151,7 @@ def _get_repo_path():
         check=True,
         capture_output=True,
     )
-    config["repo_path"] = default_repo
-    _save_config(config)
+    set_setting("repo_path", default_repo)
     return default_repo
 
 
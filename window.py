@@ -2,29 +2,38 @@
 
 import os
 import threading
+import time
+from datetime import datetime, timezone
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QComboBox, QLabel, QPushButton, QSplitter, QSlider,
     QSystemTrayIcon, QMenu, QAction, QDialog, QDialogButtonBox,
-    QListWidget, QListWidgetItem, QLineEdit, QMessageBox,
+    QListView, QLineEdit, QMessageBox,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QTextCursor
 
 from constants import (
-    LANGUAGES, ALL_MODELS, GEMINI_API_MODELS, DEEPL_API_MODELS, IS_MACOS,
+    LANGUAGES, ALL_MODELS, GEMINI_API_MODELS, GEMINI_API_MODES, DEEPL_API_MODELS, IS_MACOS,
     WINDOW_SIZE, WINDOW_MIN_SIZE, DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE,
     FONT_SIZE_RANGE, FONT_SLIDER_MAX_WIDTH, SPLITTER_DEFAULT,
     SPLITTER_HISTORY_OPEN, SPLITTER_HISTORY_CLOSED,
     AUTO_TRANSLATE_DEBOUNCE_MS, HISTORY_SEARCH_DEBOUNCE_MS,
-    HOTKEY_TRIGGER_DELAY, HISTORY_PREVIEW_LENGTH,
+    HOTKEY_TRIGGER_DELAY, HISTORY_PREVIEW_LENGTH, HISTORY_PAGE_SIZE, STARTUP_DEFER_MS,
+    MAX_HISTORY_ENTRIES, MAX_HISTORY_BYTES, MAX_HISTORY_AGE_DAYS, HISTORY_SHORT_SEARCH_WINDOW,
+    SPECULATIVE_TRANSLATE, SPECULATIVE_SNAPSHOT_MS, SPECULATIVE_EXPIRE_MS, CLIPBOARD_TIMEOUT, CLIPBOARD_MAX_CHARS,
 )
 import styles
-from translator import translate, TranslationError
+from translator import translate_cached, TranslationError, TranslationCancelled
+import translator
 from hotkey import HotkeyListener
 import history
 import updater
+import detector
+import tracing
+import speculation
+import clipboard
 
 
 class EnvGuideDialog(QDialog):
@@ -53,24 +62,134 @@ class EnvGuideDialog(QDialog):
         layout.addWidget(buttons)
 
 
+def format_time(timestamp):
+    try:
+        dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+        return dt.strftime("%m/%d %H:%M")
+    except (ValueError, TypeError):
+        return timestamp or ""
+
+
+class HistoryListModel(QAbstractListModel):
+    """히스토리 목록 모델 - 요약(id, 표시 문자열)만 페이지 단위로 불러온다.
+
+    전체 원문/번역은 항목을 클릭할 때 history.get_entry로 조회한다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._search = ""
+        # 시작 시에는 DB를 열지 않는다 - DB가 열린 뒤 reset()으로 첫 페이지를 불러간다
+        self._exhausted = True
+
+    def reset(self, search=""):
+        """검색어를 바꾸고 비운다. 첫 페이지는 뷰가 fetchMore로 불러간다."""
+        self.beginResetModel()
+        self._rows = []
+        self._search = search
+        self._exhausted = False
+        self.endResetModel()
+
+    @property
+    def searching(self):
+        return bool(self._search)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row["label"]
+        if role == Qt.UserRole:
+            return row["id"]
+        return None
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self._exhausted:
+            return
+        if not history.ready():
+            # 쓰기 스레드가 DB를 여는 중 (마이그레이션 포함) - 열리면 창이 reset()한다
+            self._exhausted = True
+            return
+        before_id = self._rows[-1]["id"] if self._rows and not self._search else None
+        page = history.get_page(self._search, offset=len(self._rows), before_id=before_id)
+        if len(page) < HISTORY_PAGE_SIZE:
+            self._exhausted = True
+        if not page:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(self._summarize(entry) for entry in page)
+        self.endInsertRows()
+
+    def prepend(self, entry):
+        """새로 저장된 항목을 맨 위에 추가 (전체 재조회 없이)"""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, self._summarize(entry))
+        self.endInsertRows()
+
+    def remove(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    @staticmethod
+    def _summarize(entry):
+        if entry.get("snippet"):
+            preview = entry["snippet"].replace("\n", " ")
+        else:
+            preview = entry["preview"].replace("\n", " ")
+            if entry["truncated"]:
+                preview += "…"
+        time_str = format_time(entry["created_at"])
+        return {
+            "id": entry["id"],
+            "label": f"{preview}\n{entry['model']} | {entry['tgt_lang']} | {time_str}",
+        }
+
+
 class SignalEmitter(QObject):
     """스레드 간 시그널 전달용"""
     show_window = pyqtSignal()
-    translation_done = pyqtSignal(str)
-    translation_error = pyqtSignal(str)
+    first_copy = pyqtSignal()           # 더블 프레스의 첫 번째 복사 입력
+    clipboard_read = pyqtSignal(int, object, str)  # read id, ClipboardContent (실패 시 None), error message
+    translation_partial = pyqtSignal(int, str)     # request id, streamed chunk
+    translation_done = pyqtSignal(int, str, bool)  # request id, translation, cached
+    translation_error = pyqtSignal(int, str)       # request id, error message
+    translation_progress = pyqtSignal(int, int, int)  # request id, done chunks, total chunks
+    history_ready = pyqtSignal()        # 히스토리 DB 열림 (마이그레이션 완료 후)
+    history_added = pyqtSignal(object)  # 저장된 히스토리 항목 요약 (커밋 완료 후)
+    history_cleared = pyqtSignal(bool)  # 전체 삭제 커밋 완료 (실패하면 False)
+    trace_finished = pyqtSignal(object)  # 끝난 tracing.Trace
     update_available = pyqtSignal(str)  # remote_sha
     update_progress = pyqtSignal(str)   # progress message
     update_done = pyqtSignal()
     update_error = pyqtSignal(str)      # error message
+    startup_done = pyqtSignal()         # 시작 후 백그라운드 준비(HTTP 스택, 연결 예열) 완료
 
 
 class TranslatorWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, startup=None):
         super().__init__()
         self.signal_emitter = SignalEmitter()
         self.signal_emitter.show_window.connect(self.show_and_activate)
+        self.signal_emitter.first_copy.connect(self._on_first_copy_main)
+        self.signal_emitter.clipboard_read.connect(self._on_clipboard_read)
+        self.signal_emitter.translation_partial.connect(self._on_translation_partial)
         self.signal_emitter.translation_done.connect(self._on_translation_done)
         self.signal_emitter.translation_error.connect(self._on_translation_error)
+        self.signal_emitter.translation_progress.connect(self._on_translation_progress)
+        self.signal_emitter.history_ready.connect(self._load_history)
+        self.signal_emitter.history_added.connect(self._on_history_added)
+        self.signal_emitter.history_cleared.connect(self._on_history_cleared)
+        self.signal_emitter.trace_finished.connect(self._on_trace_finished)
         self.signal_emitter.update_available.connect(self._on_update_available)
         self.signal_emitter.update_progress.connect(self._on_update_progress)
         self.signal_emitter.update_done.connect(self._on_update_done)
@@ -79,12 +198,54 @@ class TranslatorWindow(QMainWindow):
         self.shortcut_text = "Cmd+C" if IS_MACOS else "Ctrl+C"
         self._updating = False
         self._suppress_auto_translate = False
+        self._current_model_name = None
+        self._request_id = 0        # 가장 최근 번역 요청 ID (이전 ID의 결과는 버림)
+        self._request = None        # 최근 요청 정보 (히스토리 기록용)
+        self._cancel_token = None
+        self._trace = None          # 최근 요청의 단계별 시간 기록
+        self._pending_trace = None  # 단축키/자동 번역에서 시작해 do_translate로 넘길 trace
+        self._startup = startup     # 시작 단계별 시간 기록 (main.py --startup-profile)
+        self._speculation = None    # 첫 번째 복사 입력에서 미리 시작한 번역
+        self._speculation_pending = False  # 첫 입력 후 클립보드를 읽기 전
+        self._speculation_read = None      # 미리 번역할 내용을 읽는 클립보드 read id
+        self._clipboard_reads = {}         # read id → 읽은 뒤 호출할 콜백
+        self._clipboard_read_id = 0
+        self._show_read = None             # show_and_activate가 기다리는 read id
+        self._clipboard_digest = None      # 원문 창에 넣은 클립보드 내용의 해시 (원문이 바뀌면 None)
 
         self._init_ui()
         self._setup_hotkey()
         self._setup_tray()
         self._setup_auto_translate()
+        QApplication.clipboard().dataChanged.connect(self._on_clipboard_changed)
+        # 핫키 백엔드, 기록 DB, 업데이트 확인, HTTP 스택은 창을 먼저 그린 뒤 준비
+        QTimer.singleShot(STARTUP_DEFER_MS, self._finish_startup)
+
+    def _mark_startup(self, phase):
+        if self._startup is not None:
+            self._startup.mark(phase)
+
+    def _finish_startup(self):
+        self._mark_startup("startup_delay")
+        self._start_hotkey()
+        self._mark_startup("hotkey")
+        # 보관 한도는 config.json 값이 있으면 우선, 0이면 무제한
+        limits = (
+            updater.get_setting("history_max_entries", MAX_HISTORY_ENTRIES),
+            updater.get_setting("history_max_bytes", MAX_HISTORY_BYTES),
+            updater.get_setting("history_max_age_days", MAX_HISTORY_AGE_DAYS),
+        )
+        history.start(limits, on_ready=self.signal_emitter.history_ready.emit)
         self._check_for_update()
+        threading.Thread(target=self._preload, daemon=True).start()
+        self._mark_startup("deferred_init")
+
+    def _preload(self):
+        """첫 번역이 기다리지 않도록 HTTP 스택을 불러오고 API 연결을 예열 (백그라운드)"""
+        translator.preload()
+        self._mark_startup("preload")
+        translator.warm_up()
+        self.signal_emitter.startup_done.emit()
 
     # ── UI 초기화 ──────────────────────────────────────────
 
@@ -108,9 +269,21 @@ class TranslatorWindow(QMainWindow):
         self.model_combo = QComboBox()
         self.model_combo.addItems(ALL_MODELS.keys())
         self.model_combo.setCurrentText("Claude Haiku (빠름)")
+        self._current_model_name = self.model_combo.currentText()
         self.model_combo.setMinimumWidth(120)
+        self.model_combo.currentTextChanged.connect(self._on_model_changed)
         toolbar.addWidget(self.model_combo)
 
+        # Gemini API 생성 모드 (Gemini API 모델 선택 시에만 표시)
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(GEMINI_API_MODES.keys())
+        modes = {mode: name for name, mode in GEMINI_API_MODES.items()}
+        self.mode_combo.setCurrentText(modes[translator.gemini_mode()])
+        self.mode_combo.setToolTip("빠름: thinking 끔 / 품질: thinking 사용")
+        self.mode_combo.currentTextChanged.connect(self._on_gemini_mode_changed)
+        self._mode_action = toolbar.addWidget(self.mode_combo)
+        self._update_mode_visibility(ALL_MODELS[self._current_model_name])
+
         toolbar.addSeparator()
 
         # 소스 언어
@@ -255,9 +428,12 @@ class TranslatorWindow(QMainWindow):
         self.history_search.textChanged.connect(lambda: self._search_timer.start())
         layout.addWidget(self.history_search)
 
-        self.history_list = QListWidget()
+        self.history_model = HistoryListModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
         self.history_list.setStyleSheet(styles.HISTORY_LIST)
-        self.history_list.itemClicked.connect(self._on_history_item_clicked)
+        self.history_list.clicked.connect(self._on_history_item_clicked)
         self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.history_list.customContextMenuRequested.connect(self._on_history_context_menu)
         layout.addWidget(self.history_list)
@@ -295,13 +471,103 @@ class TranslatorWindow(QMainWindow):
 
     def _setup_hotkey(self):
         self.hotkey_listener = HotkeyListener(
-            on_double_copy=lambda: threading.Timer(HOTKEY_TRIGGER_DELAY, self._trigger_show).start()
+            on_double_copy=self._on_double_copy,
+            on_first_copy=self._on_first_copy,
         )
-        self.hotkey_listener.start()
+
+    def _start_hotkey(self):
+        try:
+            self.hotkey_listener.start()
+        except Exception as e:
+            # pynput을 불러올 수 없는 환경 (디스플레이 서버 없음 등) - 창에서 직접 번역은 가능
+            self.statusBar().showMessage(f"{self.shortcut_text} 단축키를 사용할 수 없습니다: {e}")
+
+    def _on_double_copy(self):
+        """두 번째 복사 입력 (리스너 스레드) - trace를 시작하고 잠시 뒤 창을 띄운다"""
+        self._pending_trace = tracing.Trace("hotkey")
+        threading.Timer(HOTKEY_TRIGGER_DELAY, self._trigger_show).start()
 
     def _trigger_show(self):
+        if self._pending_trace is not None:
+            self._pending_trace.mark("hotkey_delay")
         self.signal_emitter.show_window.emit()
 
+    def _on_first_copy(self):
+        """첫 번째 복사 입력 - 두 번째 입력 전에 연결/CLI 워커를 미리 준비"""
+        translator.warm_up_async()
+        self._start_cli_worker(ALL_MODELS[self._current_model_name])
+        self.signal_emitter.first_copy.emit()
+
+    # ── 미리 번역 (speculation.py) ─────────────────────────
+
+    def _on_first_copy_main(self):
+        """켜져 있으면 복사한 내용이 클립보드에 들어오기를 기다렸다가 미리 번역을 시작"""
+        if not updater.get_setting("speculative_translate", SPECULATIVE_TRANSLATE):
+            return
+        self._discard_speculation("expired")
+        self._speculation_pending = True
+        QTimer.singleShot(SPECULATIVE_SNAPSHOT_MS, self._start_speculation)
+
+    def _on_clipboard_changed(self):
+        if self._speculation_pending:
+            self._start_speculation()
+
+    def _start_speculation(self):
+        if not self._speculation_pending:
+            return
+        self._speculation_pending = False
+        self._speculation_read = self._read_clipboard(self._on_speculation_clipboard)
+
+    def _on_speculation_clipboard(self, read_id, content, error):
+        # 읽는 동안 두 번째 입력이 왔으면(_take_speculation) 시작하지 않는다
+        if read_id != self._speculation_read:
+            return
+        self._speculation_read = None
+        # 사용자가 요청한 번역이 진행 중이면 양보
+        if content is None or self._cancel_token is not None:
+            return
+        text = content.text
+        src_name, tgt_name = self._guess_languages(text)
+        spec = speculation.start(text.strip(), LANGUAGES[src_name], LANGUAGES[tgt_name],
+                                 ALL_MODELS[self.model_combo.currentText()])
+        if spec is None:
+            return
+        self._speculation = spec
+        QTimer.singleShot(SPECULATIVE_EXPIRE_MS, lambda: self._discard_speculation("expired", spec))
+
+    def _take_speculation(self, text, src_lang, tgt_lang, model):
+        """미리 시작한 번역이 이 요청과 같으면 넘겨주고, 다르면 취소"""
+        self._speculation_pending = False
+        self._speculation_read = None
+        spec, self._speculation = self._speculation, None
+        if spec is not None and spec.matches(text, src_lang, tgt_lang, model):
+            return spec
+        if spec is not None:
+            spec.discard("misses")
+        return None
+
+    def _discard_speculation(self, outcome, spec=None):
+        if self._speculation is None or (spec is not None and spec is not self._speculation):
+            return
+        self._speculation.discard(outcome)
+        self._speculation = None
+
+    def _on_model_changed(self, name):
+        self._current_model_name = name
+        self._update_mode_visibility(ALL_MODELS[name])
+        self._start_cli_worker(ALL_MODELS[name])
+
+    def _update_mode_visibility(self, model):
+        uses_gemini_api = any(m in GEMINI_API_MODELS.values() for m in translator.member_models(model))
+        self._mode_action.setVisible(uses_gemini_api)
+
+    def _on_gemini_mode_changed(self, name):
+        updater.set_setting("gemini_mode", GEMINI_API_MODES[name])
+
+    @staticmethod
+    def _start_cli_worker(model):
+        threading.Thread(target=translator.start_cli_worker, args=(model,), daemon=True).start()
+
     # ── 자동 번역 (debounce) ──────────────────────────────
 
     def _setup_auto_translate(self):
@@ -312,6 +578,9 @@ class TranslatorWindow(QMainWindow):
         self.src_text.textChanged.connect(self._on_src_text_changed)
 
     def _on_src_text_changed(self):
+        # 직접 고치든 기록 복원/지우기로 바뀌든 원문 창은 더 이상 클립보드 내용이 아니다
+        # (_on_show_clipboard는 setText 뒤에 해시를 다시 기록한다)
+        self._clipboard_digest = None
         if self._suppress_auto_translate:
             return
         self._debounce_timer.start()
@@ -319,48 +588,107 @@ class TranslatorWindow(QMainWindow):
     def _on_auto_translate(self):
         if self._suppress_auto_translate:
             return
-        if not self.translate_btn.isEnabled():
-            return
         text = self.src_text.toPlainText().strip()
         if not text:
             return
+        trace = tracing.Trace("auto")
         self._detect_language(text)
+        trace.mark("detect")
+        self._pending_trace = trace
         self.do_translate()
 
     # ── 번역 ───────────────────────────────────────────────
 
     def show_and_activate(self):
-        clipboard = QApplication.clipboard()
-        text = clipboard.text()
-        if text:
-            self._suppress_auto_translate = True
-            self.src_text.setText(text)
-            self._suppress_auto_translate = False
-            self._detect_language(text)
-
+        """창을 먼저 띄우고, 클립보드를 백그라운드에서 읽은 뒤 번역"""
+        trace = self._pending_trace or tracing.Trace("activate")
+        self._pending_trace = None
+        trace.mark("event_loop")
         self.show()
         self.activateWindow()
         self.raise_()
+        trace.mark("show")
+        self._show_read = self._read_clipboard(
+            lambda read_id, content, error: self._on_show_clipboard(read_id, content, error, trace)
+        )
 
-        if text:
-            self.do_translate()
+    def _on_show_clipboard(self, read_id, content, error, trace):
+        if read_id != self._show_read:
+            return
+        self._show_read = None
+        trace.mark("clipboard")
+        if content is None:
+            self.statusBar().showMessage(f"클립보드를 읽지 못했습니다: {error}")
+            return
+        if not content.text:
+            self.statusBar().showMessage("클립보드에 읽을 수 있는 텍스트가 없습니다")
+            return
+        # 같은 내용을 다시 복사했으면 원문 창을 다시 그리지 않는다 (언어 선택도 그대로)
+        if content.digest != self._clipboard_digest:
+            self._suppress_auto_translate = True
+            self.src_text.setText(content.text)
+            self._suppress_auto_translate = False
+            self._clipboard_digest = content.digest
+            trace.mark("source_render")
+            self._detect_language(content.text)
+            trace.mark("detect")
+
+        self._pending_trace = trace
+        request_id = self._request_id
+        self.do_translate()
+        if content.truncated:
+            note = f"클립보드 내용이 커서 앞 {len(content.text):,}자만 가져옴"
+            if self._request_id != request_id:
+                self._request["note"] = note
+            self.statusBar().showMessage(f"{self.statusBar().currentMessage()} - {note}")
+
+    def _read_clipboard(self, callback):
+        """클립보드를 읽어 callback(read id, ClipboardContent 또는 None, 오류 메시지)을 메인 스레드에서 호출.
+
+        xclip 등으로 작업 스레드에서 읽는다. 읽을 도구가 없으면 UI 스레드를 막는 Qt 읽기 대신
+        오류 메시지를 전달한다. Returns: read id
+        """
+        self._clipboard_read_id += 1
+        read_id = self._clipboard_read_id
+        max_chars = updater.get_setting("clipboard_max_chars", CLIPBOARD_MAX_CHARS)
+        self._clipboard_reads[read_id] = callback
+        thread = threading.Thread(target=self._clipboard_worker, args=(read_id, max_chars))
+        thread.daemon = True
+        thread.start()
+        return read_id
+
+    def _clipboard_worker(self, read_id, max_chars):
+        try:
+            content, error = clipboard.read(max_chars, CLIPBOARD_TIMEOUT), ""
+        except clipboard.ClipboardError as e:
+            content, error = None, str(e)
+        self.signal_emitter.clipboard_read.emit(read_id, content, error)
+
+    def _on_clipboard_read(self, read_id, content, error):
+        callback = self._clipboard_reads.pop(read_id, None)
+        if callback is not None:
+            callback(read_id, content, error)
 
     def _detect_language(self, text):
-        """텍스트 언어 감지 (간단한 휴리스틱)"""
-        if any('\uac00' <= c <= '\ud7a3' for c in text):
-            self.src_lang_combo.setCurrentText("한국어")
-            self.tgt_lang_combo.setCurrentText("영어")
-        elif any('\u3040' <= c <= '\u30ff' for c in text):
-            self.src_lang_combo.setCurrentText("일본어")
-            self.tgt_lang_combo.setCurrentText("한국어")
-        elif any('\u4e00' <= c <= '\u9fff' for c in text):
-            self.src_lang_combo.setCurrentText("중국어 (간체)")
-            self.tgt_lang_combo.setCurrentText("한국어")
-        else:
-            self.src_lang_combo.setCurrentText("영어")
-            self.tgt_lang_combo.setCurrentText("한국어")
+        """텍스트 언어 감지 후 원본/대상 언어 콤보 설정"""
+        src_name, tgt_name = self._guess_languages(text)
+        self.src_lang_combo.setCurrentText(src_name)
+        self.tgt_lang_combo.setCurrentText(tgt_name)
+
+    @staticmethod
+    def _guess_languages(text):
+        """감지한 원본 언어와 대상 언어의 콤보 표시 이름"""
+        language = detector.detect(text).language
+        names = {code: name for name, code in LANGUAGES.items()}
+        return names[language], "영어" if language == "Korean" else "한국어"
+
+    def current_model(self):
+        """선택된 모델 id (소켓 번역 요청의 기본 모델)"""
+        return ALL_MODELS[self.model_combo.currentText()]
 
     def do_translate(self):
+        trace = self._pending_trace or tracing.Trace("manual")
+        self._pending_trace = None
         src_text = self.src_text.toPlainText().strip()
         if not src_text:
             self.statusBar().showMessage("번역할 텍스트를 입력하세요")
@@ -373,49 +701,149 @@ class TranslatorWindow(QMainWindow):
         if not self._check_api_key(model):
             return
 
-        self.translate_btn.setEnabled(False)
+        # 진행 중인 이전 번역은 취소 (HTTP 응답 닫기 / CLI 프로세스 kill)
+        if self._cancel_token is not None:
+            self._cancel_token.cancel()
+            tracing.finish(self._trace, "cancelled")
+        self._cancel_token = translator.CancelToken()
+        spec = self._take_speculation(src_text, src_lang, tgt_lang, model)
+        trace.attrs.update(model=model, chars=len(src_text), speculative=spec is not None)
+        self._trace = trace
+        self._request_id += 1
+        self._request = {
+            "src_text": src_text,
+            "src_lang": self.src_lang_combo.currentText(),
+            "tgt_lang": self.tgt_lang_combo.currentText(),
+            "model": self.model_combo.currentText(),
+            "started": time.time(),
+            "speculative": spec is not None,
+        }
+
         self.statusBar().showMessage(f"번역 중... ({self.model_combo.currentText()})")
         self.tgt_text.clear()
 
         thread = threading.Thread(
             target=self._run_translation,
-            args=(src_text, src_lang, tgt_lang, model)
+            args=(self._request_id, self._cancel_token, src_text, src_lang, tgt_lang, model, trace, spec)
         )
         thread.daemon = True
         thread.start()
 
-    def _run_translation(self, text, src_lang, tgt_lang, model):
+    def _run_translation(self, request_id, cancel, text, src_lang, tgt_lang, model, trace, spec=None):
+        trace.mark("thread_start")
         try:
-            result = translate(text, src_lang, tgt_lang, model)
-            self.signal_emitter.translation_done.emit(result)
+            on_partial = None
+            if translator.supports_streaming(model):
+                on_partial = lambda chunk: self.signal_emitter.translation_partial.emit(request_id, chunk)
+            on_progress = lambda done, total: self.signal_emitter.translation_progress.emit(request_id, done, total)
+            with tracing.activate(trace):
+                if spec is not None:
+                    # 첫 번째 복사 입력에서 미리 시작한 같은 번역을 이어받는다
+                    result, cached = spec.claim(on_partial, cancel)
+                else:
+                    result, cached = translate_cached(text, src_lang, tgt_lang, model, on_partial, cancel, on_progress)
+            trace.mark("translate")
+            trace.attrs["cached"] = cached
+            self.signal_emitter.translation_done.emit(request_id, result, cached)
+        except TranslationCancelled:
+            pass
         except TranslationError as e:
-            self.signal_emitter.translation_error.emit(str(e))
+            self.signal_emitter.translation_error.emit(request_id, str(e))
         except Exception as e:
-            self.signal_emitter.translation_error.emit(str(e))
+            self.signal_emitter.translation_error.emit(request_id, str(e))
 
-    def _on_translation_done(self, translation):
+    def _on_translation_partial(self, request_id, chunk):
+        if request_id != self._request_id:
+            return
+        cursor = self.tgt_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        self._trace.mark("first_render", once=True)
+
+    def _on_translation_progress(self, request_id, done, total):
+        if request_id != self._request_id:
+            return
+        self.statusBar().showMessage(f"번역 중... ({self._request['model']}, {done}/{total} 조각)")
+
+    def _on_translation_done(self, request_id, translation, cached):
+        if request_id != self._request_id:
+            return
+        trace = self._trace
+        trace.mark("result_signal")
+        self._cancel_token = None
         self._suppress_auto_translate = True
-        self.tgt_text.setText(translation)
+        # 스트리밍으로 이미 같은 내용이 그려졌으면 다시 그리지 않는다
+        if self.tgt_text.toPlainText() != translation:
+            self.tgt_text.setText(translation)
         self._suppress_auto_translate = False
-        self.translate_btn.setEnabled(True)
-        self.statusBar().showMessage("번역 완료")
+        trace.mark("render")
+        stats = translator.cache.stats()
+        source = "캐시" if cached else "미리 번역" if self._request["speculative"] else "새 번역"
+        race = trace.attrs.get("race")
+        if not cached and race:
+            source = f"{race['winner']} 승, {race['elapsed']:.1f}초"
+        route = translator.route_log[-1] if translator.route_log else None
+        if not cached and route and route["time"] >= self._request["started"]:
+            names = {model: name for name, model in ALL_MODELS.items()}
+            reason = "할당량 초과로" if route["kind"] == "quota" else "백엔드 장애로"
+            source = f"{reason} {names.get(route['fallback'], route['fallback'])} 사용"
+        message = f"번역 완료 ({source}) - 캐시 적중 {stats['hits']} / 미스 {stats['misses']}"
+        if self._request.get("note"):
+            message += f" - {self._request['note']}"
+        warning = translator.quota_warning(ALL_MODELS[self._request["model"]])
+        if warning:
+            message += f" - 경고: {warning}"
+        self.statusBar().showMessage(message)
+
+        request = self._request
+        if request and translation:
+            summary = {
+                "preview": request["src_text"][:HISTORY_PREVIEW_LENGTH],
+                "truncated": len(request["src_text"]) > HISTORY_PREVIEW_LENGTH,
+                "model": request["model"],
+                "tgt_lang": request["tgt_lang"],
+                "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+            def _on_saved(entry_id):
+                if entry_id is None:
+                    trace.attrs["error"] = "기록 저장 실패"
+                    self._finish_trace(trace, "history", "error")
+                    return
+                self.signal_emitter.history_added.emit(dict(summary, id=entry_id))
+                self._finish_trace(trace, "history")
 
-        src_text = self.src_text.toPlainText().strip()
-        if src_text and translation:
             history.add_entry(
-                src_text,
+                request["src_text"],
                 translation,
-                self.src_lang_combo.currentText(),
-                self.tgt_lang_combo.currentText(),
-                self.model_combo.currentText(),
+                request["src_lang"],
+                request["tgt_lang"],
+                request["model"],
+                on_done=_on_saved,
             )
-            if self.history_panel.isVisible():
-                self._load_history()
+        else:
+            self._finish_trace(trace)
 
-    def _on_translation_error(self, error):
+    def _on_translation_error(self, request_id, error):
+        if request_id != self._request_id:
+            return
+        self._cancel_token = None
         self.tgt_text.setText(f"오류: {error}")
-        self.translate_btn.setEnabled(True)
         self.statusBar().showMessage("번역 실패")
+        self._trace.attrs["error"] = error
+        self._finish_trace(self._trace, "render", "error")
+
+    def _finish_trace(self, trace, stage=None, status="ok"):
+        """마지막 단계를 기록하고 trace를 끝낸다 (기록 저장 스레드에서도 호출됨)"""
+        if stage:
+            trace.mark(stage)
+        if tracing.finish(trace, status):
+            self.signal_emitter.trace_finished.emit(trace)
+
+    def _on_trace_finished(self, trace):
+        # 더 새로운 요청이 시작됐으면 그 요청이 끝날 때 갱신
+        if trace is self._trace:
+            self.statusBar().setToolTip(trace.summary())
 
     # ── 설정 ──────────────────────────────────────────────
 
@@ -432,19 +860,52 @@ class TranslatorWindow(QMainWindow):
             f"<code>export GEMINI_API_KEY=\"your-key\"</code><br>"
             f"<code>export DEEPL_API_KEY=\"your-key\"</code><br><br>"
             f"설정 후 앱을 재시작하세요."
+            f"{self._breaker_status_html()}"
+            f"{self._speculation_status_html()}"
+            f"{self._hotkey_status_html()}"
         )
         dialog.exec_()
 
+    @staticmethod
+    def _breaker_status_html():
+        """서킷 브레이커가 닫혀 있지 않은 백엔드 상태 (모두 정상이면 빈 문자열)"""
+        lines = []
+        for name, state in translator.breaker_states().items():
+            if state["state"] == "closed":
+                continue
+            label = "차단됨" if state["state"] == "open" else "시험 중"
+            lines.append(f"{name}: {label} (연속 실패 {state['failures']}회, {state['retry_in']:.0f}초 후 재시도)")
+        return "<br><br><b>백엔드 상태</b><br>" + "<br>".join(lines) if lines else ""
+
+    @staticmethod
+    def _speculation_status_html():
+        """미리 번역 적중률과 쓰지 않고 버린 요청 수 (시작한 적이 없으면 빈 문자열)"""
+        stats = speculation.stats()
+        if not stats["started"]:
+            return ""
+        return (f"<br><br><b>미리 번역</b><br>"
+                f"시작 {stats['started']}회, 적중 {stats['hits']}회 ({stats['hit_rate']:.0%}), "
+                f"다른 내용 {stats['misses']}회, 만료 {stats['expired']}회, 버린 요청 {stats['wasted']}회")
+
+    def _hotkey_status_html(self):
+        """단축키 리스너가 처리한 키 이벤트 수와 이벤트당 평균 처리 시간"""
+        stats = self.hotkey_listener.stats()
+        if not stats["events"]:
+            return ""
+        return (f"<br><br><b>단축키 감지</b><br>"
+                f"키 이벤트 {stats['events']:,}개, 평균 {stats['per_event_us']:.1f}µs")
+
     def _check_api_key(self, model):
         """API 모델 선택 시 환경변수에 키가 없으면 안내 다이얼로그를 표시."""
-        if model in GEMINI_API_MODELS.values() and not os.environ.get("GEMINI_API_KEY"):
-            self.statusBar().showMessage("GEMINI_API_KEY 환경변수가 필요합니다")
-            EnvGuideDialog("GEMINI_API_KEY", self).exec_()
-            return False
-        if model in DEEPL_API_MODELS.values() and not os.environ.get("DEEPL_API_KEY"):
-            self.statusBar().showMessage("DEEPL_API_KEY 환경변수가 필요합니다")
-            EnvGuideDialog("DEEPL_API_KEY", self).exec_()
-            return False
+        for member in translator.member_models(model):
+            if member in GEMINI_API_MODELS.values() and not os.environ.get("GEMINI_API_KEY"):
+                self.statusBar().showMessage("GEMINI_API_KEY 환경변수가 필요합니다")
+                EnvGuideDialog("GEMINI_API_KEY", self).exec_()
+                return False
+            if member in DEEPL_API_MODELS.values() and not os.environ.get("DEEPL_API_KEY"):
+                self.statusBar().showMessage("DEEPL_API_KEY 환경변수가 필요합니다")
+                EnvGuideDialog("DEEPL_API_KEY", self).exec_()
+                return False
         return True
 
     # ── 히스토리 ─────────────────────────────────────────────
@@ -459,21 +920,14 @@ class TranslatorWindow(QMainWindow):
             self.outer_splitter.setSizes(SPLITTER_HISTORY_OPEN)
 
     def _load_history(self):
-        search = self.history_search.text().strip()
-        entries = history.get_entries(search)
-        self.history_list.clear()
-        for entry in entries:
-            preview = entry["src_text"][:HISTORY_PREVIEW_LENGTH].replace("\n", " ")
-            if len(entry["src_text"]) > HISTORY_PREVIEW_LENGTH:
-                preview += "…"
-            time_str = self._format_time(entry["created_at"])
-            label = f"{preview}\n{entry['model']} | {entry['tgt_lang']} | {time_str}"
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, entry)
-            self.history_list.addItem(item)
-
-    def _on_history_item_clicked(self, item):
-        entry = item.data(Qt.UserRole)
+        self.history_model.reset(self.history_search.text().strip())
+
+    def _on_history_item_clicked(self, index):
+        entry = history.get_entry(index.data(Qt.UserRole))
+        if entry is None:
+            self.history_model.remove(index.row())
+            self.statusBar().showMessage("기록을 찾을 수 없습니다")
+            return
         self._suppress_auto_translate = True
         self.src_text.setText(entry["src_text"])
         self._suppress_auto_translate = False
@@ -490,34 +944,38 @@ class TranslatorWindow(QMainWindow):
             self.tgt_lang_combo.setCurrentIndex(idx)
         self.statusBar().showMessage("기록에서 복원됨")
 
+    def _on_history_added(self, entry):
+        # 검색 결과에는 순위가 있으므로 검색 중이 아닐 때만 맨 위에 끼워 넣는다
+        if self.history_panel.isVisible() and not self.history_model.searching:
+            self.history_model.prepend(entry)
+
     def _on_history_search(self):
         self._load_history()
+        search = self.history_search.text().strip()
+        if history.ready() and history.recent_only(search):
+            self.statusBar().showMessage(
+                f"최근 {HISTORY_SHORT_SEARCH_WINDOW:,}개 기록에서만 검색했습니다 (전체 검색은 3글자 이상)"
+            )
 
     def _on_history_context_menu(self, pos):
-        item = self.history_list.itemAt(pos)
-        if not item:
+        index = self.history_list.indexAt(pos)
+        if not index.isValid():
             return
         menu = QMenu(self)
         delete_action = menu.addAction("삭제")
         action = menu.exec_(self.history_list.mapToGlobal(pos))
         if action == delete_action:
-            entry = item.data(Qt.UserRole)
-            history.delete_entry(entry["id"])
-            self._load_history()
+            history.delete_entry(index.data(Qt.UserRole))
+            self.history_model.remove(index.row())
 
     def _delete_all_history(self):
-        history.delete_all()
-        self.history_list.clear()
-        self.statusBar().showMessage("모든 기록이 삭제되었습니다")
+        # 쓰기 스레드가 커밋한 뒤 목록을 다시 불러온다
+        history.delete_all(on_done=lambda deleted: self.signal_emitter.history_cleared.emit(deleted is not None))
+        self.statusBar().showMessage("기록 삭제 중...")
 
-    @staticmethod
-    def _format_time(timestamp):
-        from datetime import datetime
-        try:
-            dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-            return dt.strftime("%m/%d %H:%M")
-        except (ValueError, TypeError):
-            return timestamp or ""
+    def _on_history_cleared(self, ok):
+        self._load_history()
+        self.statusBar().showMessage("모든 기록이 삭제되었습니다" if ok else "기록을 삭제하지 못했습니다")
 
     # ── 자동 업데이트 ────────────────────────────────────────
 
@@ -632,5 +1090,8 @@ class TranslatorWindow(QMainWindow):
             )
             return
         self.hotkey_listener.stop()
+        translator.close_sessions()
+        translator.shutdown_cli_workers()
+        history.close()
         self.tray_icon.hide()
         QApplication.quit()